@@ -0,0 +1,195 @@
+import os
+import re
+import hashlib
+import argparse
+import functools
+import urllib.request
+from dataclasses import dataclass
+from typing import Dict, Optional, Tuple
+
+from tailwind_subset import OUTPUT_PATH as TAILWIND_SUBSET_PATH, TAILWIND_CDN_URL
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+# Streamlit 정적 파일 서빙(server.enableStaticServing) 대상 디렉터리
+VENDOR_DIR = os.path.join(BASE_DIR, "static", "vendor")
+# iframe(srcdoc)은 부모 페이지 URL을 기준으로 상대 경로를 해석하므로 baseUrlPath가 있어도 동작함
+STATIC_URL_PREFIX = "app/static/vendor"
+TAILWIND_SUBSET_URL = "app/static/css/tailwind-subset.css"
+
+ASSET_MODES = ("cdn", "static", "inline")
+
+
+@dataclass(frozen=True)
+class VendorAsset:
+    """생성기 템플릿이 CDN에서 불러오는 외부 라이브러리 하나"""
+    cdn_url: str        # 템플릿에 적혀 있는 그대로의 URL
+    download_url: str   # 버전이 고정된 다운로드 URL
+    filename: str       # static/vendor 아래 저장될 파일 이름
+
+
+# 템플릿에서 사용하는 모든 CDN 스크립트 (버전이 없는 URL은 다운로드 시점 버전으로 고정)
+# Tailwind CDN(브라우저 JIT)은 벤더링하지 않고 tailwind_subset.py 로 미리 만든 CSS로 대체
+VENDOR_ASSETS: Tuple[VendorAsset, ...] = (
+    VendorAsset(
+        "https://cdn.jsdelivr.net/npm/chart.js@3.7.0/dist/chart.min.js",
+        "https://cdn.jsdelivr.net/npm/chart.js@3.7.0/dist/chart.min.js",
+        "chart-3.7.0.min.js",
+    ),
+    VendorAsset(
+        "https://cdn.jsdelivr.net/npm/chart.js@3.7.1/dist/chart.min.js",
+        "https://cdn.jsdelivr.net/npm/chart.js@3.7.1/dist/chart.min.js",
+        "chart-3.7.1.min.js",
+    ),
+    VendorAsset(
+        "https://cdn.jsdelivr.net/npm/chart.js",
+        "https://cdn.jsdelivr.net/npm/chart.js@4.4.1/dist/chart.umd.min.js",
+        "chart-4.4.1.umd.min.js",
+    ),
+    VendorAsset(
+        "https://cdn.jsdelivr.net/npm/chartjs-plugin-datalabels@2.0.0",
+        "https://cdn.jsdelivr.net/npm/chartjs-plugin-datalabels@2.0.0/dist/chartjs-plugin-datalabels.min.js",
+        "chartjs-plugin-datalabels-2.0.0.min.js",
+    ),
+    VendorAsset(
+        "https://cdn.jsdelivr.net/npm/chartjs-plugin-annotation",
+        "https://cdn.jsdelivr.net/npm/chartjs-plugin-annotation@3.0.1/dist/chartjs-plugin-annotation.min.js",
+        "chartjs-plugin-annotation-3.0.1.min.js",
+    ),
+)
+
+_ASSETS_BY_URL: Dict[str, VendorAsset] = {asset.cdn_url: asset for asset in VENDOR_ASSETS}
+_SCRIPT_TAG = re.compile(r'<script src="(https://[^"]+)"></script>')
+
+
+def vendor_path(asset: VendorAsset) -> str:
+    """벤더링된 파일의 로컬 경로 반환"""
+    return os.path.join(VENDOR_DIR, asset.filename)
+
+
+def is_vendored(asset: VendorAsset) -> bool:
+    """로컬에 파일이 있는지 여부"""
+    return os.path.isfile(vendor_path(asset))
+
+
+@functools.lru_cache(maxsize=None)
+def _read_asset(path: str, mtime_ns: int) -> Tuple[str, str]:
+    """파일 내용과 내용 해시(캐시 무효화용 버전 문자열) 반환 - 파일이 바뀌면 mtime으로 다시 읽음"""
+    with open(path, "rb") as f:
+        content = f.read()
+    return content.decode("utf-8"), hashlib.sha256(content).hexdigest()[:12]
+
+
+def _asset_content(asset: VendorAsset) -> Tuple[str, str]:
+    path = vendor_path(asset)
+    return _read_asset(path, os.stat(path).st_mtime_ns)
+
+
+def asset_for_url(url: str) -> Optional[VendorAsset]:
+    """템플릿의 CDN URL에 해당하는 벤더링 자산 (목록에 없으면 None)"""
+    return _ASSETS_BY_URL.get(url)
+
+
+def has_tailwind_subset() -> bool:
+    """미리 생성된 Tailwind 부분집합 CSS가 있는지 여부"""
+    return os.path.isfile(TAILWIND_SUBSET_PATH)
+
+
+def static_url(asset: VendorAsset) -> str:
+    """내용 해시가 붙은(브라우저 캐시 친화적인) 정적 파일 URL 반환"""
+    _, version = _asset_content(asset)
+    return f"{STATIC_URL_PREFIX}/{asset.filename}?v={version}"
+
+
+def default_mode() -> str:
+    """로컬 자산(벤더링 파일 또는 Tailwind CSS)이 하나라도 있으면 'static', 아니면 'cdn' 반환"""
+    if has_tailwind_subset() or any(is_vendored(asset) for asset in VENDOR_ASSETS):
+        return "static"
+    return "cdn"
+
+
+def localize_html(html: str, mode: Optional[str] = None) -> str:
+    """
+    생성된 HTML의 CDN 스크립트 태그를 로컬 자산으로 교체
+
+    Args:
+        html: 생성기가 만든 HTML
+        mode: 'cdn' (변경 없음), 'static' (Streamlit 정적 URL), 'inline' (스크립트 내용을 직접 삽입)
+              None이면 default_mode() 사용
+
+    Returns:
+        str: 자산 참조가 교체된 HTML (벤더링되지 않은 자산은 CDN URL 유지)
+    """
+    mode = mode or default_mode()
+    if mode not in ASSET_MODES:
+        raise ValueError(f"지원하지 않는 자산 모드: {mode}")
+    if mode == "cdn":
+        return html
+    return _localize(html, mode)
+
+
+@functools.lru_cache(maxsize=64)
+def _localize(html: str, mode: str) -> str:
+    """localize_html의 캐시된 구현 - 같은 HTML 문자열은 한 번만 변환"""
+    def replace(match):
+        if match.group(1) == TAILWIND_CDN_URL and has_tailwind_subset():
+            css, version = _read_asset(TAILWIND_SUBSET_PATH, os.stat(TAILWIND_SUBSET_PATH).st_mtime_ns)
+            if mode == "static":
+                return f'<link rel="stylesheet" href="{TAILWIND_SUBSET_URL}?v={version}">'
+            return f"<style>{css}</style>"
+        asset = _ASSETS_BY_URL.get(match.group(1))
+        if asset is None or not is_vendored(asset):
+            return match.group(0)
+        if mode == "static":
+            return f'<script src="{static_url(asset)}"></script>'
+        content, _ = _asset_content(asset)
+        # 스크립트 내용 안의 닫는 태그가 HTML 파서를 끊지 않도록 이스케이프
+        return "<script>" + content.replace("</script", "<\\/script") + "</script>"
+
+    return _SCRIPT_TAG.sub(replace, html)
+
+
+def vendor_assets(force: bool = False) -> Dict[str, str]:
+    """
+    모든 CDN 자산을 static/vendor에 다운로드 (네트워크가 되는 환경에서 한 번 실행)
+
+    Args:
+        force: 이미 있는 파일도 다시 다운로드
+
+    Returns:
+        Dict[str, str]: 파일 이름 -> 상태 ('downloaded' 또는 'exists')
+    """
+    os.makedirs(VENDOR_DIR, exist_ok=True)
+    results = {}
+    for asset in VENDOR_ASSETS:
+        path = vendor_path(asset)
+        if os.path.isfile(path) and not force:
+            results[asset.filename] = "exists"
+            continue
+        with urllib.request.urlopen(asset.download_url, timeout=30) as response:
+            content = response.read()
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(content)
+        os.replace(tmp_path, path)
+        results[asset.filename] = "downloaded"
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="차트/CSS 라이브러리 벤더링 도구")
+    parser.add_argument("command", choices=["vendor", "status"], help="vendor: 다운로드, status: 현황 출력")
+    parser.add_argument("--force", action="store_true", help="이미 있는 파일도 다시 다운로드")
+    args = parser.parse_args()
+
+    if args.command == "vendor":
+        for filename, status in vendor_assets(force=args.force).items():
+            print(f"{filename}: {status}")
+    else:
+        for asset in VENDOR_ASSETS:
+            print(f"{asset.filename}: {'있음' if is_vendored(asset) else '없음'} ({asset.cdn_url})")
+        print(f"tailwind-subset.css: {'있음' if has_tailwind_subset() else '없음'} (python tailwind_subset.py 로 생성)")
+        print(f"기본 모드: {default_mode()}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+import os
+import math
+import hashlib
+import tempfile
+import threading
+from dataclasses import dataclass, astuple
+from typing import Dict, Sequence, Tuple
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+# 생성된 다이어그램 저장 위치 - 파일 이름이 내용 해시이므로 버전 관리 대상이 아님
+CACHE_DIR = os.path.join(BASE_DIR, "static", "images", "cache")
+
+IMAGE_FORMATS = ("png", "svg")
+
+
+@dataclass(frozen=True)
+class CycleStyle:
+    """순환 다이어그램 스타일 - 값이 바뀌면 캐시 키도 바뀜"""
+    figsize: float = 10.0       # 그림 크기 (인치, 정사각형)
+    dpi: int = 300              # PNG 해상도 (SVG에는 영향 없음)
+    radius: float = 0.4         # 원 반지름 (축 좌표)
+    sign_fontsize: int = 24     # 중앙 +/- 기호 크기
+    # 글꼴 후보 (설치된 것부터 글자별로 대체) - 기본 글꼴(DejaVu Sans)에는 한글이 없음
+    font_family: Tuple[str, ...] = ("Noto Sans CJK KR", "NanumGothic", "Malgun Gothic", "AppleGothic", "DejaVu Sans")
+
+
+DEFAULT_STYLE = CycleStyle()
+
+_locks: Dict[str, threading.Lock] = {}
+_locks_guard = threading.Lock()
+_rc_lock = threading.Lock()
+
+
+def cache_key(items: Sequence[str], is_negative: bool, style: CycleStyle = DEFAULT_STYLE, fmt: str = "png") -> str:
+    """항목 목록, 순환 종류, 스타일, 형식으로 계산한 내용 해시"""
+    digest = hashlib.blake2b(digest_size=12)
+    for part in (fmt, "negative" if is_negative else "positive", repr(astuple(style)), *items):
+        digest.update(part.encode("utf-8"))
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+def _draw(path: str, items: Sequence[str], is_negative: bool, style: CycleStyle, fmt: str) -> None:
+    """다이어그램을 path에 저장 - pyplot 전역 상태를 쓰지 않으므로 스레드에서 호출해도 안전
+    (전역 rcParams를 바꾸는 저장 단계만 _rc_lock으로 직렬화)"""
+    import matplotlib
+    from matplotlib.figure import Figure
+    from matplotlib.patches import Circle
+
+    color = 'red' if is_negative else 'blue'
+    fig = Figure(figsize=(style.figsize, style.figsize))
+    ax = fig.add_subplot()
+
+    # 원 그리기
+    ax.add_patch(Circle((0.5, 0.5), style.radius, fill=False, color=color))
+
+    # 항목들을 원형으로 배치
+    n = len(items)
+    for i, item in enumerate(items):
+        angle = 2 * math.pi * i / n
+        x = 0.5 + style.radius * math.cos(angle)
+        y = 0.5 + style.radius * math.sin(angle)
+        ax.text(x, y, item, ha='center', va='center', fontfamily=list(style.font_family),
+                bbox=dict(facecolor='white', alpha=0.7))
+
+    # 중앙에 +/- 기호 추가
+    ax.text(0.5, 0.5, '-' if is_negative else '+',
+            ha='center', va='center', color=color,
+            fontsize=style.sign_fontsize, fontweight='bold')
+
+    ax.axis('equal')
+    ax.axis('off')
+    # SVG는 글자를 경로 대신 텍스트로 저장 - 서버에 한글 글꼴이 없어도 브라우저 글꼴로 표시됨
+    with _rc_lock, matplotlib.rc_context({"svg.fonttype": "none"}):
+        fig.savefig(path, format=fmt, bbox_inches='tight', dpi=style.dpi)
+
+
+def cycle_image(items: Sequence[str], is_negative: bool, style: CycleStyle = DEFAULT_STYLE, fmt: str = "png") -> str:
+    """
+    순환 다이어그램 이미지 경로 반환 (없을 때만 생성)
+
+    같은 키를 동시에 요청하면 한 스레드만 그리고 나머지는 완성된 파일을 기다립니다.
+    파일은 임시 파일에 쓴 뒤 os.replace로 교체하므로 다른 세션/프로세스가
+    쓰다 만 파일을 읽는 일이 없습니다.
+
+    Args:
+        items: 원형으로 배치할 항목 목록
+        is_negative: True이면 부정적(빨간색, '-') 순환
+        style: 다이어그램 스타일
+        fmt: 'png' 또는 'svg' (SVG가 훨씬 작음)
+
+    Returns:
+        str: 캐시된 이미지 파일 경로
+    """
+    if fmt not in IMAGE_FORMATS:
+        raise ValueError(f"지원하지 않는 이미지 형식: {fmt}")
+    key = cache_key(items, is_negative, style, fmt)
+    path = os.path.join(CACHE_DIR, f"cycle-{key}.{fmt}")
+    if os.path.isfile(path):
+        return path
+
+    with _locks_guard:
+        lock = _locks.setdefault(key, threading.Lock())
+    with lock:
+        # 기다리는 동안 다른 스레드가 만들었을 수 있으므로 다시 확인
+        if os.path.isfile(path):
+            return path
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=CACHE_DIR, suffix=f".{fmt}.tmp")
+        os.close(fd)
+        try:
+            _draw(tmp_path, items, is_negative, style, fmt)
+            os.replace(tmp_path, path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+    return path
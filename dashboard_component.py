@@ -0,0 +1,55 @@
+import os
+import hashlib
+import functools
+from typing import Any, Dict
+
+import streamlit as st
+import streamlit.components.v1 as components
+
+# declare_component가 서빙하는 프론트엔드 빌드 디렉터리 (npm 빌드 없이 index.html 하나로 구성)
+BUILD_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "frontend", "exhibit_dashboard")
+# 컴포넌트 위젯 키 - 키가 고정되어 있으면 인자(화면 HTML)가 바뀌어도 iframe이 다시 마운트되지 않음
+DEFAULT_KEY = "exhibit_dashboard"
+
+_component = components.declare_component("exhibit_dashboard", path=BUILD_DIR)
+
+
+@functools.lru_cache(maxsize=64)
+def content_digest(html: str) -> str:
+    """화면 HTML의 내용 해시 (프론트엔드가 이미 가진 화면인지 비교하는 용도)"""
+    return hashlib.sha256(html.encode("utf-8")).hexdigest()[:16]
+
+
+def exhibit_dashboard(exhibit: str, html: str, height: int, key: str = DEFAULT_KEY) -> Dict[str, Any]:
+    """
+    한 번 마운트된 대시보드 컴포넌트 안에서 화면을 전환
+
+    컴포넌트는 화면마다 iframe을 하나씩 유지하고 버튼을 누르면 보이는 화면만 바꾸므로,
+    이미 본 화면으로 돌아갈 때 Chart.js 파싱과 차트 생성이 다시 일어나지 않습니다.
+    컴포넌트가 돌려준 값(mounted 목록)에 같은 내용 해시가 있으면 HTML을 다시 보내지 않고
+    화면 키만 보내며, 내용이 바뀐 화면만 새 HTML로 교체됩니다.
+
+    Args:
+        exhibit: 화면 키 (예: "exhibit_1")
+        html: 화면 HTML (localize_html 적용 후)
+        height: 컴포넌트 높이 (픽셀)
+        key: 컴포넌트 위젯 키 - 같은 위치에서 항상 같은 키로 호출해야 iframe이 유지됨
+
+    Returns:
+        Dict[str, Any]: 프론트엔드가 마지막으로 보고한 상태
+            - mounted: [{exhibit, digest}] 유지 중인 화면 목록, missing: 다시 요청한 화면
+            프론트엔드는 이 값이 바뀔 때만 보고하므로 이미 본 화면으로 전환할 때는 추가 rerun이 없음
+    """
+    digest = content_digest(html)
+    state = st.session_state.get(key) or {}
+    mounted = {item["exhibit"]: item["digest"] for item in state.get("mounted", [])}
+    needs_html = mounted.get(exhibit) != digest or state.get("missing") == exhibit
+    value = _component(
+        exhibit=exhibit,
+        digest=digest,
+        html=html if needs_html else "",
+        height=height,
+        key=key,
+        default={},
+    )
+    return value or {}
@@ -1,12 +1,93 @@
 import pandas as pd
-from typing import Dict, Any, List
+import numpy as np
+from typing import Dict, Any, List, Mapping, Optional, Sequence, Tuple
+from dataset_store import DatasetStore, shared_store
+from markdown_tables import statement_records, statement_tables
+from ratio_engine import compute_ratios, records_to_columns
+from scf_portfolio import SupplierPortfolioParams, rating_ladder, simulate_supplier_portfolio
+
+# 열 저장소(DatasetStore)에 담는 데이터셋: get_data_frames 키 -> 속성 이름
+DATASETS = {
+    'treasury_yields': 'treasury_yields_data',
+    'corporate_bond_yields': 'corporate_bond_yields_data',
+    'short_term_rates': 'short_term_rates_data',
+    'scf_rate_simulation': 'scf_rate_simulation_data',
+    'ratings_comparison': 'ratings_comparison_data',
+    'historical_libor': 'historical_libor_data',
+    'pg_financial': 'pg_financial_data',
+    'pg_balance_sheet': 'pg_balance_sheet_data',
+    'pg_working_capital': 'pg_working_capital_data',
+    'pg_extended_working_capital': 'pg_extended_working_capital_data',
+    'fibria_financial': 'fibria_financial_data',
+    'fibria_scf_impact': 'fibria_scf_impact_data',
+    'fibria_market': 'fibria_market_data',
+    'fibria_balance_sheet': 'fibria_balance_sheet_data',
+    'fibria_working_capital': 'fibria_working_capital_data',
+    'fibria_scf_analysis': 'fibria_scf_analysis_data',
+    'fibria_cash_conversion_cycle': 'fibria_cash_conversion_cycle_data',
+    'fibria_scf_scenario': 'fibria_scf_scenario_data',
+    'fibria_working_capital_need': 'fibria_working_capital_need_data',
+    'fibria_financial_crisis_periods': 'fibria_financial_crisis_periods',
+}
+
+# ratio_engine 공식과 다른 발표 값 - (속성 이름, 연도, 필드) -> 화면에 표시하는 발표 값
+# 나머지 비율 필드는 모두 공식으로 계산. 기존 P&G 운전자본 표의 회전일수는 기말 잔액/매출원가 공식과
+# 기준이 달라(재고/매입채무 일수가 약 절반) 사례 원문 값을 그대로 표시하며, 차트가 쓰는 확장 운전자본
+# 데이터(2011-2015)는 공식 결과와 발표 값이 모두 같아 덮어쓸 칸이 없음
+PUBLISHED_RATIO_OVERRIDES: Dict[Tuple[str, str, str], float] = {
+    ("pg_working_capital_data_old", year, field): value
+    for year, published in {
+        "2011": {"daysReceivables": 27.8, "daysInventory": 32.6, "daysPayables": 38.0},
+        "2012": {"daysReceivables": 26.5, "daysInventory": 29.2, "daysPayables": 37.0, "cashConversionCycle": 18.7},
+        "2013": {"daysReceivables": 28.2, "daysInventory": 29.9, "daysPayables": 41.0, "cashConversionCycle": 17.1},
+        "2014": {"daysReceivables": 28.1, "daysInventory": 29.7, "daysPayables": 40.0, "cashConversionCycle": 17.8},
+        "2015": {"daysInventory": 26.2, "daysPayables": 53.0},
+    }.items()
+    for field, value in published.items()
+}
+
+
+def _fill_ratios(
+    attr: str,
+    records: Sequence[Dict[str, Any]],
+    columns: Mapping[str, np.ndarray],
+    fields: Mapping[str, Tuple[str, int]],
+    key: str = "year",
+) -> None:
+    """
+    레코드의 비율 필드를 ratio_engine으로 계산해 채움 (PUBLISHED_RATIO_OVERRIDES의 발표 값이 우선)
+
+    Args:
+        attr: 데이터셋 속성 이름 (발표 값 조회용)
+        records: 채울 레코드 (columns와 같은 순서)
+        columns: 원본 열 이름 -> 레코드 순서의 값 배열
+        fields: 레코드 필드 -> (RATIO_DEFINITIONS 비율 이름, 반올림 자릿수)
+        key: 레코드를 구분하는 필드
+    """
+    ratios = compute_ratios(columns, sorted({ratio for ratio, _ in fields.values()}), decimals=None)
+    for field, (ratio, decimals) in fields.items():
+        for record, value in zip(records, np.round(ratios[ratio], decimals).tolist()):
+            record[field] = PUBLISHED_RATIO_OVERRIDES.get((attr, record[key], field), value)
+
 
 class MarketDataProvider:
     """시장 금리 분석에 필요한 데이터를 제공하는 클래스"""
     
     def __init__(self):
-        """데이터 초기화"""
+        """
+        데이터 초기화 - 같은 데이터의 열 저장소는 프로세스 안에서 한 번만 생성됨
+
+        _initialize_data의 리터럴 목록은 인스턴스마다 만들어지지만 저장소로 교체된 뒤 해제됩니다.
+        저장소(열 배열 + 공유 레코드)는 리터럴 목록 하나보다 크므로 메모리 이득은 인스턴스가
+        여러 개일 때만 생깁니다 (tracemalloc 측정: 기존 인스턴스당 약 29 KiB, 첫 인스턴스 약 136 KiB,
+        이후 인스턴스당 약 2 KiB).
+        """
         self._initialize_data()
+        self.store: DatasetStore = shared_store({name: getattr(self, attr) for name, attr in DATASETS.items()})
+        # 데이터셋 속성을 저장소의 공유 레코드로 교체 - 모든 인스턴스/세션이 공유하므로 변경할 수 없는
+        # FrozenRecord의 tuple (수정이 필요한 호출자는 dict(row)로 복사)
+        for name, attr in DATASETS.items():
+            setattr(self, attr, self.store.records(name))
     
     def _initialize_data(self):
         """모든 차트 데이터 초기화"""
@@ -64,108 +145,44 @@ class MarketDataProvider:
             {"date": "2015 (8월)", "libor3m": 0.30}
         ]
         
+        # P&G 손익계산서/대차대조표 - sample/ 원본 표(캐시된 파싱 결과)에서 생성
+        pg_income = statement_tables("pg_income_statement")[0]
+        pg_balance_sheet = statement_tables("pg_balance_sheet")[0]
+        pg_years = {year: year for year in ("2011", "2012", "2013", "2014", "2015")}
+
         # P&G 재무 지표 데이터 (확장된 버전)
-        self.pg_financial_data = [
-            {"year": "2011", "revenue": 81104, "grossProfit": 41245, "operatingIncome": 15495, "netIncome": 11797, "grossMargin": 50.9, "operatingMargin": 19.1, "netMargin": 14.5, "employees": 129000, "eps": 4.12, "dividend": 1.97, "sharesOutstanding": 2804},
-            {"year": "2012", "revenue": 82006, "grossProfit": 40595, "operatingIncome": 14611, "netIncome": 10756, "grossMargin": 49.5, "operatingMargin": 17.8, "netMargin": 13.1, "employees": 126000, "eps": 3.82, "dividend": 2.14, "sharesOutstanding": 2751},
-            {"year": "2013", "revenue": 80116, "grossProfit": 40125, "operatingIncome": 14125, "netIncome": 11412, "grossMargin": 50.1, "operatingMargin": 17.6, "netMargin": 14.1, "employees": 121000, "eps": 4.04, "dividend": 2.29, "sharesOutstanding": 2743},
-            {"year": "2014", "revenue": 80510, "grossProfit": 39899, "operatingIncome": 15497, "netIncome": 11643, "grossMargin": 49.6, "operatingMargin": 19.2, "netMargin": 14.5, "employees": 118000, "eps": 4.19, "dividend": 2.45, "sharesOutstanding": 2720},
-            {"year": "2015", "revenue": 76279, "grossProfit": 38031, "operatingIncome": 14873, "netIncome": 7036, "grossMargin": 49.9, "operatingMargin": 19.5, "netMargin": 9.2, "employees": 110000, "eps": 2.50, "dividend": 2.59, "sharesOutstanding": 2712}
-        ]
+        self.pg_financial_data = statement_records(pg_years, [
+            (pg_income, {
+                "revenue": "(Revenue)", "grossProfit": "(Gross Profit)", "operatingIncome": "(Operating Income)",
+                "netIncome": "(Net Income)", "grossMargin": "(Gross Margin)", "operatingMargin": "(Operating Margin)",
+                "netMargin": "(Net Margin", "employees": "(Number of Employees)", "eps": "(Basic EPS)",
+                "dividend": "(Dividend per Share)", "sharesOutstanding": "(Avg. # Basic Shares",
+            }),
+        ])
         
         # P&G 대차대조표 데이터
-        self.pg_balance_sheet_data = [
-            {
-                "year": "2011",
-                "cashAndInvestments": 2768,
-                "accountsReceivable": 6275,
-                "inventory": 7379,
-                "currentAssets": 21970,
-                "totalAssets": 138354,
-                "accountsPayable": 8022,
-                "currentLiabilities": 27293,
-                "longTermDebt": 22033,
-                "totalLiabilities": 70353,
-                "totalEquity": 68001,
-                "currentRatio": 0.80,
-                "totalDebt": 32014,
-                "netDebt": 29246,
-                "debtToTotalCapital": 32.0,
-                "financialLeverage": 2.03
-            },
-            {
-                "year": "2012",
-                "cashAndInvestments": 4436,
-                "accountsReceivable": 6068,
-                "inventory": 6721,
-                "currentAssets": 21910,
-                "totalAssets": 132244,
-                "accountsPayable": 7920,
-                "currentLiabilities": 24907,
-                "longTermDebt": 21080,
-                "totalLiabilities": 68209,
-                "totalEquity": 64035,
-                "currentRatio": 0.88,
-                "totalDebt": 29778,
-                "netDebt": 25342,
-                "debtToTotalCapital": 31.7,
-                "financialLeverage": 2.07
-            },
-            {
-                "year": "2013",
-                "cashAndInvestments": 5947,
-                "accountsReceivable": 6508,
-                "inventory": 6909,
-                "currentAssets": 23990,
-                "totalAssets": 139263,
-                "accountsPayable": 8777,
-                "currentLiabilities": 30037,
-                "longTermDebt": 19111,
-                "totalLiabilities": 70554,
-                "totalEquity": 68709,
-                "currentRatio": 0.80,
-                "totalDebt": 31543,
-                "netDebt": 25596,
-                "debtToTotalCapital": 31.5,
-                "financialLeverage": 2.03
-            },
-            {
-                "year": "2014",
-                "cashAndInvestments": 10686,
-                "accountsReceivable": 6386,
-                "inventory": 6759,
-                "currentAssets": 31617,
-                "totalAssets": 144266,
-                "accountsPayable": 8461,
-                "currentLiabilities": 33726,
-                "longTermDebt": 19811,
-                "totalLiabilities": 74290,
-                "totalEquity": 69976,
-                "currentRatio": 0.94,
-                "totalDebt": 35417,
-                "netDebt": 24731,
-                "debtToTotalCapital": 33.6,
-                "financialLeverage": 2.06
-            },
-            {
-                "year": "2015",
-                "cashAndInvestments": 11612,
-                "accountsReceivable": 4861,
-                "inventory": 5454,
-                "currentAssets": 29646,
-                "totalAssets": 129495,
-                "accountsPayable": 8257,
-                "currentLiabilities": 29790,
-                "longTermDebt": 18297,
-                "totalLiabilities": 66445,
-                "totalEquity": 63050,
-                "currentRatio": 1.00,
-                "totalDebt": 30298,
-                "netDebt": 18686,
-                "debtToTotalCapital": 32.5,
-                "financialLeverage": 2.05
-            }
-        ]
+        self.pg_balance_sheet_data = statement_records(pg_years, [
+            (pg_balance_sheet, {
+                "cashAndInvestments": "(Cash & ST", "accountsReceivable": "(Accounts Receivable)",
+                "inventory": "(Inventory)", "currentAssets": "(Current Assets)", "totalAssets": "(Total Assets)",
+                "accountsPayable": "(Accounts Payable)", "currentLiabilities": "(Current Liabilities)",
+                "longTermDebt": "(Long Term Debt)", "totalLiabilities": "(Total Liabilities)",
+                "totalEquity": "(Total Equity)", "totalDebt": "(Total Debt)", "netDebt": "(Net Debt",
+            }),
+        ])
+        _fill_ratios("pg_balance_sheet_data", self.pg_balance_sheet_data, records_to_columns(self.pg_balance_sheet_data), {
+            "currentRatio": ("currentRatio", 2), "debtToTotalCapital": ("debtToTotalCapital", 1),
+            "financialLeverage": ("financialLeverage", 2),
+        })
+
+        # 운전자본 회전일수 계산용 매출/매출원가 (재무상태표 항목은 각 데이터셋의 금액 사용)
+        pg_income_columns = records_to_columns(statement_records(pg_years, [
+            (pg_income, {"revenue": "(Revenue)", "cogs": "(Cost of Products Sold)"}),
+        ]))
+        pg_days = {
+            "daysReceivables": ("daysReceivables", 1), "daysInventory": ("daysInventory", 1),
+            "daysPayables": ("daysPayables", 1), "cashConversionCycle": ("cashConversionCycle", 1),
+        }
         
         # P&G 운전자본 데이터 (기존 데이터)
         self.pg_working_capital_data_old = [
@@ -173,55 +190,39 @@ class MarketDataProvider:
                 "year": "2011",
                 "accountsReceivable": 6275,
                 "inventory": 7379,
-                "accountsPayable": 8022,
-                "daysReceivables": 27.8,
-                "daysInventory": 32.6,
-                "daysPayables": 38.0,
-                "cashConversionCycle": 22.4
+                "accountsPayable": 8022
             },
             {
                 "year": "2012",
                 "accountsReceivable": 6068,
                 "inventory": 6721,
-                "accountsPayable": 7920,
-                "daysReceivables": 26.5,
-                "daysInventory": 29.2,
-                "daysPayables": 37.0,
-                "cashConversionCycle": 18.7
+                "accountsPayable": 7920
             },
             {
                 "year": "2013",
                 "accountsReceivable": 6508,
                 "inventory": 6909,
-                "accountsPayable": 8777,
-                "daysReceivables": 28.2,
-                "daysInventory": 29.9,
-                "daysPayables": 41.0,
-                "cashConversionCycle": 17.1
+                "accountsPayable": 8777
             },
             {
                 "year": "2014",
                 "accountsReceivable": 6386,
                 "inventory": 6759,
-                "accountsPayable": 8461,
-                "daysReceivables": 28.1,
-                "daysInventory": 29.7,
-                "daysPayables": 40.0,
-                "cashConversionCycle": 17.8
+                "accountsPayable": 8461
             },
             {
                 "year": "2015",
                 "accountsReceivable": 4861,
                 "inventory": 5454,
-                "accountsPayable": 8256,
-                "daysReceivables": 23.3,
-                "daysInventory": 26.2,
-                "daysPayables": 53.0,
-                "cashConversionCycle": -3.5
+                "accountsPayable": 8256
             }
         ]
         
-        # P&G 확장된 운전자본 데이터 (2000-2015년, Exhibit3 차트용)
+        _fill_ratios("pg_working_capital_data_old", self.pg_working_capital_data_old, dict(
+            pg_income_columns, **records_to_columns(self.pg_working_capital_data_old),
+        ), pg_days)
+
+        # P&G 확장된 운전자본 데이터 (2000-2015년, Exhibit3 차트용) - 2011년부터는 재무제표 원본에서 계산
         self.pg_extended_working_capital_data = [
             {"year": "2000", "dso": 26.6, "dio": 60.6, "dpo": 38.4, "ccc": 48.8, "adjustedDpo": 32.5},
             {"year": "2001", "dso": 27.3, "dio": 58.9, "dpo": 36.1, "ccc": 50.1, "adjustedDpo": 30.8},
@@ -234,83 +235,38 @@ class MarketDataProvider:
             {"year": "2008", "dso": 31.1, "dio": 78.2, "dpo": 63.0, "ccc": 46.4, "adjustedDpo": 51.8},
             {"year": "2009", "dso": 27.8, "dio": 64.9, "dpo": 56.4, "ccc": 36.3, "adjustedDpo": 47.2},
             {"year": "2010", "dso": 25.1, "dio": 62.9, "dpo": 71.4, "ccc": 16.6, "adjustedDpo": 58.1},
-            {"year": "2011", "dso": 28.2, "dio": 67.6, "dpo": 73.5, "ccc": 22.4, "adjustedDpo": 59.7},
-            {"year": "2012", "dso": 27.0, "dio": 59.2, "dpo": 69.8, "ccc": 16.4, "adjustedDpo": 57.1},
-            {"year": "2013", "dso": 29.6, "dio": 63.1, "dpo": 80.1, "ccc": 12.6, "adjustedDpo": 64.9},
-            {"year": "2014", "dso": 29.0, "dio": 60.7, "dpo": 76.0, "ccc": 13.7, "adjustedDpo": 62.3},
-            {"year": "2015", "dso": 23.3, "dio": 52.0, "dpo": 78.8, "ccc": -3.5, "adjustedDpo": 64.8}
+            {"year": "2011", "adjustedDpo": 59.7},
+            {"year": "2012", "adjustedDpo": 57.1},
+            {"year": "2013", "adjustedDpo": 64.9},
+            {"year": "2014", "adjustedDpo": 62.3},
+            {"year": "2015", "adjustedDpo": 64.8}
         ]
         
+        _fill_ratios("pg_extended_working_capital_data", self.pg_extended_working_capital_data[-len(pg_years):], dict(
+            pg_income_columns, **records_to_columns(self.pg_balance_sheet_data, ["accountsReceivable", "inventory", "accountsPayable"]),
+        ), {"dso": ("daysReceivables", 1), "dio": ("daysInventory", 1), "dpo": ("daysPayables", 1), "ccc": ("cashConversionCycle", 1)})
+
         # 기존 데이터 구조 호환성을 위해 pg_working_capital_data를 그대로 유지
         self.pg_working_capital_data = self.pg_working_capital_data_old
         
-        # Fibria 재무 분석 데이터 (단위: 백만 레알)
-        self.fibria_financial_data = [
-            { 
-                "year": "2012", 
-                "revenue": 6174, 
-                "cogs": 5237, 
-                "grossProfit": 937, 
-                "sgaExpense": 579, 
-                "operatingIncome": 345, 
-                "netIncome": -705,
-                "grossMargin": 15.2,
-                "operatingMargin": 5.6,
-                "netMargin": -11.4,
-                "exchangeRate": 1.955,
-                "revenueUSD": 3159,
-                "pulpSales": 5357,
-                "pulpPrice": 780
-            },
-            { 
-                "year": "2013", 
-                "revenue": 6317, 
-                "cogs": 5302, 
-                "grossProfit": 1535, 
-                "sgaExpense": 642, 
-                "operatingIncome": 914, 
-                "netIncome": -706,
-                "grossMargin": 22.2,
-                "operatingMargin": 13.2,
-                "netMargin": -10.2,
-                "exchangeRate": 2.1605,
-                "revenueUSD": 2924,
-                "pulpSales": 5198,
-                "pulpPrice": 770
-            },
-            { 
-                "year": "2014", 
-                "revenue": 7084, 
-                "cogs": 5546, 
-                "grossProfit": 1538, 
-                "sgaExpense": 644, 
-                "operatingIncome": 1660, 
-                "netIncome": 156,
-                "grossMargin": 21.7,
-                "operatingMargin": 23.4,
-                "netMargin": 2.2,
-                "exchangeRate": 2.3547,
-                "revenueUSD": 3009,
-                "pulpSales": 5305,
-                "pulpPrice": 741
-            },
-            { 
-                "year": "2015 (6월까지)", 
-                "revenue": 8054, 
-                "cogs": 5560, 
-                "grossProfit": 2494, 
-                "sgaExpense": 703, 
-                "operatingIncome": 1698, 
-                "netIncome": -449,
-                "grossMargin": 31.0,
-                "operatingMargin": 21.1,
-                "netMargin": -5.6,
-                "exchangeRate": 2.5989,
-                "revenueUSD": 3099,
-                "pulpSales": 5370,
-                "pulpPrice": 793
-            }
-        ]
+        # Fibria 재무 분석 데이터 (단위: 백만 레알) - 원본 손익계산서 표에서 생성, 2015는 6월까지 12개월(LTM) 열
+        fibria_income, _, _, fibria_ratios = statement_tables("fibria_income_statement")
+        self.fibria_financial_data = statement_records(
+            {"2012": "2012", "2013": "2013", "2014": "2014", "2015 (6월까지)": "헤알 (In Reais)"},
+            [
+                (fibria_income, {
+                    "revenue": "(Revenue)", "cogs": "(Cost of Products Sold)", "grossProfit": "(Gross Profit)",
+                    "sgaExpense": "(SG&A", "operatingIncome": "(Operating Income)", "netIncome": "(Net Income)",
+                }),
+                (fibria_ratios, {
+                    "grossMargin": "(Gross Margin)", "operatingMargin": "(Operating Margin)", "netMargin": "(Net Margin",
+                    "exchangeRate": "(Average Exchange Rate", "pulpSales": "(Pulp Sales", "pulpPrice": "(Pulp Price",
+                }),
+            ],
+        )
+        for record in self.fibria_financial_data:
+            # 원본 표에 연도별 달러 매출 행이 없어 평균 환율로 환산 (LTM 열의 달러 매출 $3,099와 같은 방식)
+            record["revenueUSD"] = round(record["revenue"] / record["exchangeRate"])
 
         # Fibria SCF 프로그램 영향 분석 (2013년 SCF 도입)
         self.fibria_scf_impact_data = [
@@ -368,93 +324,32 @@ class MarketDataProvider:
             { "year": "2015", "exchangeRate": 2.5989, "pulpPrice": 793 }
         ]
 
-        # Fibria 대차대조표 데이터 (단위: 백만 레알)
-        self.fibria_balance_sheet_data = [
-            { 
-                "year": "2012", 
-                "currentAssets": 6246,
-                "cash": 3296,
-                "accountsReceivable": 964,
-                "inventory": 1183,
-                "otherCurrentAssets": 803,
-                "totalAssets": 28145,
-                "currentLiabilities": 2475,
-                "accountsPayable": 436,
-                "shortTermDebt": 1138,
-                "otherCurrentLiabilities": 901,
-                "longTermDebt": 9630,
-                "otherLTLiabilities": 869,
-                "totalLiabilities": 12974,
-                "totalEquity": 15171,
-                "currentRatio": 2.52,
-                "totalDebt": 10768,
-                "debtToCapital": 41.5,
-                "exchangeRate": 1.955
-            },
-            { 
-                "year": "2013", 
-                "currentAssets": 5807,
-                "cash": 2099,
-                "accountsReceivable": 1477,
-                "inventory": 1266,
-                "otherCurrentAssets": 965,
-                "totalAssets": 26750,
-                "currentLiabilities": 4448,
-                "accountsPayable": 587,
-                "shortTermDebt": 2973,
-                "otherCurrentLiabilities": 888,
-                "longTermDebt": 6801,
-                "otherLTLiabilities": 1010,
-                "totalLiabilities": 12259,
-                "totalEquity": 14491,
-                "currentRatio": 1.31,
-                "totalDebt": 9773,
-                "debtToCapital": 40.3,
-                "exchangeRate": 2.1605
-            },
-            { 
-                "year": "2014", 
-                "currentAssets": 3261,
-                "cash": 745,
-                "accountsReceivable": 695,
-                "inventory": 1239,
-                "otherCurrentAssets": 582,
-                "totalAssets": 25594,
-                "currentLiabilities": 2099,
-                "accountsPayable": 593,
-                "shortTermDebt": 966,
-                "otherCurrentLiabilities": 540,
-                "longTermDebt": 7361,
-                "otherLTLiabilities": 1518,
-                "totalLiabilities": 10978,
-                "totalEquity": 14616,
-                "currentRatio": 1.55,
-                "totalDebt": 8327,
-                "debtToCapital": 36.3,
-                "exchangeRate": 2.3547
-            },
-            { 
-                "year": "2015 (6월)", 
-                "currentAssets": 3862,
-                "cash": 1386,
-                "accountsReceivable": 875,
-                "inventory": 1455,
-                "otherCurrentAssets": 146,
-                "totalAssets": 26501,
-                "currentLiabilities": 2086,
-                "accountsPayable": 637,
-                "shortTermDebt": 894,
-                "otherCurrentLiabilities": 555,
-                "longTermDebt": 8121,
-                "otherLTLiabilities": 1730,
-                "totalLiabilities": 11937,
-                "totalEquity": 14563,
-                "currentRatio": 1.85,
-                "totalDebt": 9015,
-                "debtToCapital": 38.2,
-                "exchangeRate": 2.6913
-            }
-        ]
+        # Fibria 대차대조표 데이터 (단위: 백만 레알) - 원본 재무상태표/재무비율 표에서 생성
+        fibria_balance_sheet, fibria_balance_ratios = statement_tables("fibria_balance_sheet")
+        self.fibria_balance_sheet_data = statement_records(
+            {"2012": "2012", "2013": "2013", "2014": "2014", "2015 (6월)": "2015년 6월"},
+            [
+                (fibria_balance_sheet, {
+                    "currentAssets": "유동자산 합계", "cash": "현금 및 단기투자", "accountsReceivable": "매출채권",
+                    "inventory": "재고자산", "otherCurrentAssets": "기타 유동자산", "totalAssets": "자산 총계",
+                    "currentLiabilities": "유동부채 합계", "accountsPayable": "매입채무", "shortTermDebt": "단기차입금",
+                    "currentPortionLTDebt": "유동성장기부채", "longTermDebt": "장기차입금",
+                    "otherLTLiabilities": "기타 비유동부채", "totalLiabilities": "부채 총계", "totalEquity": "자본 총계",
+                }),
+                (fibria_balance_ratios, {
+                    "totalDebt": "총부채", "exchangeRate": "평균환율",
+                }),
+            ],
+        )
+        _fill_ratios("fibria_balance_sheet_data", self.fibria_balance_sheet_data, records_to_columns(self.fibria_balance_sheet_data), {
+            "currentRatio": ("currentRatio", 2), "debtToCapital": ("debtToTotalCapital", 1),
+        })
+        for record in self.fibria_balance_sheet_data:
+            # 단기차입금 = 단기차입금 + 유동성장기부채, 기타 유동부채 = 유동부채 합계의 나머지 (미지급비용 포함)
+            record["shortTermDebt"] += record.pop("currentPortionLTDebt")
+            record["otherCurrentLiabilities"] = (
+                record["currentLiabilities"] - record["accountsPayable"] - record["shortTermDebt"]
+            )
 
         # Fibria 운전자본 항목 데이터
         self.fibria_working_capital_data = [
@@ -681,30 +576,28 @@ class MarketDataProvider:
             'fibriaFinancialCrisisPeriods': self.fibria_financial_crisis_periods
         }
     
-    def get_data_frames(self) -> Dict[str, pd.DataFrame]:
-        """모든 데이터를 DataFrame 형태로 반환"""
-        return {
-            'treasury_yields': pd.DataFrame(self.treasury_yields_data),
-            'corporate_bond_yields': pd.DataFrame(self.corporate_bond_yields_data),
-            'short_term_rates': pd.DataFrame(self.short_term_rates_data),
-            'scf_rate_simulation': pd.DataFrame(self.scf_rate_simulation_data),
-            'ratings_comparison': pd.DataFrame(self.ratings_comparison_data),
-            'historical_libor': pd.DataFrame(self.historical_libor_data),
-            'pg_financial': pd.DataFrame(self.pg_financial_data),
-            'pg_balance_sheet': pd.DataFrame(self.pg_balance_sheet_data),
-            'pg_working_capital': pd.DataFrame(self.pg_working_capital_data),
-            'pg_extended_working_capital': pd.DataFrame(self.pg_extended_working_capital_data),
-            'fibria_financial': pd.DataFrame(self.fibria_financial_data),
-            'fibria_scf_impact': pd.DataFrame(self.fibria_scf_impact_data),
-            'fibria_market': pd.DataFrame(self.fibria_market_data),
-            'fibria_balance_sheet': pd.DataFrame(self.fibria_balance_sheet_data),
-            'fibria_working_capital': pd.DataFrame(self.fibria_working_capital_data),
-            'fibria_scf_analysis': pd.DataFrame(self.fibria_scf_analysis_data),
-            'fibria_cash_conversion_cycle': pd.DataFrame(self.fibria_cash_conversion_cycle_data),
-            'fibria_scf_scenario': pd.DataFrame(self.fibria_scf_scenario_data),
-            'fibria_working_capital_need': pd.DataFrame(self.fibria_working_capital_need_data),
-            'fibria_financial_crisis_periods': pd.DataFrame(self.fibria_financial_crisis_periods)
-        }
+    def get_data_frames(self) -> Mapping[str, pd.DataFrame]:
+        """
+        모든 데이터를 DataFrame 형태로 반환
+        
+        Returns:
+            Mapping[str, pd.DataFrame]: 읽기 전용 지연 매핑 - 각 DataFrame은 키에 처음 접근할 때
+                만들어져 캐시되고 (적중/미스 횟수는 .stats()), 접근할 때마다 호출자 전용 복사본이
+                반환되므로 기존처럼 자유롭게 수정할 수 있음 (복사 없는 읽기 전용 뷰는 self.store.frame)
+        """
+        return self.store.frames
+
+    def simulate_supplier_portfolio(self, n_suppliers: int = 50_000, seed: int = 2013, **kwargs) -> Dict[str, Any]:
+        """
+        회사채 수익률 등급 사다리로 가상 공급업체 포트폴리오의 SCF 효과 집계
+        
+        Args:
+            n_suppliers: 공급업체 수
+            seed: 난수 시드
+            **kwargs: SupplierPortfolioParams의 나머지 가정 (sales_median, terms_mean_days 등)
+        """
+        params = SupplierPortfolioParams(rating_ladder(self.corporate_bond_yields_data), n_suppliers, **kwargs)
+        return simulate_supplier_portfolio(params, seed)
 
     def get_working_capital_data(self):
         """피브리아 현금전환주기 데이터 (2005-2015) 반환"""
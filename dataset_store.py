@@ -0,0 +1,301 @@
+import sys
+import copy
+import functools
+import threading
+from collections.abc import Mapping as MappingABC
+from types import MappingProxyType
+from typing import Any, Dict, Iterator, List, Mapping, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from html_cache import stable_hash
+
+# 열 종류: 값을 records()로 되돌릴 때 원래 파이썬 타입을 복원하는 데 사용
+_KIND_DTYPES = {"int": np.int64, "float": np.float64, "bool": np.bool_}
+
+
+def _readonly(array: np.ndarray) -> np.ndarray:
+    array.flags.writeable = False
+    return array
+
+
+class FrozenRecord(dict):
+    """
+    수정할 수 없는 레코드 - 프로세스 안의 모든 세션과 생성기가 같은 행 객체를 공유하므로 변경을 막음
+
+    dict 하위 클래스라 json.dumps, pd.DataFrame, Mapping 검사는 일반 dict와 똑같이 동작합니다.
+    수정이 필요하면 dict(record) 또는 record.copy()로 만든 일반 dict 복사본을 사용합니다.
+    """
+    __slots__ = ()
+
+    def _readonly(self, *args, **kwargs):
+        raise TypeError("공유 레코드는 수정할 수 없습니다 - dict(record)로 복사한 뒤 수정하세요")
+
+    __setitem__ = __delitem__ = __ior__ = clear = pop = popitem = setdefault = update = _readonly
+
+    def copy(self) -> Dict[str, Any]:
+        return dict(self)
+
+    def __copy__(self) -> Dict[str, Any]:
+        return dict(self)
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> Dict[str, Any]:
+        return copy.deepcopy(dict(self), memo)
+
+    def __reduce__(self):
+        return FrozenRecord, (dict(self),)
+
+
+def _freeze(value: Any) -> Any:
+    """중첩된 dict/list 값을 FrozenRecord/tuple로 변환 (스칼라는 그대로)"""
+    if isinstance(value, dict):
+        return FrozenRecord((key, _freeze(item)) for key, item in value.items())
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+def _column_kind(values: Sequence[Any]) -> str:
+    """열 값들의 공통 타입 ('int', 'float', 'bool', 'str', 'object')"""
+    types = {type(value) for value in values}
+    if len(types) != 1:
+        return "object"
+    value_type = types.pop()
+    if value_type is bool:
+        return "bool"
+    if value_type is int and all(-2**63 <= value < 2**63 for value in values):
+        return "int"
+    if value_type is float:
+        return "float"
+    if value_type is str:
+        return "str"
+    return "object"
+
+
+class LabelIndex:
+    """여러 테이블이 공유하는 라벨(연도, 만기, 등급 등) 목록 - 같은 문자열은 한 번만 저장"""
+
+    def __init__(self):
+        self._labels: List[str] = []
+        self._codes: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def encode(self, labels: Sequence[str]) -> np.ndarray:
+        """라벨 목록을 공유 인덱스 코드 배열로 변환"""
+        with self._lock:
+            codes = []
+            for label in labels:
+                code = self._codes.get(label)
+                if code is None:
+                    code = self._codes[label] = len(self._labels)
+                    self._labels.append(sys.intern(label))
+                codes.append(code)
+        return _readonly(np.asarray(codes, dtype=np.int32))
+
+    def decode(self, codes: np.ndarray) -> np.ndarray:
+        """코드 배열을 라벨 객체 배열로 변환"""
+        labels = np.empty(len(codes), dtype=object)
+        labels[:] = [self._labels[code] for code in codes.tolist()]
+        return _readonly(labels)
+
+    def __len__(self) -> int:
+        return len(self._labels)
+
+
+class ColumnarTable:
+    """
+    행(dict) 목록을 필드별 NumPy 배열로 저장한 테이블
+
+    첫 번째 필드가 문자열이면 라벨 열로 보고 공유 LabelIndex의 코드로 저장합니다.
+    일부 행에만 있는 필드는 presence 마스크로 기록하여 records()가 원래 행을 그대로 복원합니다.
+    """
+
+    def __init__(self, rows: Sequence[Mapping[str, Any]], label_index: LabelIndex):
+        self.length = len(rows)
+        self.fields: Tuple[str, ...] = tuple(dict.fromkeys(field for row in rows for field in row))
+        self._row_orders: Optional[List[Tuple[str, ...]]] = None
+        if any(tuple(row) != self.fields for row in rows):
+            self._row_orders = [tuple(row) for row in rows]
+
+        self.label_field: Optional[str] = None
+        self._kinds: Dict[str, str] = {}
+        self._present: Dict[str, np.ndarray] = {}
+        columns: Dict[str, np.ndarray] = {}
+        for field in self.fields:
+            present = np.fromiter((field in row for row in rows), dtype=bool, count=self.length)
+            values = [row[field] for row in rows if field in row]
+            kind = _column_kind(values)
+            self._kinds[field] = kind
+            if not present.all():
+                self._present[field] = _readonly(present)
+            if field == self.fields[0] and kind == "str" and field not in self._present:
+                self.label_field = field
+                self._label_codes = label_index.encode(values)
+                columns[field] = label_index.decode(self._label_codes)
+                continue
+            columns[field] = _readonly(self._build_column(values, present, kind))
+        self._columns = columns
+        self.columns: Mapping[str, np.ndarray] = MappingProxyType(columns)
+
+    def _build_column(self, values: List[Any], present: np.ndarray, kind: str) -> np.ndarray:
+        if kind in _KIND_DTYPES and present.all():
+            return np.asarray(values, dtype=_KIND_DTYPES[kind])
+        if kind in ("int", "float"):
+            # 값이 없는 칸은 NaN - pd.DataFrame(records)와 같은 float64 열이 됨
+            column = np.full(self.length, np.nan)
+        else:
+            column = np.full(self.length, None, dtype=object)
+        column[present] = [sys.intern(value) if kind == "str" else value for value in values]
+        return column
+
+    @property
+    def labels(self) -> Optional[np.ndarray]:
+        """라벨 열 값 (라벨 열이 없으면 None)"""
+        return self._columns[self.label_field] if self.label_field else None
+
+    def frame(self) -> pd.DataFrame:
+        """
+        열 배열을 복사하지 않는 DataFrame 뷰
+
+        열마다 별도 블록으로 두므로 DataFrame 생성 비용이 작고, 배열이 읽기 전용이라
+        뷰를 수정하려고 하면 공유 데이터 대신 오류가 납니다.
+        """
+        return pd.DataFrame(dict(self._columns), copy=False)
+
+    @functools.cached_property
+    def _records(self) -> Tuple[FrozenRecord, ...]:
+        lists = {}
+        for field, column in self._columns.items():
+            values = column.tolist()
+            if self._kinds[field] == "int" and column.dtype != np.int64:
+                values = [int(value) if value == value else value for value in values]
+            elif self._kinds[field] == "object":
+                values = [_freeze(value) for value in values]
+            lists[field] = values
+        rows = []
+        for i in range(self.length):
+            order = self._row_orders[i] if self._row_orders else self.fields
+            rows.append(FrozenRecord(
+                (field, lists[field][i]) for field in order
+                if field not in self._present or self._present[field][i]
+            ))
+        return tuple(rows)
+
+    def records(self) -> Tuple[FrozenRecord, ...]:
+        """
+        원래 행(dict) 목록과 같은 값/키 순서의 레코드
+
+        한 번 만들어 공유하므로 행은 FrozenRecord, 목록은 tuple이며 중첩된 dict/list도 변경할 수 없습니다.
+        """
+        return self._records
+
+
+class LazyFrameMapping(MappingABC):
+    """
+    데이터셋 이름 -> DataFrame 읽기 전용 매핑 - 처음 접근한 테이블만 만들어 캐시
+
+    Streamlit 세션들이 같은 매핑을 공유하므로 캐시된 DataFrame 자체는 내보내지 않고
+    접근할 때마다 수정 가능한 독립 복사본을 반환합니다. 캐시에는 dtype별 블록으로 합친
+    DataFrame을 두므로 복사는 블록 몇 개의 memcpy로 끝나며(약 30µs), pd.DataFrame(행 목록)으로
+    새로 만드는 것(약 550µs)보다 훨씬 쌉니다. 복사본에 대한 df.loc[...] = ... 같은 수정은
+    공유 데이터에 영향을 주지 않습니다.
+    """
+
+    def __init__(self, tables: Mapping[str, ColumnarTable]):
+        self._tables = tables
+        self._frames: Dict[str, pd.DataFrame] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def __getitem__(self, name: str) -> pd.DataFrame:
+        table = self._tables[name]
+        with self._lock:
+            frame = self._frames.get(name)
+            if frame is None:
+                self.misses += 1
+                # copy()가 열별 블록을 dtype별 블록으로 합침 (읽기 전용 저장소 배열과도 분리)
+                frame = self._frames[name] = table.frame().copy()
+            else:
+                self.hits += 1
+        return frame.copy()
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._tables)
+
+    def __len__(self) -> int:
+        return len(self._tables)
+
+    def materialized(self) -> Tuple[str, ...]:
+        """이미 만들어진 DataFrame 이름 목록"""
+        with self._lock:
+            return tuple(self._frames)
+
+    def stats(self) -> Dict[str, int]:
+        """적중/미스 횟수와 만들어진 테이블 수"""
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses, "materialized": len(self._frames), "tables": len(self._tables)}
+
+
+class DatasetStore:
+    """이름 -> ColumnarTable 모음 (하나의 LabelIndex 공유)"""
+
+    def __init__(self, datasets: Mapping[str, Sequence[Mapping[str, Any]]], version: Optional[str] = None):
+        """
+        Args:
+            datasets: 데이터셋 이름 -> 행(dict) 목록
+            version: 데이터 내용 해시 (None이면 계산)
+        """
+        self.labels = LabelIndex()
+        self.tables: Dict[str, ColumnarTable] = {
+            name: ColumnarTable(rows, self.labels) for name, rows in datasets.items()
+        }
+        self.version = version or stable_hash({name: list(rows) for name, rows in datasets.items()})
+        # 세션 간에 공유되는 지연 DataFrame 매핑
+        self.frames = LazyFrameMapping(self.tables)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.tables
+
+    def names(self) -> Tuple[str, ...]:
+        """데이터셋 이름 목록"""
+        return tuple(self.tables)
+
+    def columns(self, name: str) -> Mapping[str, np.ndarray]:
+        """필드 -> 읽기 전용 배열 (복사 없음)"""
+        return self.tables[name].columns
+
+    def frame(self, name: str) -> pd.DataFrame:
+        """복사 없는 DataFrame 뷰"""
+        return self.tables[name].frame()
+
+    def records(self, name: str) -> Tuple[FrozenRecord, ...]:
+        """원래 형태의 행 목록 (변경할 수 없는 공유 레코드)"""
+        return self.tables[name].records()
+
+    def nbytes(self) -> int:
+        """숫자 열 배열이 차지하는 바이트 수 (object 열은 포인터 크기만 계산)"""
+        return sum(column.nbytes for table in self.tables.values() for column in table.columns.values())
+
+
+_stores: Dict[str, DatasetStore] = {}
+_stores_lock = threading.Lock()
+
+
+def shared_store(datasets: Mapping[str, Sequence[Mapping[str, Any]]]) -> DatasetStore:
+    """
+    같은 내용의 데이터셋이면 프로세스 안에서 하나의 DatasetStore를 공유
+
+    Args:
+        datasets: 데이터셋 이름 -> 행(dict) 목록
+
+    Returns:
+        DatasetStore: 내용 해시(version)가 같으면 이전에 만든 저장소
+    """
+    version = stable_hash({name: list(rows) for name, rows in datasets.items()})
+    with _stores_lock:
+        store = _stores.get(version)
+        if store is None:
+            store = _stores[version] = DatasetStore(datasets, version)
+    return store
@@ -0,0 +1,227 @@
+# 각 Exhibit 화면 하단 expander에 표시되는 원본 재무제표/분석 내용 (expander 제목, 마크다운)
+
+# Exhibit 1 - P&G 손익계산서
+PG_INCOME_STATEMENT_NOTES = ("Procter & Gamble Income Statement (2011-2015)", """
+            ### Procter & Gamble Income Statement (2011-2015) (단위: 백만 달러)
+            
+            | 구분 | 2011 | 2012 | 2013 | 2014 | 2015 |
+            |------|------|------|------|------|------|
+            | **손익계산서 (Income Statement)** |  |  |  |  |  |
+            | 매출 (Revenue) | $81,104 | $82,006 | $80,116 | $80,510 | $76,279 |
+            | 제품 판매원가 (Cost of Products Sold) | $39,859 | $41,411 | $39,991 | $40,611 | $38,248 |
+            | **매출총이익 (Gross Profit)** | **$41,245** | **$40,595** | **$40,125** | **$39,899** | **$38,031** |
+            | 판매관리비 (SG&A Expense) | $25,750 | $25,984 | $26,000 | $24,402 | $23,158 |
+            | **영업이익 (Operating Income)** | **$15,495** | **$14,611** | **$14,125** | **$15,497** | **$14,873** |
+            | 순이자비용 (Net Interest Expense) | ($769) | ($692) | ($579) | ($609) | ($475) |
+            | 기타수익 및 특별항목 (Other Income & Unusual Items) | $271 | ($1,391) | $633 | ($551) | ($2,552) |
+            | **세전이익 (Profit before Tax)** | **$14,997** | **$12,528** | **$14,179** | **$14,337** | **$11,846** |
+            | 법인세비용 (Income Tax Expense) | $3,299 | $3,378 | $3,226 | $3,019 | $2,916 |
+            | 소수주주지분 (Minority Interest) | ($130) | ($148) | ($90) | ($142) | ($108) |
+            | 중단사업이익 (Earnings from Discont. Ops.) | $229 | $1,754 | $449 | $467 | ($1,786) |
+            | **순이익 (Net Income)** | **$11,797** | **$10,756** | **$11,312** | **$11,643** | **$7,036** |
+            | **주당 지표 (Per Share Items)** |  |  |  |  |  |
+            | 기본 주당순이익 (Basic EPS) | 4.12 | 3.82 | 4.04 | 4.19 | 2.50 |
+            | 평균 유통주식수-기본 (Avg. # Basic Shares Outstanding) | 2,804 | 2,751 | 2,743 | 2,720 | 2,712 |
+            | 주당 배당금 (Dividend per Share) | $1.97 | $2.14 | $2.29 | $2.45 | $2.59 |
+            | 배당성향 (Payout Ratio) | 48% | 56% | 57% | 59% | 104% |
+            | 주가 (Stock Price, $/share) | $63.57 | $61.25 | $76.99 | $78.59 | $78.24 |
+            | **기타 현금흐름 항목 (Other Cash Flow Items)** |  |  |  |  |  |
+            | 감가상각비 (Depreciation & Amortization) | $2,838 | $3,204 | $2,982 | $3,141 | $3,134 |
+            | 자본지출 (Capital Expenditures) | $3,306 | $3,964 | $4,008 | $3,848 | $3,736 |
+            | 광고비 (Advertising Expense) | $9,210 | $9,222 | $9,364 | $8,979 | $8,290 |
+            | **재무비율 및 정보 (Financial Ratios & Information)** |  |  |  |  |  |
+            | 매출 성장률 (Revenue Growth) | 4.6% | 1.1% | -2.3% | 0.5% | -5.3% |
+            | 매출총이익률 (Gross Margin) | 50.9% | 49.5% | 50.1% | 49.6% | 49.9% |
+            | 영업이익률 (Operating Margin) | 19.1% | 17.8% | 17.6% | 19.2% | 19.5% |
+            | 순이익률 (Net Margin, ROS) | 14.5% | 13.1% | 14.1% | 14.5% | 9.2% |
+            | 총자산수익률 (Return on Assets, ROA) | 8.5% | 8.1% | 8.1% | 8.1% | 5.4% |
+            | 자기자본수익률 (Return on Equity, ROE) | 17.3% | 16.8% | 16.5% | 16.6% | 11.2% |
+            | 이자보상배율 (Interest Cover) | 20.1 | 21.1 | 24.4 | 25.4 | 31.3 |
+            | 유효세율 (Effective Tax Rate) | 22.0% | 27.0% | 22.8% | 21.1% | 24.6% |
+            | 직원 수 (Number of Employees) | 129,000 | 126,000 | 121,000 | 118,000 | 110,000 |
+            
+            **참고**: 
+            - P&G는 2015년 베네수엘라 사업 관련 회계처리 방식 변경으로 21억 달러의 일회성 비용을 계상했습니다. 환전 또는 배당금 지급 불가로 인해 P&G는 베네수엘라 자회사의 연결을 중단하고 원가법으로 회계처리를 시작했습니다.
+           """)
+
+# Exhibit 2 - P&G 대차대조표
+PG_BALANCE_SHEET_NOTES = ("Procter & Gamble Balance Sheet (2011-2015)", """
+### Procter & Gamble Balance Sheet (2011-2015) (단위: 백만 달러)
+
+| **대차대조표 (Balance Sheet)** | **2011** | **2012** | **2013** | **2014** | **2015** |
+|-------------------|----------|----------|----------|----------|----------|
+| **자산 (Assets)** |  |  |  |  |  |
+| 현금 및 단기투자 (Cash & ST Investments) | $2,768 | $4,436 | $5,947 | $10,686 | $11,612 |
+| 매출채권 (Accounts Receivable) | $6,275 | $6,068 | $6,508 | $6,386 | $4,861 |
+| 재고자산 (Inventory) | $7,379 | $6,721 | $6,909 | $6,759 | $5,454 |
+| 선급비용 (Prepaid Expenses) | $4,408 | $3,684 | $3,678 | $3,345 | $2,853 |
+| 기타유동자산 (Other Current Assets) | $1,140 | $1,001 | $948 | $4,441 | $4,866 |
+| **유동자산 (Current Assets)** | **$21,970** | **$21,910** | **$23,990** | **$31,617** | **$29,646** |
+| 순유형자산 (Net PP&E) | $21,293 | $20,377 | $21,666 | $22,304 | $20,268 |
+| 영업권 및 무형자산 (Goodwill & Intangibles) | $90,182 | $84,761 | $86,760 | $84,547 | $74,145 |
+| 기타비유동자산 (Other LT Assets) | $4,909 | $5,196 | $6,847 | $5,798 | $5,436 |
+| **총자산 (Total Assets)** | **$138,354** | **$132,244** | **$139,263** | **$144,266** | **$129,495** |
+| **부채 및 자본 (Liabilities & Net Worth)** |  |  |  |  |  |
+| 매입채무 (Accounts Payable) | $8,022 | $7,920 | $8,777 | $8,461 | $8,257 |
+| 미지급비용 (Accrued Expenses) | $5,696 | $4,304 | $5,161 | $5,336 | $4,564 |
+| 단기차입금 (Short-term Borrowings) | $6,987 | $4,615 | $7,926 | $11,399 | $9,249 |
+| 유동성장기부채 (Current Portion of LT Debt) | $2,994 | $4,083 | $4,506 | $4,307 | $2,752 |
+| 기타유동부채 (Other Current Liabilities) | $3,594 | $3,985 | $3,667 | $4,223 | $4,968 |
+| **유동부채 (Current Liabilities)** | **$27,293** | **$24,907** | **$30,037** | **$33,726** | **$29,790** |
+| 장기부채 (Long Term Debt) | $22,033 | $21,080 | $19,111 | $19,811 | $18,297 |
+| 연금부채 (Pension Liabilities) | $6,275 | $8,954 | $7,740 | $7,890 | $6,997 |
+| 기타비유동부채 (Other LT Liabilities) | $14,752 | $13,268 | $13,666 | $12,863 | $11,361 |
+| **총부채 (Total Liabilities)** | **$70,353** | **$68,209** | **$70,554** | **$74,290** | **$66,445** |
+| 우선주 (Preferred Stock) | $1,234 | $1,195 | $1,137 | $1,111 | $1,077 |
+| 보통주자본 (Common Equity) | $66,406 | $62,244 | $66,927 | $68,103 | $61,342 |
+| 소수주주지분 (Minority Interest) | $361 | $596 | $645 | $762 | $631 |
+| **총자본 (Total Equity)** | **$68,001** | **$64,035** | **$68,709** | **$69,976** | **$63,050** |
+| **총부채 및 자본 (Total Liab. & Equity)** | **$138,354** | **$132,244** | **$139,263** | **$144,266** | **$129,495** |
+| **재무비율 및 정보 (Financial Ratios & Information)** |  |  |  |  |  |
+| 유동비율 (Current Ratio, CA/CL) | 0.80 | 0.88 | 0.80 | 0.94 | 1.00 |
+| 총부채 (Total Debt) | $32,014 | $29,778 | $31,543 | $35,417 | $30,298 |
+| 부채비율 (Debt-to-Total Capital, D/TC) | 32.0% | 31.7% | 31.5% | 33.6% | 32.5% |
+| 순부채 (Net Debt, Debt - Cash) | $29,246 | $25,342 | $25,596 | $24,731 | $18,686 |
+| 재무레버리지 (Fin. Leverage, Assets/Equity) | 2.03 | 2.07 | 2.03 | 2.06 | 2.05 |
+| S&P 장기부채 신용등급 (Long-Term Debt Rating) | AA- | AA- | AA- | AA- | AA- |
+| **운전자본 (Working Capital)** |  |  |  |  |  |
+| 자산회전율 (Asset Turnover, Sales/Assets) | 0.59 | 0.62 | 0.58 | 0.56 | 0.59 |
+| 재고회전율 (Inventory Turns, COGS/Inventory) | 5.40 | 6.16 | 5.79 | 6.01 | 7.01 |
+
+                """)
+
+# Exhibit 5 - Fibria 손익계산서 및 재무 분석 시사점
+FIBRIA_INCOME_STATEMENT_NOTES = ("Fibria Celulose 재무 분석 상세", """
+                ### 피브리아 셀룰로즈 손익계산서 (Fibria Celulose Income Statement)
+                #### 2012-2015 (단위: 백만 브라질 헤알 및 미국 달러)
+
+                | 손익계산서 (Income Statement) | | | | | |
+                |---|---|---|---|---|---|
+                | | 2012 | 2013 | 2014 | 헤알 (In Reais) | 달러 (In USD) |
+                | 매출 (Revenue) | R$ 6,174 | R$ 6,917 | R$ 7,084 | R$ 8,054 | $3,099 |
+                | 제품 판매원가 (Cost of Products Sold) | R$ 5,237 | R$ 5,382 | R$ 5,546 | R$ 5,560 | $2,139 |
+                | 매출총이익 (Gross Profit) | R$ 937 | R$ 1,535 | R$ 1,538 | R$ 2,494 | $960 |
+                | 판매관리비 (SG&A Expense) | R$ 579 | R$ 642 | R$ 644 | R$ 703 | $270 |
+                | 기타 영업 비용(수익) (Other Oper. Expense (Income)) | R$ 13 | -R$ 21 | -R$ 766 | R$ 94 | $36 |
+                | 영업이익 (Operating Income) | R$ 345 | R$ 914 | R$ 1,660 | R$ 1,698 | $653 |
+                | 순이자비용 (Net Interest Expense) | R$ 530 | R$ 479 | R$ 385 | R$ 356 | $137 |
+                | 환율차손익 (Currency Exchange Gains (Loss)) | -R$ 735 | -R$ 933 | -R$ 722 | -R$ 1,926 | ($741) |
+                | 기타 영업외 수익(손실) (Other Non-Oper. Income (Loss)) | -R$ 70 | R$ 154 | -R$ 531 | -R$ 617 | ($237) |
+                | 세전이익 (Profit before Tax) | -R$ 990 | -R$ 344 | R$ 22 | -R$ 1,201 | ($462) |
+                | 법인세비용(환급) (Income Tax Expense (Credit)) | -R$ 292 | R$ 354 | -R$ 141 | -R$ 762 | ($293) |
+                | 소수주주지분 (Minority Interest) | -R$ 7 | -R$ 7 | -R$ 7 | -R$ 9 | ($4) |
+                | 당기순이익 (Net Income) | -R$ 705 | -R$ 706 | R$ 156 | -R$ 449 | ($173) |
+
+                | 주당 항목 (Per Share Items) | | | | | |
+                |---|---|---|---|---|---|
+                | 기본주당순이익 (Basic Earnings per Share (EPS)) | -R$ 1.34 | -R$ 1.28 | R$ 0.28 | R$ 0.81 | $0.31 |
+                | 기본주식수 평균 (Avg. # Basic Shares Out.) | 525 | 554 | 554 | 554 | |
+                | 주당배당금 (Dividends per Share) | R$ 0.00 | R$ 0.00 | R$ 0.07 | R$ 0.27 | |
+                | 주가 (Stock Price) | R$ 22.57 | R$ 27.86 | R$ 32.26 | R$ 44.15 | |
+
+                | 기타 현금흐름 항목 (Other Cash Flow Items) | | | | | |
+                |---|---|---|---|---|---|
+                | 감가상각비 (Depreciation & Amortization) | R$ 1,720 | R$ 1,752 | R$ 1,791 | R$ 1,818 | $700 |
+                | 설비투자 (Capital Expenditures) | R$ 1,078 | R$ 1,287 | R$ 1,291 | R$ 1,657 | $638 |
+
+                | 재무비율 (Financial Ratios) | | | | | |
+                |---|---|---|---|---|---|
+                | 매출성장률 (Revenue Growth) | | 5.5% | 12.0% | 2.4% | 13.7% |
+                | 매출총이익률 (Gross Margin) | 15.2% | 22.2% | 21.7% | 31.0% | |
+                | 영업이익률 (Operating Margin) | 5.6% | 13.2% | 23.4% | 21.1% | |
+                | 순이익률 (Net Margin (ROS)) | -11.4% | -10.2% | 2.2% | -5.6% | |
+                | 총자산수익률 (Return on Assets (ROA)) | -2.5% | -2.6% | 0.6% | -1.7% | |
+                | 자기자본수익률 (Return on Equity (ROE, ending)) | -4.6% | -4.9% | 1.1% | -3.1% | |
+                | 펄프 판매량 (1000 미터톤) (Pulp Sales (000 metric tons)) | 5,357 | 5,198 | 5,305 | 5,370 | |
+                | 펄프 가격-유럽 (달러/톤) (Pulp Price-Europe (USD/ton)) | $780 | $770 | $741 | $793 | |
+                | 직원 수 (Number of Employees) | 4,136 | 4,192 | 4,294 | 4,200 | |
+                | 평균 환율 (헤알/달러) (Average Exchange Rate (Reais/USD)) | 1.9550 | 2.1605 | 2.3547 | 2.5989 | |
+
+                ## 주요 재무 분석 시사점
+
+                1. **영업 실적 개선**: 영업이익이 2012년 345백만 레알에서 2015년 6월 기준 1,698백만 레알로 크게 증가하며 영업이익률도 5.6%에서 21.1%로 상승
+
+                2. **환율 위험 노출**: 브라질 레알화의 평가절하로 인한 환율 손실이 지속적으로 발생하여 순이익에 부정적 영향을 미침
+
+                3. **매출 및 마진 향상**: 매출이 꾸준히 증가하고 매출총이익률이 15.2%에서 31.0%로 크게 개선됨
+
+                4. **안정적인 판매량**: 펄프 판매량은 5,200-5,400천 톤 수준으로 비교적 안정적이며, 판매 가격은 2015년 회복세를 보임
+
+                5. **투자 확대**: 자본지출이 2012년 대비 2015년에 50% 이상 증가하며 미래 성장을 위한 투자가 이루어짐
+                """)
+
+# Exhibit 6 - Fibria 재무상태표 상세 분석
+FIBRIA_BALANCE_SHEET_NOTES = ("Fibria Celulose 재무상태표 상세 분석", """
+                ## 1. 재무상태표 주요 데이터
+                (단위: 백만 브라질 레알)
+
+                | 재무상태표 항목 | 2012 | 2013 | 2014 | 2015년 6월 |
+                |--------------|-------|-------|-------|------------|
+                | **자산(Assets)** |
+                | 현금 및 단기투자 | R$ 3,296 | R$ 2,099 | R$ 745 | R$ 1,386 |
+                | 매출채권 | R$ 964 | R$ 1,477 | R$ 695 | R$ 875 |
+                | 재고자산 | R$ 1,183 | R$ 1,266 | R$ 1,239 | R$ 1,455 |
+                | 기타 유동자산 | R$ 803 | R$ 966 | R$ 583 | R$ 147 |
+                | **유동자산 합계** | **R$ 6,246** | **R$ 5,807** | **R$ 3,261** | **R$ 3,862** |
+                | 유형자산(순액) | R$ 14,891 | R$ 13,224 | R$ 12,959 | R$ 12,810 |
+                | 영업권 및 무형자산 | R$ 4,717 | R$ 4,634 | R$ 4,552 | R$ 4,521 |
+                | 기타 비유동자산 | R$ 2,290 | R$ 3,085 | R$ 4,822 | R$ 5,308 |
+                | **자산 총계** | **R$ 28,145** | **R$ 26,750** | **R$ 25,594** | **R$ 26,501** |
+                | **부채 및 자본(Liabilities & Net Worth)** |
+                | 매입채무 | R$ 436 | R$ 587 | R$ 593 | R$ 637 |
+                | 미지급비용 | R$ 139 | R$ 129 | R$ 135 | R$ 111 |
+                | 단기차입금 | R$ 0 | R$ 196 | R$ 263 | R$ 153 |
+                | 유동성장기부채 | R$ 1,138 | R$ 2,777 | R$ 703 | R$ 741 |
+                | 기타 유동부채 | R$ 762 | R$ 760 | R$ 405 | R$ 445 |
+                | **유동부채 합계** | **R$ 2,475** | **R$ 4,448** | **R$ 2,099** | **R$ 2,086** |
+                | 장기차입금 | R$ 9,630 | R$ 6,801 | R$ 7,361 | R$ 8,121 |
+                | 기타 비유동부채 | R$ 869 | R$ 1,010 | R$ 1,518 | R$ 1,730 |
+                | **부채 총계** | **R$ 12,974** | **R$ 12,259** | **R$ 10,978** | **R$ 11,937** |
+                | **자본 총계** | **R$ 15,171** | **R$ 14,491** | **R$ 14,616** | **R$ 14,563** |
+                | **부채 및 자본 총계** | **R$ 28,145** | **R$ 26,750** | **R$ 25,594** | **R$ 26,501** |
+
+                ## 2. 주요 재무비율
+
+                | 재무비율 | 2012 | 2013 | 2014 | 2015년 6월 |
+                |---------|------|------|------|-----------|
+                | 유동비율(Current Ratio) | 2.52 | 1.31 | 1.55 | 1.85 |
+                | 총부채(Total Debt) | R$ 10,768 | R$ 9,773 | R$ 8,327 | R$ 9,015 |
+                | 부채비율(Debt-to-Total Capital) | 41.5% | 40.3% | 36.3% | 38.2% |
+                | 재무레버리지(Assets/Equity) | 1.86 | 1.85 | 1.75 | 1.82 |
+                | S&P 장기부채 신용등급 | BB | BB+ | BB+ | BBB- |
+                | 자산회전율(Sales/Assets) | 0.22 | 0.26 | 0.28 | 0.34 |
+                | 재고회전율(COGS/Inv.) | 4.43 | 4.25 | 4.48 | 3.87 |
+                | 평균환율(레알/USD) | 1.9550 | 2.1605 | 2.3547 | 2.6913 |
+
+                ## 3. 주요 재무 트렌드 분석
+
+                ### 자산 구조 변화
+                - **총자산**: 2012년 R$28,145백만에서 2015년 6월 R$26,501백만으로 5.8% 감소
+                - **유형자산(PP&E)**: 2012년 R$14,891백만에서 2015년 6월 R$12,810백만으로 14.0% 감소
+                - **현금 및 단기투자**: 2012년 R$3,296백만에서 2014년 R$745백만으로 급감한 후 2015년 6월 R$1,386백만으로 일부 회복
+
+                ### 부채 및 자본 구조 변화
+                - **총부채**: 2012년 R$12,974백만에서 2014년 R$10,978백만으로 감소 후 2015년 6월 R$11,937백만으로 소폭 증가
+                - **장기차입금**: 2012년 R$9,630백만에서 2013년 R$6,801백만으로 크게 감소 후 2015년 6월 R$8,121백만으로 증가 추세
+                - **자본총계**: 2012-2015년 동안 R$14,500백만~R$15,171백만 사이에서 비교적 안정적으로 유지
+
+                ### 재무비율 개선
+                - **유동비율**: 2012년 2.52에서 2013년 1.31로 하락 후 2015년 6월 1.85로 개선
+                - **부채비율**: 2012년 41.5%에서 2014년 36.3%로 감소 후 2015년 6월 38.2%로 소폭 증가
+                - **신용등급**: BB(2012)에서 BBB-(2015년 6월)로 투자적격등급으로 상승
+
+                ### 환율 영향
+                - 브라질 레알화는 2012년 1달러당 1.96레알에서 2015년 6월 2.69레알로 37.8% 평가절하
+                - 이는 달러 기반 부채를 가진 Fibria에게 부정적인 영향을 미침
+
+                ## 4. P&G의 SCF 프로그램 관점에서의 시사점
+
+                1. Fibria는 신용등급이 개선되었음에도 현금 및 단기투자 감소와 매출채권의 변동성은 유동성 관리의 중요성을 보여줌
+                2. P&G의 SCF 프로그램은 Fibria에게 다음과 같은 이점 제공:
+                   - 매출채권 조기 현금화를 통한 유동성 개선
+                   - P&G의 AA- 신용등급을 활용한 낮은 금융비용(자체 신용등급 BBB-보다 유리)
+                   - 현금흐름 예측 가능성 향상
+                   - 기존 신용한도에 영향 없이 추가 자금조달 가능
+
+                이러한 분석을 통해 Fibria가 P&G의 SCF 프로그램에 참여함으로써 재무구조 개선과 운전자본 최적화에 긍정적인 효과를 얻고 있음을 알 수 있습니다.
+                """)
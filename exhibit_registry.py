@@ -0,0 +1,217 @@
+import sys
+import time
+import logging
+import importlib
+import threading
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+from exhibit_notes import (
+    PG_INCOME_STATEMENT_NOTES,
+    PG_BALANCE_SHEET_NOTES,
+    FIBRIA_INCOME_STATEMENT_NOTES,
+    FIBRIA_BALANCE_SHEET_NOTES,
+)
+
+# 콜드 스타트(임포트 시간) 보고용 로거
+logger = logging.getLogger("png_scf.startup")
+
+# Exhibit 8(시장 금리 현황)이 사용하는 금리 데이터셋
+RATE_DATASETS = (
+    "treasury_yields_data",
+    "corporate_bond_yields_data",
+    "short_term_rates_data",
+    "scf_rate_simulation_data",
+    "ratings_comparison_data",
+    "historical_libor_data",
+)
+
+
+@dataclass(frozen=True)
+class ExhibitSpec:
+    """
+    버튼 하나(화면 하나)의 선언적 정의
+
+    StreamlitApp.render_exhibit가 이 정의만 보고 생성기 임포트/캐시, 렌더링 시간 측정,
+    디버깅 사이드바, 높이 조절, 오류 표시를 공통으로 처리합니다.
+    """
+    key: str                        # 내부 식별자 (예: "exhibit_1")
+    label: str                      # 버튼 라벨
+    module: str                     # 생성기 모듈 이름 (첫 사용 시 임포트)
+    class_name: str                 # 생성기 클래스 이름
+    title: str                      # 오류 메시지 등에 쓰이는 화면 이름
+    uses_data_provider: bool = True # 생성자에 MarketDataProvider를 전달하는지 여부
+    height: int = 3000              # iframe 기본 높이 (픽셀)
+    height_range: Tuple[int, int] = (2000, 5000)  # 디버깅 모드 높이 슬라이더 범위
+    debug_default: Optional[bool] = None          # 디버깅 체크박스 기본값 (None이면 디버깅 옵션 없음)
+    data_dependencies: Tuple[str, ...] = ()       # 디버깅 정보로 표시할 MarketDataProvider 속성/메서드 이름
+    debug_tables: Tuple[Tuple[str, str], ...] = ()  # 디버깅 모드에서 표로 표시할 (제목, 데이터 이름)
+    headers: Tuple[str, ...] = ()                 # 차트 위에 표시할 제목
+    image: Optional[Tuple[str, str]] = None       # 차트 위에 표시할 (이미지 경로, 캡션)
+    before_render: Optional[str] = None           # 차트 전에 호출할 StreamlitApp 메서드 이름
+    notes: Optional[Tuple[str, str]] = None       # 차트 아래 expander로 표시할 (제목, 마크다운)
+    extra_labels: Tuple[str, ...] = ()            # 같은 화면을 여는 추가 버튼 라벨 (label 버튼 바로 뒤에 배치)
+
+    @property
+    def labels(self) -> Tuple[str, ...]:
+        """이 화면을 여는 모든 버튼 라벨"""
+        return (self.label,) + self.extra_labels
+
+
+# 버튼 순서대로 나열한 화면 정의
+EXHIBIT_SPECS: Tuple[ExhibitSpec, ...] = (
+    ExhibitSpec(
+        "q1", "Q1", "pg_financial_component_q1", "PGFinancialComponentGeneratorQ1",
+        title="Q1 재무 컴포넌트",
+        height=1000,
+        headers=("Q1 - P&G가 2013년 4월 공급업체 지불 기간을 연장한 이유",),
+    ),
+    ExhibitSpec(
+        "q2", "Q2", "pg_scf_economics_q2", "PGSCFEconomicsQ2Generator",
+        title="Q2 SCF 경제적 효과 분석",
+        uses_data_provider=False,
+        debug_default=True,
+    ),
+    ExhibitSpec(
+        # Q3 질문과 케이스 Example(Exhibit 4)은 같은 SCF 경제성 화면 - 버튼 두 개, 렌더링/캐시는 하나
+        "q3", "Q3", "pg_scf_economics", "PGSCFEconomicsGenerator",
+        extra_labels=("Example",),
+        title="Q3 SCF 경제적 효과 분석",
+        uses_data_provider=False,
+        debug_default=True,
+        headers=(
+            "Q3: P&G가 2013년 4월에 새로운 결제 조건과 함께 SCF 프로그램을 동시에 시작한 이유는 무엇인가요?",
+            "SCF 프로그램은 어떻게 운영되며 누가 혜택을 받나요? SCF 융자 금리는 경쟁력이 있나요?",
+        ),
+        image=("static/images/SCF.png", "Operational Flows in the SCF Program"),
+    ),
+    ExhibitSpec(
+        "q4", "Q4", "pg_scf_economics_q4", "PGSCFEconomicsQ4Generator",
+        title="Q4 win-win-win 분석",
+        headers=("Q4: P&G는 SCF가 win-win-win 프로그램이라는 주장이 사실인가요? 손해를 보는 사람은 없나요?",),
+    ),
+    ExhibitSpec(
+        "q5", "Q5", "fibria_scf_analysis_component", "FibriaSCFAnalysisComponent",
+        title="Q5 Fibria SCF 분석",
+        uses_data_provider=False,
+        height=2500,
+    ),
+    ExhibitSpec(
+        "q6", "Q6", "pg_payment_cycle_q6", "PaymentCycleQ6Generator",
+        title="Q6 지불 기간 영향 분석",
+        uses_data_provider=False,
+        height=1000,
+        headers=("Q6: P&G가 A/P를 신속하게 지급해야 한다는 주장의 근거는 무엇인가요?",),
+        before_render="render_cycle_images",
+    ),
+    ExhibitSpec(
+        "exhibit_1", "Exhibit 1", "pg_financial_component", "PGFinancialComponentGenerator",
+        title="Chart.js 컴포넌트",
+        height=2500,
+        debug_default=True,
+        data_dependencies=("pg_financial_data",),
+        notes=PG_INCOME_STATEMENT_NOTES,
+    ),
+    ExhibitSpec(
+        "exhibit_2", "Exhibit 2", "pg_balance_sheet_component", "PGBalanceSheetComponentGenerator",
+        title="P&G 대차대조표 컴포넌트",
+        debug_default=True,
+        data_dependencies=("pg_balance_sheet_data", "pg_working_capital_data"),
+        notes=PG_BALANCE_SHEET_NOTES,
+    ),
+    ExhibitSpec(
+        "exhibit_3", "Exhibit 3", "pg_working_capital_component", "PGWorkingCapitalComponentGenerator",
+        title="P&G 운전자본 컴포넌트",
+        debug_default=True,
+        data_dependencies=("pg_working_capital_data",),
+        debug_tables=(("P&G 운전자본 데이터", "pg_working_capital_data"),),
+    ),
+    ExhibitSpec(
+        "exhibit_5", "Exhibit 5", "fibria_financial_component", "FibriaFinancialComponentGenerator",
+        title="Fibria 재무 분석 컴포넌트",
+        debug_default=True,
+        data_dependencies=("fibria_financial_data", "fibria_scf_impact_data", "fibria_market_data"),
+        notes=FIBRIA_INCOME_STATEMENT_NOTES,
+    ),
+    ExhibitSpec(
+        "exhibit_6", "Exhibit 6", "fibria_balance_sheet_component", "FibriaBalanceSheetComponentGenerator",
+        title="Fibria 대차대조표 분석 컴포넌트",
+        debug_default=True,
+        data_dependencies=("fibria_balance_sheet_data", "fibria_working_capital_data", "fibria_scf_analysis_data"),
+        notes=FIBRIA_BALANCE_SHEET_NOTES,
+    ),
+    ExhibitSpec(
+        "exhibit_7", "Exhibit 7", "fibria_working_capital_chart_component", "FibriaWorkingCapitalComponentGenerator",
+        title="Fibria 운전자본 분석 컴포넌트",
+        debug_default=True,
+        data_dependencies=("get_working_capital_data", "get_scf_impact_data", "get_working_capital_need_data"),
+        debug_tables=(
+            ("Fibria 운전자본 데이터", "get_working_capital_data"),
+            ("SCF 영향 데이터", "get_scf_impact_data"),
+            ("운전자본 필요량 데이터", "get_working_capital_need_data"),
+        ),
+    ),
+    ExhibitSpec(
+        "exhibit_8", "Exhibit 8", "react_component", "ReactComponentGenerator",
+        title="시장 금리 컴포넌트",
+        height=800,
+        height_range=(500, 2000),
+        debug_default=False,
+        data_dependencies=RATE_DATASETS,
+    ),
+    ExhibitSpec(
+        "scf_sensitivity", "Sensitivity", "scf_sensitivity_component", "SCFSensitivityComponentGenerator",
+        title="SCF 할인율 민감도 분석",
+        height=750,
+        height_range=(500, 1500),
+        debug_default=False,
+        data_dependencies=("scf_rate_simulation_data",),
+    ),
+)
+SPECS_BY_KEY: Dict[str, ExhibitSpec] = {spec.key: spec for spec in EXHIBIT_SPECS}
+
+_import_times: Dict[str, float] = {}
+_import_lock = threading.Lock()
+
+
+def record_import(name: str, seconds: float) -> None:
+    """임포트 소요 시간 기록 (같은 이름은 처음 기록만 유지)"""
+    with _import_lock:
+        _import_times.setdefault(name, seconds)
+    logger.info("%s 임포트: %.1f ms", name, seconds * 1000)
+
+
+def import_module(module_name: str):
+    """모듈을 처음 사용할 때 임포트하고 소요 시간을 기록"""
+    module = sys.modules.get(module_name)
+    if module is not None:
+        return module
+    with _import_lock:
+        # 다른 스레드가 먼저 임포트했을 수 있으므로 다시 확인
+        module = sys.modules.get(module_name)
+        if module is not None:
+            return module
+        start = time.perf_counter()
+        module = importlib.import_module(module_name)
+        elapsed = time.perf_counter() - start
+    record_import(module_name, elapsed)
+    return module
+
+
+def load_generator_class(key: str) -> type:
+    """버튼 키에 해당하는 생성기 클래스 반환 (모듈은 첫 호출 시 임포트)"""
+    spec = SPECS_BY_KEY[key]
+    return getattr(import_module(spec.module), spec.class_name)
+
+
+def import_report() -> List[Tuple[str, float]]:
+    """
+    지금까지 기록된 임포트 시간 보고서
+
+    Returns:
+        List[Tuple[str, float]]: (모듈 이름, 밀리초) 목록 - 오래 걸린 순서
+            첫 번째 생성기 모듈 시간에는 data_provider/pandas 같은 공통 의존성 임포트가 포함됨
+    """
+    with _import_lock:
+        items = list(_import_times.items())
+    return sorted(((name, seconds * 1000) for name, seconds in items), key=lambda item: item[1], reverse=True)
@@ -1,9 +1,14 @@
-import json
 from data_provider import MarketDataProvider
+from html_cache import memoize_html
+from instrumentation import instrument_render
+from lazy_charts import with_lazy_charts
+from template_engine import CompiledTemplate, placeholder_values
 
 class FibriaFinancialComponentGenerator:
     """피브리아 재무 분석을 위한 Chart.js HTML 컴포넌트를 생성하는 클래스"""
     
+    lazy_charts = True  # 차트 5개
+    
     def __init__(self, data_provider: MarketDataProvider):
         """
         Args:
@@ -11,10 +16,19 @@ class FibriaFinancialComponentGenerator:
         """
         self.data_provider = data_provider
     
+    def _cache_inputs(self):
+        """HTML 캐시 키 계산에 사용되는 입력 데이터 반환"""
+        return [
+            self.data_provider.fibria_financial_data,
+            self.data_provider.fibria_scf_impact_data,
+            self.data_provider.fibria_market_data
+        ]
+    
+    @instrument_render
+    @with_lazy_charts
+    @memoize_html
     def generate_html(self) -> str:
         """Chart.js를 사용한 HTML 코드를 생성하여 반환"""
-        html_template = self._get_html_template()
-        
         # 데이터 딕셔너리 생성
         data_dict = {
             'fibriaFinancialData': self.data_provider.fibria_financial_data,
@@ -23,24 +37,10 @@ class FibriaFinancialComponentGenerator:
         }
         
         # JSON 데이터를 HTML에 삽입
-        for key, value in data_dict.items():
-            placeholder = f"{key.upper()}_PLACEHOLDER"
-            
-            try:
-                json_data = json.dumps(value, ensure_ascii=False)
-            except Exception as e:
-                print(f"JSON 직렬화 오류 ({key}): {e}")
-                json_data = "[]"
-            
-            if placeholder in html_template:
-                html_template = html_template.replace(placeholder, json_data)
-                print(f"플레이스홀더 {placeholder} 치환 완료")
-            else:
-                print(f"경고: 플레이스홀더 {placeholder}를 찾을 수 없음")
-        
-        return html_template
+        return _COMPILED_TEMPLATE.render_json(placeholder_values(data_dict), ensure_ascii=False)
     
-    def _get_html_template(self) -> str:
+    @staticmethod
+    def _get_html_template() -> str:
         """Fibria 재무 분석 HTML 템플릿 반환"""
         return """
         <!DOCTYPE html>
@@ -524,4 +524,8 @@ class FibriaFinancialComponentGenerator:
             </script>
         </body>
         </html>
-        """ 
\ No newline at end of file
+        """ 
+
+
+# 템플릿은 모듈 임포트 시점에 한 번만 토큰화
+_COMPILED_TEMPLATE = CompiledTemplate(FibriaFinancialComponentGenerator._get_html_template())
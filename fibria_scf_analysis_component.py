@@ -1,10 +1,19 @@
-import streamlit as st
-import pandas as pd
-import plotly.graph_objects as go
-import plotly.express as px
+from html_cache import memoize_html
+from instrumentation import instrument_render
+from scf_monte_carlo import FibriaSimulationParams, PERCENTILES, simulate_financing_cost
 
 class FibriaSCFAnalysisComponent:
-    def __init__(self):
+    def __init__(self, simulation_params: FibriaSimulationParams = FibriaSimulationParams(),
+                 simulation_paths: int = 100_000, simulation_seed: int = 2015):
+        """
+        Args:
+            simulation_params: 금융 비용 몬테카를로 가정
+            simulation_paths: 시뮬레이션 경로 수
+            simulation_seed: 난수 시드 (같은 시드는 항상 같은 분포)
+        """
+        self.simulation_params = simulation_params
+        self.simulation_paths = simulation_paths
+        self.simulation_seed = simulation_seed
         self.exchange_rate_data = [
             {'year': '2012', 'rate': 1.96},
             {'year': '2013', 'rate': 2.16},
@@ -27,6 +36,56 @@ class FibriaSCFAnalysisComponent:
             {'rating': 'BB', 'rate': 2.80}
         ]
 
+    def _cache_inputs(self):
+        """HTML 캐시 키 계산에 사용되는 입력 데이터 반환"""
+        return [self.exchange_rate_data, self.currency_loss_data, self.credit_rate_data,
+                self.simulation_params, self.simulation_paths, self.simulation_seed]
+
+    def _simulation_section(self) -> str:
+        """몬테카를로 금융 비용 분포 요약 섹션 HTML (백분위수만 포함하므로 크기가 작음)"""
+        summary = simulate_financing_cost(self.simulation_params, self.simulation_paths, self.simulation_seed)
+        params = self.simulation_params
+        series = [
+            ("withoutSCF", "SCF 미사용", f"LIBOR + {params.own_spread:.2f}%, 실제 지급일까지 자체 조달"),
+            ("withSCF", "SCF 사용", f"LIBOR + {params.scf_spread:.2f}%, {params.early_payment_day}일 후 은행 지급"),
+            ("savings", "비용 절감액", f"SCF가 더 저렴한 경로 {summary['probSCFCheaper'] * 100:.1f}%"),
+        ]
+        cards = "".join(f"""
+                    <div class="p-3 bg-blue-50 rounded">
+                        <p class="font-semibold text-blue-800 mb-1">{label}</p>
+                        <p class="text-2xl font-bold">${summary[key]['p50']:,.1f}M</p>
+                        <p class="text-sm text-gray-600">중앙값 · 90% 구간 ${summary[key]['p5']:,.1f}M ~ ${summary[key]['p95']:,.1f}M</p>
+                        <p class="text-xs text-gray-500 mt-1">{note}</p>
+                    </div>""" for key, label, note in series)
+        header = "".join(f'<th class="py-2 px-3 text-right">P{p}</th>' for p in PERCENTILES)
+        rows = "".join(
+            f'<tr class="border-b"><td class="py-2 px-3 text-left">{label}</td>'
+            + "".join(f'<td class="py-2 px-3 text-right">{summary[key][f"p{p}"]:,.2f}</td>' for p in PERCENTILES)
+            + f'<td class="py-2 px-3 text-right">{summary[key]["mean"]:,.2f}</td></tr>'
+            for key, label, _ in series
+        )
+        return f"""
+            <!-- 몬테카를로 금융 비용 분포 -->
+            <div class="bg-white rounded-lg shadow-lg p-6">
+                <h3 class="text-lg font-semibold mb-2 text-gray-800">금융 비용 분포 (몬테카를로 {summary['paths']:,}개 경로)</h3>
+                <p class="text-sm text-gray-600 mb-4">
+                    연 매출 ${params.annual_sales_usd:,.0f}M 기준, LIBOR(현재 {params.libor:.2f}%, 변동성 {params.libor_vol:.2f}%p)와
+                    헤알/달러 환율(현재 {params.brl_usd:.4f}, 변동성 {params.brl_vol * 100:.0f}%), P&G 지급 지연(평균 {params.delay_mean_days:.0f}일)을 시뮬레이션한 연간 금융 비용
+                </p>
+                <div class="grid grid-cols-1 md:grid-cols-3 gap-4 mb-4">{cards}
+                </div>
+                <table class="w-full text-sm">
+                    <thead><tr class="border-b"><th class="py-2 px-3 text-left">백만 달러</th>{header}<th class="py-2 px-3 text-right">평균</th></tr></thead>
+                    <tbody>{rows}</tbody>
+                </table>
+                <p class="text-xs text-gray-500 mt-2">
+                    헤알 환산 중앙값: SCF 미사용 R${summary['withoutSCFBRL']['p50']:,.1f}M, SCF 사용 R${summary['withSCFBRL']['p50']:,.1f}M (시드 {summary['seed']})
+                </p>
+            </div>
+"""
+    
+    @instrument_render
+    @memoize_html
     def generate_html(self):
         """React 컴포넌트를 위한 HTML 코드 생성"""
         html = f"""
@@ -234,7 +293,7 @@ class FibriaSCFAnalysisComponent:
                     </div>
                 </div>
             </div>
-
+{self._simulation_section()}
             <!-- 결론 섹션 -->
             <div class="bg-gradient-to-r from-blue-500 to-purple-500 rounded-lg shadow-lg p-6 text-white">
                 <h2 class="text-xl font-bold mb-4">결론: Fibria는 SCF 프로그램을 계속 사용해야 합니다</h2>
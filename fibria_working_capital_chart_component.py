@@ -1,13 +1,31 @@
 import json
 from data_provider import MarketDataProvider
+from html_cache import memoize_html
+from instrumentation import instrument_render
+from lazy_charts import with_lazy_charts
+from template_engine import to_columnar
 
 class FibriaWorkingCapitalComponentGenerator:
     """피브리아 운전자본 분석 컴포넌트 생성기"""
     
+    lazy_charts = True  # 차트 8개 - 대부분 첫 화면 아래에 있음
+    
     def __init__(self, data_provider):
         """초기화"""
         self.data_provider = data_provider
     
+    def _cache_inputs(self):
+        """HTML 캐시 키 계산에 사용되는 입력 데이터 반환"""
+        return [
+            self.data_provider.get_working_capital_data(),
+            self.data_provider.get_scf_impact_data(),
+            self.data_provider.get_working_capital_need_data(),
+            self.data_provider.get_financial_crisis_periods()
+        ]
+    
+    @instrument_render
+    @with_lazy_charts
+    @memoize_html
     def generate_html(self):
         """Chart.js를 사용한 HTML 코드 생성"""
         
@@ -354,10 +372,10 @@ class FibriaWorkingCapitalComponentGenerator:
     
     def _generate_chart_js_code(self, working_capital_data, scf_impact_data, working_capital_need_data, financial_crisis_periods):
         """Chart.js 코드 생성"""
-        # 데이터를 JSON 문자열로 변환
-        working_capital_data_json = json.dumps(working_capital_data)
-        scf_impact_data_json = json.dumps(scf_impact_data)
-        working_capital_need_data_json = json.dumps(working_capital_need_data)
+        # 데이터를 JSON 문자열로 변환 - 차트 계열은 열 형식({필드: [값...]})으로 삽입
+        working_capital_data_json = json.dumps(to_columnar(working_capital_data))
+        scf_impact_data_json = json.dumps(to_columnar(scf_impact_data))
+        working_capital_need_data_json = json.dumps(to_columnar(working_capital_need_data))
         financial_crisis_periods_json = json.dumps(financial_crisis_periods)
         
         # Chart.js 코드
@@ -385,11 +403,11 @@ class FibriaWorkingCapitalComponentGenerator:
         new Chart(cccTrendCtx, {{
             type: 'line',
             data: {{
-                labels: workingCapitalData.map(d => d.year),
+                labels: workingCapitalData.year,
                 datasets: [
                     {{
                         label: '현금전환주기(CCC)',
-                        data: workingCapitalData.map(d => d.ccc),
+                        data: workingCapitalData.ccc,
                         borderColor: colors.ccc,
                         borderWidth: 3,
                         fill: false,
@@ -397,7 +415,7 @@ class FibriaWorkingCapitalComponentGenerator:
                     }},
                     {{
                         label: '매출채권회수기간(DSO)',
-                        data: workingCapitalData.map(d => d.dso),
+                        data: workingCapitalData.dso,
                         borderColor: colors.dso,
                         borderWidth: 2,
                         fill: false,
@@ -405,7 +423,7 @@ class FibriaWorkingCapitalComponentGenerator:
                     }},
                     {{
                         label: '재고자산회전기간(DSI)',
-                        data: workingCapitalData.map(d => d.dsi),
+                        data: workingCapitalData.dsi,
                         borderColor: colors.dsi,
                         borderWidth: 2,
                         borderDash: [5, 5],
@@ -414,7 +432,7 @@ class FibriaWorkingCapitalComponentGenerator:
                     }},
                     {{
                         label: '매입채무지급기간(DPO)',
-                        data: workingCapitalData.map(d => d.dpo),
+                        data: workingCapitalData.dpo,
                         borderColor: colors.dpo,
                         borderWidth: 1,
                         borderDash: [2, 2],
@@ -427,14 +445,14 @@ class FibriaWorkingCapitalComponentGenerator:
                 plugins: {{
                     annotation: {{
                         annotations: financialCrisisPeriods.map((period, index) => {{
-                            const startIndex = workingCapitalData.findIndex(d => d.year === period.startYear);
-                            const endIndex = workingCapitalData.findIndex(d => d.year === period.endYear);
+                            const startIndex = workingCapitalData.year.indexOf(period.startYear);
+                            const endIndex = workingCapitalData.year.indexOf(period.endYear);
                             
                             return {{
                                 type: 'box',
                                 xMin: startIndex - 0.0,
                                 xMax: period.event === '금융위기' ?
-                                    endIndex + 0.5 : workingCapitalData.length,
+                                    endIndex + 0.5 : workingCapitalData.year.length,
                                 backgroundColor: period.event === '금융위기' ? 
                                     'rgba(255, 0, 0, 0.1)' : 'rgba(0, 128, 0, 0.1)',
                                 borderWidth: 0
@@ -465,11 +483,11 @@ class FibriaWorkingCapitalComponentGenerator:
         new Chart(componentsCtx, {{
             type: 'line',
             data: {{
-                labels: workingCapitalData.map(d => d.year),
+                labels: workingCapitalData.year,
                 datasets: [
                     {{
                         label: '매출채권회수기간(DSO)',
-                        data: workingCapitalData.map(d => d.dso),
+                        data: workingCapitalData.dso,
                         borderColor: colors.dso,
                         borderWidth: 2,
                         tension: 0.3,
@@ -477,7 +495,7 @@ class FibriaWorkingCapitalComponentGenerator:
                     }},
                     {{
                         label: '재고자산회전기간(DSI)',
-                        data: workingCapitalData.map(d => d.dsi),
+                        data: workingCapitalData.dsi,
                         borderColor: colors.dsi,
                         borderWidth: 2,
                         borderDash: [5, 5],
@@ -486,7 +504,7 @@ class FibriaWorkingCapitalComponentGenerator:
                     }},
                     {{
                         label: '매입채무지급기간(DPO)',
-                        data: workingCapitalData.map(d => d.dpo),
+                        data: workingCapitalData.dpo,
                         borderColor: colors.dpo,
                         borderWidth: 1,
                         borderDash: [2, 2],
@@ -515,14 +533,14 @@ class FibriaWorkingCapitalComponentGenerator:
         }});
         
         // 3. SCF 프로그램 도입 전후 비교 (2012 vs 2014)
-        const data2012 = workingCapitalData.find(d => d.year === '2012');
-        const data2014 = workingCapitalData.find(d => d.year === '2014');
+        const index2012 = workingCapitalData.year.indexOf('2012');
+        const index2014 = workingCapitalData.year.indexOf('2014');
         
         const comparisonData = [
-            {{ category: 'DSO', before: data2012.dso, after: data2014.dso }},
-            {{ category: 'DSI', before: data2012.dsi, after: data2014.dsi }},
-            {{ category: 'DPO', before: data2012.dpo, after: data2014.dpo }},
-            {{ category: 'CCC', before: data2012.ccc, after: data2014.ccc }}
+            {{ category: 'DSO', before: workingCapitalData.dso[index2012], after: workingCapitalData.dso[index2014] }},
+            {{ category: 'DSI', before: workingCapitalData.dsi[index2012], after: workingCapitalData.dsi[index2014] }},
+            {{ category: 'DPO', before: workingCapitalData.dpo[index2012], after: workingCapitalData.dpo[index2014] }},
+            {{ category: 'CCC', before: workingCapitalData.ccc[index2012], after: workingCapitalData.ccc[index2014] }}
         ];
         
         // 3.1. 변화 비교 차트
@@ -615,10 +633,10 @@ class FibriaWorkingCapitalComponentGenerator:
         new Chart(scfImpactCycleCtx, {{
             type: 'bar',
             data: {{
-                labels: scfImpactData.map(d => d.scenario),
+                labels: scfImpactData.scenario,
                 datasets: [{{
                     label: '현금전환주기 (일)',
-                    data: scfImpactData.map(d => d.cashCycle),
+                    data: scfImpactData.cashCycle,
                     backgroundColor: 'rgba(136, 132, 216, 0.7)'
                 }}]
             }},
@@ -651,10 +669,10 @@ class FibriaWorkingCapitalComponentGenerator:
         new Chart(scfImpactCapitalCtx, {{
             type: 'bar',
             data: {{
-                labels: scfImpactData.map(d => d.scenario),
+                labels: scfImpactData.scenario,
                 datasets: [{{
                     label: '필요 운전자본 (백만 달러)',
-                    data: scfImpactData.map(d => d.cashNeeded),
+                    data: scfImpactData.cashNeeded,
                     backgroundColor: 'rgba(130, 202, 157, 0.7)'
                 }}]
             }},
@@ -687,16 +705,16 @@ class FibriaWorkingCapitalComponentGenerator:
         new Chart(workingCapitalBurdenCtx, {{
             type: 'bar',
             data: {{
-                labels: workingCapitalNeedData.map(d => d.year),
+                labels: workingCapitalNeedData.year,
                 datasets: [
                     {{
                         label: 'SCF 없는 경우 필요 운전자본',
-                        data: workingCapitalNeedData.map(d => d.withoutSCF),
+                        data: workingCapitalNeedData.withoutSCF,
                         backgroundColor: colors.withoutSCF
                     }},
                     {{
                         label: 'SCF 활용 시 필요 운전자본',
-                        data: workingCapitalNeedData.map(d => d.withSCF),
+                        data: workingCapitalNeedData.withSCF,
                         backgroundColor: colors.withSCF
                     }}
                 ]
@@ -1,14 +1,46 @@
 # HTML을 파일로 저장하여 테스트하는 코드
+import argparse
 from react_component import ReactComponentGenerator
 from data_provider import MarketDataProvider
+from assets import localize_html
+from html_minify import minify_html
+from site_export import export_site
 
-# 데이터 및 HTML 생성
-data_provider = MarketDataProvider()
-generator = ReactComponentGenerator(data_provider)
-html_code = generator.generate_html()
 
-# HTML 파일로 저장
-with open("test_chart.html", "w", encoding="utf-8") as f:
-    f.write(html_code)
+def main():
+    parser = argparse.ArgumentParser(description="시장 금리 분석 HTML 파일 생성")
+    parser.add_argument("--output", default="test_chart.html", help="저장할 HTML 파일 경로")
+    parser.add_argument("--inline", action="store_true",
+                        help="벤더링된 차트 라이브러리를 HTML에 직접 포함 (네트워크 없이 열람 가능)")
+    parser.add_argument("--export", metavar="DIR",
+                        help="모든 Q/Exhibit 화면을 정적 사이트(공유 자산 분리, .gz/.br 사전 압축)로 DIR에 내보내기")
+    parser.add_argument("--workers", type=int, default=None, help="--export 프로세스 수 (기본값: CPU 수)")
+    parser.add_argument("--full", action="store_true",
+                        help="--export 시 매니페스트를 무시하고 모든 화면을 다시 렌더링 (기본값: 입력이 바뀐 화면만)")
+    parser.add_argument("--minify", action="store_true",
+                        help="들여쓰기/주석을 제거한 HTML 저장 (인라인 JSON 데이터 블록은 그대로)")
+    args = parser.parse_args()
 
-print("HTML 파일이 생성되었습니다. 브라우저에서 직접 열어보세요.")
\ No newline at end of file
+    if args.export:
+        report = export_site(args.export, max_workers=args.workers, full=args.full, minify=args.minify)
+        print(report.summary())
+        return
+
+    # 데이터 및 HTML 생성
+    data_provider = MarketDataProvider()
+    generator = ReactComponentGenerator(data_provider)
+    html_code = generator.generate_html()
+    if args.minify:
+        html_code = minify_html(html_code)
+    html_code = localize_html(html_code, "inline" if args.inline else "cdn")
+
+    # HTML 파일로 저장
+    with open(args.output, "w", encoding="utf-8") as f:
+        f.write(html_code)
+
+    print("HTML 파일이 생성되었습니다. 브라우저에서 직접 열어보세요.")
+
+
+# 작업 프로세스(spawn)가 이 모듈을 다시 임포트할 때 내보내기가 재귀 실행되지 않도록 보호
+if __name__ == "__main__":
+    main()
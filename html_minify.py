@@ -0,0 +1,300 @@
+import re
+import argparse
+from dataclasses import dataclass
+from typing import List, Optional, Tuple
+
+from html_cache import cached_stage
+
+# 내용을 그대로 보존해야 하는 원시 텍스트 요소 - 스크립트/스타일은 종류별로 따로 처리
+_RAW_ELEMENT = re.compile(r"<(script|style|pre|textarea)\b([^>]*)>(.*?)</\1\s*>", re.S | re.I)
+_TYPE_ATTR = re.compile(r"""\btype\s*=\s*["']?([^"'\s>]+)""", re.I)
+# 조건부 주석(<!--[if ...]>)은 남김
+_HTML_COMMENT = re.compile(r"<!--(?!\[if).*?-->", re.S)
+_NEWLINE_RUN = re.compile(r"[ \t]*(?:\r?\n[ \t]*)+")
+
+# 최소화하는 스크립트 type (그 외 application/json, text/babel 등 데이터/비표준 블록은 그대로 둠)
+JS_TYPES = frozenset({"", "text/javascript", "application/javascript", "module"})
+
+# 이 문자 뒤에 오는 /는 나눗셈이 아니라 정규식 리터럴의 시작
+_REGEX_PREFIX_CHARS = set("(,=:[!&|?{};+-*%<>~^")
+_REGEX_PREFIX_WORDS = frozenset({
+    "return", "typeof", "case", "do", "else", "in", "of", "new", "delete", "void", "throw", "instanceof", "yield", "await",
+})
+# 줄바꿈을 지워도 ASI(자동 세미콜론 삽입) 결과가 달라지지 않는 앞/뒤 문자
+_NEWLINE_DROP_BEFORE = set("{;,([")
+_NEWLINE_DROP_AFTER = set(")]},;")
+
+
+@dataclass(frozen=True)
+class MinifyStats:
+    """최소화 전후 크기 (UTF-8 바이트)"""
+    original_bytes: int
+    minified_bytes: int
+
+    @property
+    def saved_bytes(self) -> int:
+        return self.original_bytes - self.minified_bytes
+
+    @property
+    def saved_ratio(self) -> float:
+        return self.saved_bytes / self.original_bytes if self.original_bytes else 0.0
+
+
+def _is_word(char: str) -> bool:
+    return char.isalnum() or char in "_$\\." or ord(char) > 127
+
+
+def _skip_string(code: str, i: int) -> int:
+    """따옴표 문자열의 끝 다음 위치"""
+    quote = code[i]
+    i += 1
+    while i < len(code):
+        if code[i] == "\\":
+            i += 2
+            continue
+        if code[i] == quote or code[i] == "\n":
+            return i + 1
+        i += 1
+    return i
+
+
+def _skip_template(code: str, i: int) -> int:
+    """템플릿 리터럴(`...${...}...`)의 끝 다음 위치 - 안의 식(${})은 중첩 괄호를 따라감"""
+    i += 1
+    while i < len(code):
+        char = code[i]
+        if char == "\\":
+            i += 2
+            continue
+        if char == "`":
+            return i + 1
+        if char == "$" and code.startswith("{", i + 1):
+            i = _skip_braces(code, i + 2)
+            continue
+        i += 1
+    return i
+
+
+def _skip_braces(code: str, i: int) -> int:
+    """여는 중괄호 바로 다음 위치에서 시작해 짝이 맞는 닫는 중괄호 다음 위치 반환"""
+    depth = 1
+    while i < len(code):
+        char = code[i]
+        if char in "'\"":
+            i = _skip_string(code, i)
+            continue
+        if char == "`":
+            i = _skip_template(code, i)
+            continue
+        if char == "{":
+            depth += 1
+        elif char == "}":
+            depth -= 1
+            if depth == 0:
+                return i + 1
+        i += 1
+    return i
+
+
+def _skip_regex(code: str, i: int) -> int:
+    """정규식 리터럴(/.../flags)의 끝 다음 위치 - 문자 클래스 안의 /는 끝으로 보지 않음"""
+    i += 1
+    in_class = False
+    while i < len(code) and code[i] != "\n":
+        char = code[i]
+        if char == "\\":
+            i += 2
+            continue
+        if char == "[":
+            in_class = True
+        elif char == "]":
+            in_class = False
+        elif char == "/" and not in_class:
+            i += 1
+            while i < len(code) and _is_word(code[i]) and code[i] != ".":
+                i += 1
+            return i
+        i += 1
+    return i
+
+
+def minify_js(code: str) -> str:
+    """
+    인라인 JavaScript의 주석과 들여쓰기 제거
+
+    문자열/템플릿 리터럴/정규식 리터럴은 그대로 복사하고, 토큰 사이 공백은 꼭 필요한 경우에만
+    공백 하나로 남깁니다. 줄바꿈은 ASI 결과가 달라지지 않는 것이 확실한 위치에서만 지우므로
+    세미콜론을 생략한 코드도 의미가 바뀌지 않습니다. 이름 변경 등 구조 변환은 하지 않습니다.
+    """
+    out: List[str] = []
+    last = ""            # 마지막으로 출력한 공백 아닌 문자
+    last_word = ""       # 마지막으로 출력한 식별자/키워드
+    pending = ""         # 보류 중인 공백 ("", " ", "\n")
+    i, n = 0, len(code)
+
+    def emit(token: str, word: str = ""):
+        nonlocal last, last_word, pending
+        first = token[0]
+        if pending == "\n" and last and not (last in _NEWLINE_DROP_BEFORE or first in _NEWLINE_DROP_AFTER):
+            out.append("\n")
+        elif pending and last and (
+            (_is_word(last) and _is_word(first)) or (last in "+-" and first in "+-") or (last == "/" and first == "/")
+        ):
+            out.append(" ")
+        out.append(token)
+        last, last_word, pending = token[-1], word, ""
+
+    while i < n:
+        char = code[i]
+        if char in " \t\r\n\f\v":
+            if char == "\n" or pending == "\n":
+                pending = "\n"
+            else:
+                pending = pending or " "
+            i += 1
+        elif char == "/" and code.startswith("/", i + 1):
+            end = code.find("\n", i)
+            i = n if end == -1 else end
+        elif char == "/" and code.startswith("*", i + 1):
+            end = code.find("*/", i + 2)
+            end = n if end == -1 else end + 2
+            pending = "\n" if "\n" in code[i:end] or pending == "\n" else (pending or " ")
+            i = end
+        elif char in "'\"":
+            end = _skip_string(code, i)
+            emit(code[i:end])
+            i = end
+        elif char == "`":
+            end = _skip_template(code, i)
+            emit(code[i:end])
+            i = end
+        elif char == "/" and (not last or last in _REGEX_PREFIX_CHARS or last_word in _REGEX_PREFIX_WORDS):
+            end = _skip_regex(code, i)
+            emit(code[i:end])
+            i = end
+        elif _is_word(char) and char != ".":
+            end = i + 1
+            while end < n and _is_word(code[end]) and code[end] != "\\":
+                end += 1
+            emit(code[i:end], code[i:end])
+            i = end
+        else:
+            emit(char)
+            i += 1
+    return "".join(out)
+
+
+def minify_css(css: str) -> str:
+    """
+    인라인 CSS의 주석과 불필요한 공백 제거
+
+    문자열은 그대로 두고, 공백은 { } ; , 주변과 닫는 중괄호 앞의 마지막 세미콜론만 지웁니다.
+    선택자의 : 앞 공백(자손 결합자)이나 calc()의 + - 주변 공백처럼 의미 있는 공백은 유지합니다.
+    """
+    out: List[str] = []
+    i, n = 0, len(css)
+    pending = False
+    while i < n:
+        char = css[i]
+        if char.isspace():
+            pending = True
+            i += 1
+        elif css.startswith("/*", i):
+            end = css.find("*/", i + 2)
+            i = n if end == -1 else end + 2
+            pending = True
+        elif char in "'\"":
+            end = _skip_string(css, i)
+            if pending and out and out[-1][-1] not in "{};,":
+                out.append(" ")
+            out.append(css[i:end])
+            pending = False
+            i = end
+        else:
+            if char in "{};,":
+                pending = False
+            if char == "}" and out and out[-1] == ";":
+                out.pop()
+            if pending and out and out[-1][-1] not in "{};,":
+                out.append(" ")
+            out.append(char)
+            pending = False
+            i += 1
+    return "".join(out)
+
+
+def _minify_markup(text: str) -> str:
+    """태그/본문 부분 - 주석 제거, 줄바꿈과 들여쓰기를 줄바꿈 하나로 축약 (한 줄 안의 공백은 유지)"""
+    return _NEWLINE_RUN.sub("\n", _HTML_COMMENT.sub("", text))
+
+
+def _minify_element(match: "re.Match") -> str:
+    tag, attrs, body = match.group(1), match.group(2), match.group(3)
+    name = tag.lower()
+    if name == "script":
+        type_match = _TYPE_ATTR.search(attrs)
+        script_type = type_match.group(1).lower() if type_match else ""
+        if script_type in JS_TYPES and body.strip():
+            body = minify_js(body)
+    elif name == "style":
+        body = minify_css(body)
+    return f"<{tag}{attrs}>{body}</{tag}>"
+
+
+@cached_stage("minify")
+def minify_html(html: str) -> str:
+    """
+    생성기 HTML 최소화 (선택적 후처리 단계)
+
+    - 태그 사이 줄바꿈/들여쓰기와 HTML 주석 제거 (<pre>/<textarea> 내용은 그대로)
+    - <style> 블록: minify_css
+    - <script> 블록: JavaScript이면 minify_js, application/json 등 데이터 블록은 한 글자도 바꾸지 않음
+
+    Args:
+        html: 생성기가 만든 HTML
+
+    Returns:
+        str: 최소화된 HTML (같은 입력은 html_cache에 저장된 결과 재사용)
+    """
+    parts = []
+    position = 0
+    for match in _RAW_ELEMENT.finditer(html):
+        parts.append(_minify_markup(html[position:match.start()]))
+        if match.group(1).lower() in ("pre", "textarea"):
+            parts.append(match.group(0))
+        else:
+            parts.append(_minify_element(match))
+        position = match.end()
+    parts.append(_minify_markup(html[position:]))
+    return "".join(parts).strip() + "\n"
+
+
+def minify_stats(html: str, minified: Optional[str] = None) -> MinifyStats:
+    """최소화 전후 바이트 수 (minified가 없으면 minify_html로 계산)"""
+    minified = minify_html(html) if minified is None else minified
+    return MinifyStats(len(html.encode("utf-8")), len(minified.encode("utf-8")))
+
+
+def exhibit_report() -> List[Tuple[str, MinifyStats]]:
+    """모든 화면을 렌더링하여 화면별 최소화 결과 반환 (화면 라벨, 통계)"""
+    from exhibit_registry import EXHIBIT_SPECS
+    from warmup import default_generator_factory
+
+    create_generator = default_generator_factory()
+    return [(" / ".join(spec.labels), minify_stats(create_generator(spec.key).generate_html())) for spec in EXHIBIT_SPECS]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="생성기 HTML 최소화 보고서")
+    parser.parse_args()
+    rows = exhibit_report()
+    for label, stats in rows:
+        print(f"{label:<12} {stats.original_bytes:>9,} -> {stats.minified_bytes:>9,} 바이트 "
+              f"(-{stats.saved_bytes:,}, {stats.saved_ratio:.1%})")
+    original = sum(stats.original_bytes for _, stats in rows)
+    saved = sum(stats.saved_bytes for _, stats in rows)
+    print(f"{'합계':<12} {original:>9,} -> {original - saved:>9,} 바이트 (-{saved:,}, {saved / original:.1%})")
+
+
+if __name__ == "__main__":
+    main()
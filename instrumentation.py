@@ -0,0 +1,89 @@
+import time
+import logging
+import functools
+import threading
+import contextvars
+from collections import Counter
+from typing import Callable, Dict, Optional
+
+# 렌더링 계측 전용 로거 - 기본 레벨(WARNING)에서는 아무것도 기록하지 않음
+logger = logging.getLogger("png_scf.render")
+
+_enabled = False
+_current_generator: contextvars.ContextVar = contextvars.ContextVar("current_generator", default=None)
+
+
+def enable_instrumentation(enabled: bool = True) -> None:
+    """계측을 명시적으로 켜거나 끔 (로거 레벨을 DEBUG로 설정해도 켜짐)"""
+    global _enabled
+    _enabled = enabled
+
+
+def is_enabled() -> bool:
+    """계측 활성화 여부 반환"""
+    return _enabled or logger.isEnabledFor(logging.DEBUG)
+
+
+class RenderMetrics:
+    """생성기별 렌더링 카운터 모음 (스레드 안전)"""
+
+    def __init__(self):
+        self._counters: Dict[str, Counter] = {}
+        self._lock = threading.Lock()
+
+    def add(self, generator: str, **counts: int) -> None:
+        """생성기의 카운터 값 누적"""
+        with self._lock:
+            self._counters.setdefault(generator, Counter()).update(counts)
+
+    def snapshot(self) -> Dict[str, Dict[str, int]]:
+        """현재 카운터 복사본 반환"""
+        with self._lock:
+            return {name: dict(counter) for name, counter in self._counters.items()}
+
+    def reset(self) -> None:
+        """모든 카운터 초기화"""
+        with self._lock:
+            self._counters.clear()
+
+
+# 프로세스 단위 계측 카운터
+render_metrics = RenderMetrics()
+
+
+def current_generator() -> Optional[str]:
+    """현재 렌더링 중인 생성기 이름 반환 (계측이 꺼져 있거나 렌더링 중이 아니면 None)"""
+    return _current_generator.get()
+
+
+def record(**counts: int) -> None:
+    """현재 렌더링 중인 생성기에 카운터 값 누적 (계측이 꺼져 있으면 아무것도 하지 않음)"""
+    generator = _current_generator.get()
+    if generator is not None:
+        render_metrics.add(generator, **counts)
+
+
+def instrument_render(method: Callable[..., str]) -> Callable[..., str]:
+    """
+    generate_html 메서드용 계측 데코레이터
+
+    계측이 켜져 있을 때만 호출 횟수, 소요 시간(마이크로초), 출력 크기(바이트),
+    플레이스홀더 적중/누락 횟수를 생성기 이름별 카운터로 기록합니다.
+    """
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        if not is_enabled():
+            return method(self, *args, **kwargs)
+        generator = type(self).__qualname__
+        token = _current_generator.set(generator)
+        start = time.perf_counter()
+        try:
+            html = method(self, *args, **kwargs)
+        finally:
+            _current_generator.reset(token)
+        elapsed_us = int((time.perf_counter() - start) * 1_000_000)
+        output_bytes = len(html.encode("utf-8"))
+        render_metrics.add(generator, calls=1, render_us=elapsed_us, output_bytes=output_bytes)
+        logger.debug("%s 렌더링: %d us, %d 바이트", generator, elapsed_us, output_bytes)
+        return html
+    return wrapper
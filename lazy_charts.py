@@ -0,0 +1,137 @@
+import re
+import functools
+from typing import Callable
+
+from html_cache import cached_stage
+
+# Chart.js 본체와 플러그인(chartjs-plugin-*) CDN 스크립트 태그 - 지연 생성 스크립트는 마지막 태그 바로 뒤에 삽입
+_CHART_SCRIPT_TAG = re.compile(r'<script src="https://cdn\.jsdelivr\.net/npm/chart[^"]*"></script>')
+
+# 캔버스가 화면(아래쪽 여유 영역 포함)에 들어올 때 차트를 생성하도록 window.Chart를 감싸는 스크립트
+LAZY_CHART_SHIM = """<script>
+    // 지연 차트 생성: 화면 밖 캔버스의 new Chart(...)는 캔버스가 보일 때까지 미룸
+    (function () {
+        "use strict";
+        var Base = window.Chart;
+        if (typeof Base !== "function" || !("IntersectionObserver" in window) || typeof Proxy !== "function") {
+            return;
+        }
+        // 스크롤해서 닿기 직전에 미리 생성해 빈 캔버스가 보이지 않도록 하는 여유 (픽셀)
+        var MARGIN = 300;
+        var pending = new Map();    // 캔버스 -> 생성 함수
+        var observer = new IntersectionObserver(function (entries) {
+            entries.forEach(function (entry) {
+                var build = pending.get(entry.target);
+                if (entry.isIntersecting && build) {
+                    pending.delete(entry.target);
+                    observer.unobserve(entry.target);
+                    build();
+                }
+            });
+        }, { rootMargin: MARGIN + "px 0px" });
+
+        function canvasOf(item) {
+            if (typeof item === "string") {
+                return document.getElementById(item);
+            }
+            if (item && item.canvas) {
+                return item.canvas;     // getContext('2d')로 얻은 컨텍스트
+            }
+            return item;
+        }
+
+        function nearViewport(canvas) {
+            var rect = canvas.getBoundingClientRect();
+            // 숨겨진 요소(크기 0)는 관찰해도 교차하지 않으므로 바로 생성
+            if (rect.width === 0 && rect.height === 0) {
+                return true;
+            }
+            return rect.top < window.innerHeight + MARGIN && rect.bottom > -MARGIN;
+        }
+
+        function LazyChart(item, config) {
+            var canvas = canvasOf(item);
+            if (!(canvas instanceof HTMLCanvasElement) || nearViewport(canvas)) {
+                return new Base(item, config);
+            }
+            var chart = null;
+            var destroyed = false;
+            pending.set(canvas, function () {
+                if (!destroyed) {
+                    chart = new Base(item, config);
+                }
+            });
+            observer.observe(canvas);
+            // 생성 전에는 config를 그대로 노출하고 메서드 호출(update 등)은 무시 - 생성 시 최신 config 사용
+            return new Proxy(Object.create(Base.prototype), {
+                get: function (target, prop) {
+                    if (chart) {
+                        var value = chart[prop];
+                        return typeof value === "function" ? value.bind(chart) : value;
+                    }
+                    if (prop === "config") { return config; }
+                    if (prop === "data") { return config.data; }
+                    if (prop === "options") { return config.options; }
+                    if (prop === "canvas") { return canvas; }
+                    if (prop === "destroy") {
+                        return function () {
+                            destroyed = true;
+                            pending.delete(canvas);
+                            observer.unobserve(canvas);
+                        };
+                    }
+                    var member = Base.prototype[prop];
+                    return typeof member === "function" ? function () {} : member;
+                },
+                set: function (target, prop, value) {
+                    if (chart) {
+                        chart[prop] = value;
+                    } else if (prop === "data" || prop === "options") {
+                        config[prop] = value;
+                    }
+                    return true;
+                }
+            });
+        }
+        LazyChart.prototype = Base.prototype;
+        // Chart.register, Chart.defaults 등 정적 멤버는 원래 Chart에서 상속
+        Object.setPrototypeOf(LazyChart, Base);
+        window.Chart = LazyChart;
+    })();
+    </script>"""
+
+
+@cached_stage("lazy_charts")
+def inject_lazy_charts(html: str) -> str:
+    """
+    Chart.js 스크립트 태그 바로 뒤에 지연 생성 스크립트 삽입
+
+    페이지 스크립트의 new Chart(...) 호출은 그대로 두고 window.Chart만 감싸므로 템플릿을
+    고칠 필요가 없습니다. IntersectionObserver가 없는 브라우저에서는 원래 Chart를 그대로 씁니다.
+
+    Args:
+        html: 생성기가 만든 HTML
+
+    Returns:
+        str: 스크립트가 삽입된 HTML (Chart.js CDN 태그가 없거나 이미 삽입된 경우 그대로, 같은 입력은 html_cache에 저장된 결과 재사용)
+    """
+    tags = list(_CHART_SCRIPT_TAG.finditer(html))
+    if not tags or LAZY_CHART_SHIM in html:
+        return html
+    position = tags[-1].end()
+    return html[:position] + "\n    " + LAZY_CHART_SHIM + html[position:]
+
+
+def with_lazy_charts(method: Callable[..., str]) -> Callable[..., str]:
+    """
+    generate_html 메서드용 데코레이터 - 생성기의 lazy_charts 속성이 참이면 inject_lazy_charts 적용
+
+    memoize_html 바깥에 두어 캐시에는 원본 HTML이 저장되고, 인스턴스마다
+    generator.lazy_charts = False로 끌 수 있습니다. 삽입된 HTML도 html_cache에 원본 HTML의 내용 해시로
+    저장되므로 캐시 적중 시에는 해시 계산(페이지당 수십 마이크로초)과 조회만 수행합니다.
+    """
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        html = method(self, *args, **kwargs)
+        return inject_lazy_charts(html) if getattr(self, "lazy_charts", False) else html
+    return wrapper
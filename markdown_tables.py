@@ -0,0 +1,420 @@
+import os
+import re
+import json
+import hashlib
+import logging
+import argparse
+import tempfile
+from dataclasses import dataclass
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger("png_scf.tables")
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+SAMPLE_DIR = os.path.join(BASE_DIR, "sample")
+# 파싱 결과(.npz) 저장 위치 - 원본 파일의 mtime/내용 해시로 무효화되므로 버전 관리 대상이 아님
+CACHE_DIR = os.path.join(BASE_DIR, ".cache", "tables")
+# 캐시 형식이나 파싱 규칙이 바뀌면 올려서 기존 캐시를 무효화
+CACHE_VERSION = 1
+
+# 원본 재무제표 파일: 이름 -> sample/ 안의 파일
+SAMPLE_STATEMENTS = {
+    "pg_income_statement": "Exhibit1-pg-table.md",
+    "pg_balance_sheet": "Exhibit2-pg-balance-sheet.md",
+    "fibria_financial_data": "Exhibit5-fibria-financial-data.md",
+    "fibria_income_statement": "Exhibit5-fibria-income-statement.md",
+    "fibria_balance_sheet": "Exhibit6-fibria-balance-sheet.md",
+}
+
+# 숫자 없음으로 보는 칸
+_BLANKS = {"", "-", "—", "–", "N/A", "n/a", "NA"}
+_NUMBER = re.compile(r"\d[\d,]*(?:\.\d+)?|\.\d+")
+_SEPARATOR = re.compile(r"^\|?\s*:?-{3,}:?\s*(\|\s*:?-{3,}:?\s*)*\|?$")
+_HEADING = re.compile(r"^#{1,6}\s+(.*)$")
+# 통화 기호 -> 단위 (긴 기호부터 비교)
+_CURRENCIES = (("R$", "BRL"), ("US$", "USD"), ("$", "USD"))
+
+
+def parse_cell(text: str) -> Tuple[Optional[float], str]:
+    """
+    표 칸 하나를 숫자로 변환
+
+    '$1,234', '(475)', '($741)', '-R$ 735', 'R$ 6,174', '5.5%', '**$41,245**' 형식을 지원하며
+    괄호와 앞의 '-'는 음수로 처리합니다.
+
+    Args:
+        text: 칸 문자열
+
+    Returns:
+        Tuple[Optional[float], str]: (값, 단위) - 단위는 'USD', 'BRL', '%' 또는 ''
+            숫자가 아니면 값이 None (빈 칸은 NaN)
+    """
+    cell = text.replace("**", "").strip()
+    if cell in _BLANKS:
+        return float("nan"), ""
+    negative = False
+    unit = ""
+    # 부호/괄호/통화 기호는 '-R$ 735', '($741)', 'R$ (12)' 처럼 어떤 순서로도 올 수 있음
+    while cell:
+        if cell.startswith("(") and cell.endswith(")"):
+            negative, cell = not negative, cell[1:-1].strip()
+        elif cell[0] in "-−":
+            negative, cell = not negative, cell[1:].strip()
+        elif cell.endswith("%"):
+            unit, cell = "%", cell[:-1].strip()
+        else:
+            for symbol, name in _CURRENCIES:
+                if cell.startswith(symbol):
+                    unit, cell = name, cell[len(symbol):].strip()
+                    break
+            else:
+                break
+    if not _NUMBER.fullmatch(cell):
+        return None, ""
+    value = float(cell.replace(",", ""))
+    return (-value if negative else value), unit
+
+
+@dataclass(frozen=True)
+class MarkdownTable:
+    """
+    마크다운 표 하나 - 첫 열은 행 라벨, 나머지 열은 float64 값 열
+
+    Attributes:
+        title: 표 바로 위의 제목 (없으면 파일 제목)
+        columns: 값 열 이름 (라벨 열 제외)
+        labels: 행 라벨 (굵게 표시 '**' 제거)
+        values: 모양 (행, 열) float64 - 숫자가 아닌 칸은 NaN
+        units: values와 같은 모양의 단위 ('USD', 'BRL', '%', '')
+        text: values와 같은 모양의 원문 칸 ('AA-' 같은 숫자가 아닌 값 확인용)
+    """
+    title: str
+    label_header: str
+    columns: Tuple[str, ...]
+    labels: np.ndarray
+    values: np.ndarray
+    units: np.ndarray
+    text: np.ndarray
+
+    def column(self, name: str) -> np.ndarray:
+        """값 열 하나 (복사 없는 읽기 전용 뷰)"""
+        return self.values[:, self.columns.index(name)]
+
+    def find(self, needle: str) -> int:
+        """라벨에 needle(대소문자 무시)이 들어 있는 첫 행 번호
+
+        Raises:
+            KeyError: 해당 행이 없을 때
+        """
+        lowered = needle.lower()
+        for i, label in enumerate(self.labels.tolist()):
+            if lowered in label.lower():
+                return i
+        raise KeyError(f"'{self.title}' 표에 '{needle}' 행이 없습니다")
+
+    def row(self, needle: str) -> Dict[str, float]:
+        """라벨로 찾은 행의 열 이름 -> 값"""
+        return dict(zip(self.columns, self.values[self.find(needle)].tolist()))
+
+    def frame(self) -> pd.DataFrame:
+        """라벨을 인덱스로 한 DataFrame (값 배열을 복사하지 않음)"""
+        return pd.DataFrame(self.values, index=pd.Index(self.labels, name=self.label_header), columns=list(self.columns), copy=False)
+
+
+def _split_row(line: str) -> List[str]:
+    line = line.strip()
+    if line.startswith("|"):
+        line = line[1:]
+    if line.endswith("|"):
+        line = line[:-1]
+    return [cell.strip() for cell in line.split("|")]
+
+
+def _clean(text: str) -> str:
+    return text.replace("**", "").strip()
+
+
+def _build_table(title: str, header: List[str], rows: List[List[str]], previous: Optional[MarkdownTable] = None) -> MarkdownTable:
+    width = len(header)
+    rows = [(row + [""] * width)[:width] for row in rows]
+    # 라벨이 비어 있고 나머지가 숫자가 아닌 첫 행은 두 번째 헤더 줄 (예: '| | 2012 | ... | 헤알 | 달러 |')
+    if rows and not rows[0][0] and any(rows[0][1:]) and all(
+        parse_cell(cell)[0] is None or cell.isdigit() for cell in rows[0][1:] if cell
+    ):
+        header = [sub or top for top, sub in zip(header, rows.pop(0))]
+    if previous is not None and not any(header[1:]) and len(previous.columns) == width - 1:
+        # 값 열 헤더가 빈 이어지는 표 (예: '| 주당 항목 (Per Share Items) | | | |')는 앞 표의 열 이름 사용
+        header = header[:1] + list(previous.columns)
+    names: List[str] = []
+    for name in (_clean(cell) or f"열{j}" for j, cell in enumerate(header[1:], start=1)):
+        names.append(name if name not in names else f"{name} ({names.count(name) + 1})")
+
+    parsed = [[parse_cell(cell) for cell in row[1:]] for row in rows]
+    values = np.array([[np.nan if value is None else value for value, _ in row] for row in parsed], dtype=np.float64).reshape(len(rows), width - 1)
+    units = np.array([[unit for _, unit in row] for row in parsed], dtype=str).reshape(len(rows), width - 1)
+    text = np.array([[_clean(cell) for cell in row[1:]] for row in rows], dtype=str).reshape(len(rows), width - 1)
+    labels = np.array([_clean(row[0]) for row in rows], dtype=str)
+    for array in (values, units, text, labels):
+        array.flags.writeable = False
+    return MarkdownTable(title, _clean(header[0]), tuple(names), labels, values, units, text)
+
+
+def parse_markdown(text: str) -> List[MarkdownTable]:
+    """
+    마크다운 문서의 모든 파이프 표를 파싱
+
+    Args:
+        text: 마크다운 원문
+
+    Returns:
+        List[MarkdownTable]: 문서에 나오는 순서대로의 표 목록
+    """
+    lines = text.splitlines()
+    tables: List[MarkdownTable] = []
+    title = ""
+    i = 0
+    while i < len(lines):
+        line = lines[i].strip()
+        heading = _HEADING.match(line)
+        if heading:
+            title = heading.group(1).strip()
+        elif line.startswith("|") and i + 1 < len(lines) and _SEPARATOR.match(lines[i + 1].strip()):
+            header = _split_row(line)
+            rows = []
+            i += 2
+            while i < len(lines) and lines[i].strip().startswith("|"):
+                rows.append(_split_row(lines[i]))
+                i += 1
+            tables.append(_build_table(title, header, rows, tables[-1] if tables else None))
+            continue
+        i += 1
+    return tables
+
+
+def _cache_path(path: str, cache_dir: str) -> str:
+    digest = hashlib.blake2b(os.path.abspath(path).encode("utf-8"), digest_size=6).hexdigest()
+    return os.path.join(cache_dir, f"{os.path.splitext(os.path.basename(path))[0]}-{digest}.npz")
+
+
+def _read_cache(cache_path: str) -> Optional[Tuple[Dict[str, Any], Dict[str, np.ndarray]]]:
+    try:
+        with np.load(cache_path, allow_pickle=False) as data:
+            arrays = {name: data[name] for name in data.files}
+    except (OSError, ValueError):
+        return None
+    meta = json.loads(str(arrays.pop("meta")))
+    if meta.get("version") != CACHE_VERSION:
+        return None
+    return meta, arrays
+
+
+def _write_cache(cache_path: str, meta: Dict[str, Any], tables: Sequence[MarkdownTable]) -> None:
+    """표 배열을 .npz로 저장 (임시 파일에 쓴 뒤 교체)"""
+    arrays: Dict[str, np.ndarray] = {"meta": np.array(json.dumps(meta, ensure_ascii=False))}
+    for i, table in enumerate(tables):
+        arrays.update({
+            f"t{i}_labels": table.labels, f"t{i}_values": table.values,
+            f"t{i}_units": table.units, f"t{i}_text": table.text,
+        })
+    cache_dir = os.path.dirname(cache_path)
+    os.makedirs(cache_dir, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=cache_dir, suffix=".npz.tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            np.savez(f, **arrays)
+        os.replace(tmp_path, cache_path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+def _tables_from_cache(meta: Dict[str, Any], arrays: Dict[str, np.ndarray]) -> List[MarkdownTable]:
+    tables = []
+    for i, info in enumerate(meta["tables"]):
+        parts = [arrays[f"t{i}_{name}"] for name in ("labels", "values", "units", "text")]
+        for array in parts:
+            array.flags.writeable = False
+        tables.append(MarkdownTable(info["title"], info["label_header"], tuple(info["columns"]), *parts))
+    return tables
+
+
+def _load(path: str, cache_dir: str) -> Tuple[List[MarkdownTable], str]:
+    """(표 목록, 캐시 상태) - 상태는 'hit'(mtime 일치), 'rehash'(내용 해시 일치), 'parsed'"""
+    stat = os.stat(path)
+    cache_path = _cache_path(path, cache_dir)
+    cached = _read_cache(cache_path)
+    if cached and cached[0]["mtime_ns"] == stat.st_mtime_ns and cached[0]["size"] == stat.st_size:
+        # 원문을 읽지 않고 파싱된 배열만 로드
+        return _tables_from_cache(*cached), "hit"
+
+    with open(path, "rb") as f:
+        raw = f.read()
+    digest = hashlib.blake2b(raw, digest_size=16).hexdigest()
+    meta = {"version": CACHE_VERSION, "mtime_ns": stat.st_mtime_ns, "size": stat.st_size, "hash": digest}
+    if cached and cached[0]["hash"] == digest:
+        # 체크아웃 등으로 mtime만 바뀐 경우 - 파싱 없이 mtime만 갱신
+        tables, status = _tables_from_cache(*cached), "rehash"
+    else:
+        tables, status = parse_markdown(raw.decode("utf-8")), "parsed"
+    meta["tables"] = [
+        {"title": table.title, "label_header": table.label_header, "columns": list(table.columns)} for table in tables
+    ]
+    try:
+        _write_cache(cache_path, meta, tables)
+    except OSError as error:
+        # 캐시는 최적화일 뿐 - 읽기 전용 배포 등에서 쓰지 못해도 파싱한 표를 그대로 사용
+        logger.warning("표 캐시를 저장하지 못했습니다 (%s): %s", cache_path, error)
+    return tables, status
+
+
+def load_tables(path: str, cache_dir: str = CACHE_DIR) -> List[MarkdownTable]:
+    """
+    마크다운 파일의 표를 캐시를 거쳐 로드
+
+    파일의 mtime과 크기가 캐시와 같으면 원문을 읽지 않고 .npz 배열을 바로 사용하고,
+    mtime만 다르면 내용 해시를 비교해 같을 때 다시 파싱하지 않습니다.
+
+    Args:
+        path: 마크다운 파일 경로
+        cache_dir: .npz 캐시 디렉터리
+
+    Returns:
+        List[MarkdownTable]: 읽기 전용 배열로 된 표 목록
+    """
+    return _load(path, cache_dir)[0]
+
+
+def sample_tables(cache_dir: str = CACHE_DIR) -> Dict[str, List[MarkdownTable]]:
+    """SAMPLE_STATEMENTS의 모든 원본 재무제표 표 (이름 -> 표 목록)"""
+    return {name: load_tables(os.path.join(SAMPLE_DIR, filename), cache_dir) for name, filename in SAMPLE_STATEMENTS.items()}
+
+
+def statement_tables(name: str, cache_dir: str = CACHE_DIR) -> List[MarkdownTable]:
+    """SAMPLE_STATEMENTS 이름 하나의 표 목록 (예: 'pg_income_statement')"""
+    return load_tables(os.path.join(SAMPLE_DIR, SAMPLE_STATEMENTS[name]), cache_dir)
+
+
+def statement_records(
+    periods: Mapping[str, str],
+    sources: Sequence[Tuple[MarkdownTable, Mapping[str, str]]],
+    key: str = "year",
+) -> List[Dict[str, Any]]:
+    """
+    원본 표에서 기간(열)별 레코드 목록 생성 - data_provider 재무제표 데이터셋용
+
+    Args:
+        periods: 레코드 key 값 -> 표 열 이름 (예: {"2015 (6월)": "2015년 6월"}), 순서대로 레코드 생성
+        sources: (표, 필드 -> 행 라벨 일부) 목록 - 필드는 이 순서대로 레코드에 들어감
+        key: 기간 값을 담는 레코드 필드
+
+    Returns:
+        List[Dict[str, Any]]: 기간별 레코드
+
+    Raises:
+        KeyError: 행 라벨이나 열 이름이 표에 없을 때
+        ValueError: 요청한 칸이 숫자가 아닐 때
+    """
+    records: List[Dict[str, Any]] = [{key: period} for period in periods]
+    for table, fields in sources:
+        try:
+            columns = [table.columns.index(column) for column in periods.values()]
+        except ValueError as error:
+            raise KeyError(f"'{table.title}' 표에 열이 없습니다: {error}") from None
+        for field, needle in fields.items():
+            values = table.values[table.find(needle), columns]
+            if np.isnan(values).any():
+                raise ValueError(f"'{table.title}' 표의 '{needle}' 행에 숫자가 아닌 칸이 있습니다")
+            # 금액/수량 행은 int, 비율/환율처럼 소수가 있는 행은 float
+            row = values.astype(int).tolist() if (values == np.round(values)).all() else values.tolist()
+            for record, value in zip(records, row):
+                record[field] = value
+    return records
+
+
+# data_provider 재무제표 데이터셋의 발표 값 - 원본 표 파싱 도입 전 손으로 입력했던 값을 고정한 회귀 기준
+# (statement_records가 읽는 표와 독립적이므로 파싱/라벨 매핑이 잘못되어 화면 값이 바뀌면 check가 실패함)
+PUBLISHED_VALUES_PATH = os.path.join(SAMPLE_DIR, "published-statement-values.json")
+
+
+def load_published_values(path: str = PUBLISHED_VALUES_PATH) -> Dict[str, Any]:
+    """발표 값 기준 파일 ({"datasets": 속성 이름 -> 레코드 목록, "corrections": 의도적으로 바꾼 칸 목록})"""
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def compare_published(
+    datasets: Mapping[str, Sequence[Mapping[str, Any]]],
+    reference: Mapping[str, Any],
+    key: str = "year",
+    tolerance: float = 1e-9,
+) -> List[Dict[str, Any]]:
+    """
+    데이터셋을 고정된 발표 값과 대조
+
+    corrections에 기록된 칸({dataset, year, field, published, value, reason})은 기록된 새 값(value)과
+    비교하므로, 발표 값을 바꾸려면 기준 파일에 이유와 함께 기록해야 합니다.
+
+    Args:
+        datasets: 속성 이름 -> 레코드 목록 (예: data_provider의 연도별 데이터)
+        reference: load_published_values() 결과
+        key: 레코드를 맞추는 필드
+        tolerance: 허용 오차
+
+    Returns:
+        List[Dict[str, Any]]: 일치하지 않는 칸 목록 (dataset, key, field, expected, actual) - 빠지거나 추가된 칸은 값이 None
+    """
+    corrections = {
+        (item["dataset"], item[key], item["field"]): item["value"] for item in reference.get("corrections", [])
+    }
+    mismatches = []
+    for dataset, expected_records in reference["datasets"].items():
+        actual_records = {record[key]: record for record in datasets[dataset]}
+        for expected_record in expected_records:
+            period = expected_record[key]
+            actual_record = actual_records.pop(period, {})
+            for field in dict.fromkeys(list(expected_record) + list(actual_record)):
+                expected = corrections.get((dataset, period, field), expected_record.get(field))
+                actual = actual_record.get(field)
+                if expected is None or actual is None or isinstance(expected, str) or isinstance(actual, str):
+                    matched = expected == actual
+                else:
+                    matched = abs(actual - expected) <= tolerance
+                if not matched:
+                    mismatches.append({"dataset": dataset, key: period, "field": field, "expected": expected, "actual": actual})
+        for period in actual_records:
+            mismatches.append({"dataset": dataset, key: period, "field": key, "expected": None, "actual": period})
+    return mismatches
+
+
+def main():
+    parser = argparse.ArgumentParser(description="sample/*.md 원본 재무제표 표 파싱 및 캐시 도구")
+    parser.add_argument("command", choices=["status", "check"], help="status: 파싱/캐시 현황, check: data_provider 값을 고정된 발표 값과 대조")
+    args = parser.parse_args()
+
+    if args.command == "status":
+        for name, filename in SAMPLE_STATEMENTS.items():
+            tables, status = _load(os.path.join(SAMPLE_DIR, filename), CACHE_DIR)
+            print(f"{filename}: 캐시 {status}, 표 {len(tables)}개")
+            for table in tables:
+                print(f"  - {table.title}: {table.values.shape[0]}행 x {len(table.columns)}열 ({', '.join(table.columns)})")
+    else:
+        from data_provider import MarketDataProvider
+        provider = MarketDataProvider()
+        reference = load_published_values()
+        mismatches = compare_published({name: getattr(provider, name) for name in reference["datasets"]}, reference)
+        for name in reference["datasets"]:
+            count = sum(1 for mismatch in mismatches if mismatch["dataset"] == name)
+            print(f"{name}: {'일치' if not count else f'{count}개 불일치'}")
+        for mismatch in mismatches:
+            print(f"  - {mismatch['dataset']} {mismatch['year']} {mismatch['field']}: "
+                  f"기준 {mismatch['expected']!r}, 현재 {mismatch['actual']!r}")
+        print(f"기록된 수정 {len(reference.get('corrections', []))}개 ({os.path.relpath(PUBLISHED_VALUES_PATH, BASE_DIR)})")
+        if mismatches:
+            raise SystemExit(1)
+
+if __name__ == "__main__":
+    main()
@@ -1,9 +1,90 @@
-import json
 from data_provider import MarketDataProvider
+from html_cache import memoize_html, stable_hash
+from instrumentation import instrument_render
+from lazy_charts import with_lazy_charts
+from template_engine import CompiledTemplate
+from ratio_engine import ratio_cache, records_to_columns
+from typing import Any, Dict, List
+
+# P&G 손익계산서 원본 값 (단위: 백만 달러) - 마진/비율은 ratio_engine으로 계산
+PG_INCOME_STATEMENT = [
+    {
+        'year': 2011,
+        'revenue': 81104,
+        'cogs': 39859,
+        'grossProfit': 41245,
+        'sga': 25750,
+        'operatingIncome': 15495,
+        'netIncome': 11797,
+        'employees': 129000,
+        'eps': 4.04,
+        'dividend': 1.97,
+        'sharesOutstanding': 2804
+    },
+    {
+        'year': 2012,
+        'revenue': 82006,
+        'cogs': 41411,
+        'grossProfit': 40595,
+        'sga': 25984,
+        'operatingIncome': 14611,
+        'netIncome': 10756,
+        'employees': 126000,
+        'eps': 3.66,
+        'dividend': 2.14,
+        'sharesOutstanding': 2780
+    },
+    {
+        'year': 2013,
+        'revenue': 80116,
+        'cogs': 39991,
+        'grossProfit': 40125,
+        'sga': 26000,
+        'operatingIncome': 14125,
+        'netIncome': 11312,
+        'employees': 121000,
+        'eps': 3.86,
+        'dividend': 2.29,
+        'sharesOutstanding': 2742
+    },
+    {
+        'year': 2014,
+        'revenue': 80510,
+        'cogs': 40611,
+        'grossProfit': 39899,
+        'sga': 24402,
+        'operatingIncome': 15497,
+        'netIncome': 11643,
+        'employees': 118000,
+        'eps': 4.01,
+        'dividend': 2.45,
+        'sharesOutstanding': 2730
+    },
+    {
+        'year': 2015,
+        'revenue': 76279,
+        'cogs': 38248,
+        'grossProfit': 38031,
+        'sga': 23158,
+        'operatingIncome': 14873,
+        'netIncome': 7036,
+        'employees': 110000,
+        'eps': 2.44,
+        'dividend': 2.59,
+        'sharesOutstanding': 2712
+    }
+]
+
+# 비율 계산에 쓰는 원본 열과 차트에 표시하는 비율 (COGS/매출, SG&A/매출, 각 마진)
+_STATEMENT_FIELDS = ("revenue", "cogs", "grossProfit", "sga", "operatingIncome", "netIncome")
+MARGIN_RATIOS = ("cogsRatio", "sgaRatio", "grossMargin", "operatingMargin", "netMargin")
+_STATEMENT_VERSION = stable_hash(PG_INCOME_STATEMENT)
 
 class PGFinancialComponentGenerator:
     """P&G 재무 데이터용 Chart.js 컴포넌트 생성 클래스"""
     
+    lazy_charts = True  # 차트 6개 (직원/주주가치 차트는 페이지 하단)
+    
     def __init__(self, data_provider: MarketDataProvider):
         """
         Args:
@@ -11,117 +92,44 @@ class PGFinancialComponentGenerator:
         """
         self.data_provider = data_provider
     
+    def _cache_inputs(self):
+        """HTML 캐시 키 계산에 사용되는 입력 데이터 반환"""
+        # 재무 데이터가 모듈 상수(PG_INCOME_STATEMENT)로 고정되어 있어 외부 입력 없음
+        return None
+    
+    @instrument_render
+    @with_lazy_charts
+    @memoize_html
     def generate_html(self) -> str:
         """Chart.js 컴포넌트를 포함한 HTML 코드를 생성하여 반환"""
-        html_template = self._get_html_template()
-        
-        # 재무 데이터 정의
-        pg_financial_data = [
-            {
-                'year': 2011,
-                'revenue': 81104,
-                'cogs': 39859,
-                'grossProfit': 41245,
-                'sga': 25750,
-                'operatingIncome': 15495,
-                'netIncome': 11797,
-                'cogsRatio': round((39859 / 81104) * 100, 1),  # COGS/매출 비율
-                'sgaRatio': round((25750 / 81104) * 100, 1),   # SG&A/매출 비율
-                'grossMargin': round((41245 / 81104) * 100, 1),
-                'operatingMargin': round((15495 / 81104) * 100, 1),
-                'netMargin': round((11797 / 81104) * 100, 1),
-                'employees': 129000,
-                'eps': 4.04,
-                'dividend': 1.97,
-                'sharesOutstanding': 2804
-            },
-            {
-                'year': 2012,
-                'revenue': 82006,
-                'cogs': 41411,
-                'grossProfit': 40595,
-                'sga': 25984,
-                'operatingIncome': 14611,
-                'netIncome': 10756,
-                'cogsRatio': round((41411 / 82006) * 100, 1),
-                'sgaRatio': round((25984 / 82006) * 100, 1),
-                'grossMargin': round((40595 / 82006) * 100, 1),
-                'operatingMargin': round((14611 / 82006) * 100, 1),
-                'netMargin': round((10756 / 82006) * 100, 1),
-                'employees': 126000,
-                'eps': 3.66,
-                'dividend': 2.14,
-                'sharesOutstanding': 2780
-            },
-            {
-                'year': 2013,
-                'revenue': 80116,
-                'cogs': 39991,
-                'grossProfit': 40125,
-                'sga': 26000,
-                'operatingIncome': 14125,
-                'netIncome': 11312,
-                'cogsRatio': round((39991 / 80116) * 100, 1),
-                'sgaRatio': round((26000 / 80116) * 100, 1),
-                'grossMargin': round((40125 / 80116) * 100, 1),
-                'operatingMargin': round((14125 / 80116) * 100, 1),
-                'netMargin': round((11312 / 80116) * 100, 1),
-                'employees': 121000,
-                'eps': 3.86,
-                'dividend': 2.29,
-                'sharesOutstanding': 2742
-            },
-            {
-                'year': 2014,
-                'revenue': 80510,
-                'cogs': 40611,
-                'grossProfit': 39899,
-                'sga': 24402,
-                'operatingIncome': 15497,
-                'netIncome': 11643,
-                'cogsRatio': round((40611 / 80510) * 100, 1),
-                'sgaRatio': round((24402 / 80510) * 100, 1),
-                'grossMargin': round((39899 / 80510) * 100, 1),
-                'operatingMargin': round((15497 / 80510) * 100, 1),
-                'netMargin': round((11643 / 80510) * 100, 1),
-                'employees': 118000,
-                'eps': 4.01,
-                'dividend': 2.45,
-                'sharesOutstanding': 2730
-            },
-            {
-                'year': 2015,
-                'revenue': 76279,
-                'cogs': 38248,
-                'grossProfit': 38031,
-                'sga': 23158,
-                'operatingIncome': 14873,
-                'netIncome': 7036,
-                'cogsRatio': round((38248 / 76279) * 100, 1),
-                'sgaRatio': round((23158 / 76279) * 100, 1),
-                'grossMargin': round((38031 / 76279) * 100, 1),
-                'operatingMargin': round((14873 / 76279) * 100, 1),
-                'netMargin': round((7036 / 76279) * 100, 1),
-                'employees': 110000,
-                'eps': 2.44,
-                'dividend': 2.59,
-                'sharesOutstanding': 2712
-            }
-        ]
+        # 원본 손익계산서에 마진/비율 열을 붙인 재무 데이터
+        pg_financial_data = self._financial_data_with_ratios()
         
-        # 데이터를 JSON 문자열로 변환하여 삽입
-        try:
-            json_data = json.dumps(pg_financial_data, ensure_ascii=False)
-        except Exception as e:
-            print(f"JSON 직렬화 오류: {e}")
-            json_data = "[]"
-        
-        # 데이터 플레이스홀더 치환
-        html_template = html_template.replace("PG_FINANCIAL_DATA_PLACEHOLDER", json_data)
-        
-        return html_template
+        # 데이터를 JSON 문자열로 변환하여 플레이스홀더에 삽입
+        return _COMPILED_TEMPLATE.render_json(
+            {"PG_FINANCIAL_DATA_PLACEHOLDER": pg_financial_data}, ensure_ascii=False
+        )
+    
+    @staticmethod
+    def _financial_data_with_ratios() -> List[Dict[str, Any]]:
+        """손익계산서 행마다 netIncome 뒤에 비율 열을 끼워 넣은 데이터 반환"""
+        columns = records_to_columns(PG_INCOME_STATEMENT, _STATEMENT_FIELDS)
+        ratios = {
+            name: values.tolist()
+            for name, values in ratio_cache.get(columns, MARGIN_RATIOS, decimals=1, version=_STATEMENT_VERSION).items()
+        }
+        rows = []
+        for i, statement in enumerate(PG_INCOME_STATEMENT):
+            row = {}
+            for key, value in statement.items():
+                row[key] = value
+                if key == "netIncome":
+                    row.update((name, ratios[name][i]) for name in MARGIN_RATIOS)
+            rows.append(row)
+        return rows
     
-    def _get_html_template(self) -> str:
+    @staticmethod
+    def _get_html_template() -> str:
         """HTML 템플릿 반환"""
         return """
         <!DOCTYPE html>
@@ -1114,4 +1122,8 @@ class PGFinancialComponentGenerator:
             </script>
         </body>
         </html>
-        """ 
\ No newline at end of file
+        """ 
+
+
+# 템플릿은 모듈 임포트 시점에 한 번만 토큰화
+_COMPILED_TEMPLATE = CompiledTemplate(PGFinancialComponentGenerator._get_html_template())
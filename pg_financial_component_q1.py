@@ -1,5 +1,7 @@
-import json
 from data_provider import MarketDataProvider
+from html_cache import memoize_html
+from instrumentation import instrument_render
+from template_engine import CompiledTemplate
 
 class PGFinancialComponentGeneratorQ1:
     """P&G 재무 데이터용 Chart.js 컴포넌트 생성 클래스 (Q1 탭)"""
@@ -11,24 +13,21 @@ class PGFinancialComponentGeneratorQ1:
         """
         self.data_provider = data_provider
     
+    def _cache_inputs(self):
+        """HTML 캐시 키 계산에 사용되는 입력 데이터 반환"""
+        return self.data_provider.pg_financial_data
+    
+    @instrument_render
+    @memoize_html
     def generate_html(self) -> str:
         """Chart.js 컴포넌트를 포함한 HTML 코드를 생성하여 반환"""
-        html_template = self._get_html_template()
-        pg_financial_data = self.data_provider.pg_financial_data
-        
-        # 데이터를 JSON 문자열로 변환하여 삽입
-        try:
-            json_data = json.dumps(pg_financial_data, ensure_ascii=False)
-        except Exception as e:
-            print(f"JSON 직렬화 오류: {e}")
-            json_data = "[]"
-        
-        # 데이터 플레이스홀더 치환
-        html_template = html_template.replace("PG_FINANCIAL_DATA_PLACEHOLDER", json_data)
-        
-        return html_template
+        # 데이터를 JSON 문자열로 변환하여 플레이스홀더에 삽입
+        return _COMPILED_TEMPLATE.render_json(
+            {"PG_FINANCIAL_DATA_PLACEHOLDER": self.data_provider.pg_financial_data}, ensure_ascii=False
+        )
     
-    def _get_html_template(self) -> str:
+    @staticmethod
+    def _get_html_template() -> str:
         """HTML 템플릿 반환"""
         return """
         <!DOCTYPE html>
@@ -252,4 +251,8 @@ class PGFinancialComponentGeneratorQ1:
             </script>
         </body>
         </html>
-        """ 
\ No newline at end of file
+        """ 
+
+
+# 템플릿은 모듈 임포트 시점에 한 번만 토큰화
+_COMPILED_TEMPLATE = CompiledTemplate(PGFinancialComponentGeneratorQ1._get_html_template())
@@ -1,61 +1,64 @@
-import streamlit as st
-import pandas as pd
 import json
+from html_cache import memoize_html
+from instrumentation import instrument_render
+from lazy_charts import with_lazy_charts
+from scf_economics import case_tables
+from template_engine import CompiledTemplate
+
+# 차트 데이터 플레이스홀더 -> (데이터 속성, 필드) - 각 행의 필드 값을 JSON 배열로 삽입
+_SERIES_PLACEHOLDERS = {
+    "TABLE_A_SCENARIO_PLACEHOLDER": ("table_a_data", "scenario"),
+    "TABLE_A_DAYS_PLACEHOLDER": ("table_a_data", "days"),
+    "TABLE_A_RECEIVABLE_PLACEHOLDER": ("table_a_data", "receivable"),
+    "TABLE_A_NET_AMOUNT_PLACEHOLDER": ("table_a_data", "netAmount"),
+    "TIMELINE_NAME_PLACEHOLDER": ("payment_timeline_data", "name"),
+    "TIMELINE_SCF_PLACEHOLDER": ("payment_timeline_data", "scf"),
+    "TIMELINE_TRADITIONAL_PLACEHOLDER": ("payment_timeline_data", "traditional"),
+    "DISCOUNT_RATE_NAME_PLACEHOLDER": ("discount_rate_data", "name"),
+    "DISCOUNT_RATE_VALUE_PLACEHOLDER": ("discount_rate_data", "value"),
+    "SUPPLIER_NAME_PLACEHOLDER": ("supplier_perspective_data", "name"),
+    "SUPPLIER_DAYS_TO_RECEIVE_PLACEHOLDER": ("supplier_perspective_data", "daysToReceive"),
+    "SUPPLIER_ANNUAL_RATE_PLACEHOLDER": ("supplier_perspective_data", "annualRate"),
+    "SUPPLIER_FINANCING_COST_PLACEHOLDER": ("supplier_perspective_data", "financingCost"),
+    "SUPPLIER_NET_AMOUNT_PLACEHOLDER": ("supplier_perspective_data", "netAmount"),
+    "PG_NAME_PLACEHOLDER": ("pg_perspective_data", "name"),
+    "PG_DPO_PLACEHOLDER": ("pg_perspective_data", "DPO"),
+    "PG_WORKING_CAPITAL_IMPACT_PLACEHOLDER": ("pg_perspective_data", "workingCapitalImpact"),
+}
+
+# Table B 계산표의 행 하나
+_TABLE_B_ROW = """
+                <tr>
+                    <td style="font-weight: 600;">{label}</td>
+                    <td style="text-align: right;">{value}</td>
+                </tr>
+            """
 
 class PGSCFEconomicsGenerator:
-    """P&G SCF 경제적 효과 분석 컴포넌트 생성기"""
+    """
+    P&G SCF 경제적 효과 분석 컴포넌트 생성기
+
+    Exhibit 4와 Q3 화면이 같은 클래스를 사용하므로 HTML 캐시 키(클래스 이름 + 입력 해시)가
+    같아서, 먼저 렌더링한 화면의 결과를 다른 화면이 그대로 재사용합니다.
+    """
+    
+    lazy_charts = True  # 차트 6개 - Q3/Exhibit 4 공통
     
     def __init__(self, data_provider=None):
         """초기화 함수"""
         self.data_provider = data_provider
         
+        # 케이스 예시($1,000 인보이스)를 SCF 경제성 엔진으로 계산한 표
+        tables = case_tables()
+        
         # Table A: P&G Supply Chain Finance 예시 데이터
-        self.table_a_data = [
-            {
-                "scenario": "기존 상태",
-                "days": 45,
-                "receivable": 45,
-                "payable": 45,
-                "financingCost": 2.92,
-                "netAmount": 997.08,
-                "description": "SCF 도입 전 기본 결제 조건"
-            },
-            {
-                "scenario": "지불조건 연장(SCF 없음)",
-                "days": 75,
-                "receivable": 75,
-                "payable": 45,
-                "financingCost": 5.83,
-                "netAmount": 994.17,
-                "description": "SCF 없이 지불 기간만 연장 (공급업체 부담 증가)"
-            },
-            {
-                "scenario": "SCF 프로그램 적용",
-                "days": 75,
-                "receivable": 15,
-                "payable": 45,
-                "financingCost": 2.17,
-                "netAmount": 997.83,
-                "description": "SCF 적용 시 (P&G는 75일 후 지불, 공급업체는 15일 후 은행에서 수령)"
-            }
-        ]
+        self.table_a_data = tables["table_a"]
         
         # SCF 프로그램에 따른 지불 일정 시각화용 데이터
-        self.payment_timeline_data = [
-            {"name": "D+0", "scf": 0, "traditional": 0, "label": "인보이스 발행"},
-            {"name": "D+15", "scf": 997.83, "traditional": 0, "label": "SCF 조기지불"},
-            {"name": "D+45", "scf": 997.83, "traditional": 997.08, "label": "기존 지불기한"},
-            {"name": "D+75", "scf": 997.83, "traditional": 994.17, "label": "연장된 지불기한"}
-        ]
+        self.payment_timeline_data = tables["payment_timeline"]
         
         # Table B: SCF 인보이스 할인율 계산 데이터
-        self.table_b_data = {
-            "daysFinanced": 60,
-            "libor60Day": 0.30,
-            "bankSpread": 1.00,
-            "financingRate": 1.30,
-            "discountPercentage": 0.22
-        }
+        self.table_b_data = tables["table_b"]
         
         # 할인율 구성 파이 차트용 데이터
         self.discount_rate_data = [
@@ -64,50 +67,10 @@ class PGSCFEconomicsGenerator:
         ]
         
         # 공급업체 관점에서 3가지 시나리오 비교 데이터
-        self.supplier_perspective_data = [
-            {
-                "name": "기존 지불조건",
-                "invoiceAmount": 1000,
-                "daysToReceive": 45,
-                "financingCost": 2.92,
-                "netAmount": 997.08,
-                "annualRate": 3.50
-            },
-            {
-                "name": "SCF 없는 지불연장",
-                "invoiceAmount": 1000,
-                "daysToReceive": 75,
-                "financingCost": 5.83,
-                "netAmount": 994.17,
-                "annualRate": 3.50
-            },
-            {
-                "name": "SCF 프로그램",
-                "invoiceAmount": 1000,
-                "daysToReceive": 15,
-                "financingCost": 2.17,
-                "netAmount": 997.83,
-                "annualRate": 1.30
-            }
-        ]
+        self.supplier_perspective_data = tables["supplier_perspective"]
         
         # P&G 관점에서의 운전자본 영향 데이터
-        self.pg_perspective_data = [
-            {
-                "name": "기존 지불조건",
-                "DPO": 45,
-                "workingCapitalImpact": 0,
-                "cashOutflow": 1000,
-                "cashOutflowDay": 45
-            },
-            {
-                "name": "SCF 프로그램",
-                "DPO": 75,
-                "workingCapitalImpact": 30,
-                "cashOutflow": 1000,
-                "cashOutflowDay": 75
-            }
-        ]
+        self.pg_perspective_data = tables["pg_perspective"]
         
         # 색상 설정
         self.colors = {
@@ -124,9 +87,44 @@ class PGSCFEconomicsGenerator:
         # 파이 차트 색상
         self.pie_colors = ["#0088FE", "#00C49F"]
     
+    def _cache_inputs(self):
+        """HTML 캐시 키 계산에 사용되는 입력 데이터 반환"""
+        return [
+            self.table_a_data,
+            self.payment_timeline_data,
+            self.table_b_data,
+            self.discount_rate_data,
+            self.supplier_perspective_data,
+            self.pg_perspective_data,
+            self.colors,
+            self.pie_colors
+        ]
+    
+    @instrument_render
+    @with_lazy_charts
+    @memoize_html
     def generate_html(self):
-        """Chart.js를 사용하여 HTML 코드 생성"""
-        html_code = """
+        """미리 토큰화한 템플릿에 데이터를 채워 HTML 코드 생성"""
+        values = {
+            name: json.dumps([item[field] for item in getattr(self, attribute)])
+            for name, (attribute, field) in _SERIES_PLACEHOLDERS.items()
+        }
+        values.update({f"COLOR_{name.upper()}_PLACEHOLDER": color for name, color in self.colors.items()})
+        values["PIE_COLORS_PLACEHOLDER"] = json.dumps(self.pie_colors)
+        table_rows = [
+            ("SCF 은행 금융 기간", f"{self.table_b_data['daysFinanced']}일"),
+            ("LIBOR (60일)", f"{self.table_b_data['libor60Day']}%"),
+            ("은행 스프레드", f"{self.table_b_data['bankSpread']}%"),
+            ("SCF 파이낸싱 연이율", f"{self.table_b_data['financingRate']}%")
+        ]
+        values["TABLE_B_ROWS_PLACEHOLDER"] = "".join(_TABLE_B_ROW.format(label=label, value=value) for label, value in table_rows)
+        values["DISCOUNT_PERCENTAGE_PLACEHOLDER"] = str(self.table_b_data['discountPercentage'])
+        return _COMPILED_TEMPLATE.render(values)
+
+    @staticmethod
+    def _get_html_template() -> str:
+        """HTML 템플릿 반환"""
+        return """
         <!DOCTYPE html>
         <html>
         <head>
@@ -248,10 +246,7 @@ class PGSCFEconomicsGenerator:
                 </div>
                 <p class="caption">* SCF 프로그램을 통해 P&G는 지불기한을 연장하고, 공급업체는 더 빨리 현금 수령 가능</p>
             </div>
-        """
         
-        # 두 번째 차트 컨테이너를 추가
-        html_code += """
             <div class="container">
                 <h2>2. 공급업체 현금 수령 타임라인</h2>
                 <div class="chart-container">
@@ -268,10 +263,7 @@ class PGSCFEconomicsGenerator:
                     </div>
                 </div>
             </div>
-        """
         
-        # 세 번째 섹션 - SCF 할인율 구성
-        html_code += """
             <div class="container">
                 <h2>3. SCF 인보이스 할인율 구성 요소</h2>
                 <div class="grid-container">
@@ -282,48 +274,23 @@ class PGSCFEconomicsGenerator:
                         <h3 style="text-align: center; margin-bottom: 15px;">SCF 할인율 계산</h3>
                         <table>
                             <tbody>
-        """
-        
-        # 테이블 데이터 추가
-        table_rows = [
-            ("SCF 은행 금융 기간", f"{self.table_b_data['daysFinanced']}일"),
-            ("LIBOR (60일)", f"{self.table_b_data['libor60Day']}%"),
-            ("은행 스프레드", f"{self.table_b_data['bankSpread']}%"),
-            ("SCF 파이낸싱 연이율", f"{self.table_b_data['financingRate']}%")
-        ]
-        
-        for label, value in table_rows:
-            html_code += f"""
-                <tr>
-                    <td style="font-weight: 600;">{label}</td>
-                    <td style="text-align: right;">{value}</td>
-                </tr>
-            """
-        
-        # 할인율 강조 행
-        html_code += f"""
+        TABLE_B_ROWS_PLACEHOLDER
                 <tr style="background-color: #e3f2fd;">
                     <td style="font-weight: 700;">SCF 인보이스 할인율</td>
-                    <td style="text-align: right; font-weight: 700;">{self.table_b_data['discountPercentage']}%</td>
+                    <td style="text-align: right; font-weight: 700;">DISCOUNT_PERCENTAGE_PLACEHOLDER%</td>
                 </tr>
                 <tr>
                     <td colspan="2" style="font-size: 0.9em; color: #666;">
                         계산식: 할인율 = (연이율 × 금융기간) ÷ 360
                     </td>
                 </tr>
-            """
-        
-        # 테이블 닫기
-        html_code += """
+            
                             </tbody>
                         </table>
                     </div>
                 </div>
             </div>
-        """
         
-        # 네 번째 섹션 - 공급업체 관점 비교
-        html_code += """
             <div class="container">
                 <h2>4. 공급업체 관점에서의 비교</h2>
                 <div class="grid-container">
@@ -336,10 +303,7 @@ class PGSCFEconomicsGenerator:
                 </div>
                 <p class="caption">* SCF 프로그램은 더 낮은 연이율(3.5% → 1.3%)과 더 빠른 수금(45일 → 15일)을 제공</p>
             </div>
-        """
         
-        # 다섯 번째 섹션 - P&G 관점에서의 효과
-        html_code += """
             <div class="container">
                 <h2>5. P&G 관점에서의 효과</h2>
                 <div class="chart-container">
@@ -347,10 +311,7 @@ class PGSCFEconomicsGenerator:
                 </div>
                 <p class="caption">* P&G는 SCF를 통해 지불 기간(DPO)을 30일 연장하고 그만큼 운전자본을 개선</p>
             </div>
-        """
         
-        # 여섯 번째 섹션 - SCF 경제적 효과 요약
-        html_code += """
             <div class="container">
                 <h2>6. SCF 프로그램의 경제적 효과 요약</h2>
                 <div class="benefit-container">
@@ -392,10 +353,7 @@ class PGSCFEconomicsGenerator:
                     </div>
                 </div>
             </div>
-        """
         
-        # 일곱 번째 섹션 - 시뮬레이션
-        html_code += """
             <div class="container">
                 <h2>7. $300M 연간 거래 기준 SCF 효과 시뮬레이션</h2>
                 <div class="simulation-container">
@@ -436,502 +394,501 @@ class PGSCFEconomicsGenerator:
                     <p class="caption">* SCF 프로그램은 P&G에게 $25M의 운전자본 개선 효과를 제공하면서, 동시에 공급업체의 금융 비용을 기존 조건 대비 $0.5M 절감</p>
                 </div>
             </div>
-        """
         
-        # JavaScript 차트 코드 추가
-        html_code += f"""
         <script>
         // 문서가 로드된 후 차트 렌더링
-        document.addEventListener('DOMContentLoaded', function() {{
+        document.addEventListener('DOMContentLoaded', function() {
             // 3가지 시나리오 비교 차트
             const scenarioCtx = document.getElementById('scenarioComparisonChart').getContext('2d');
             
             // 데이터 준비
-            const labels = {json.dumps([item["scenario"] for item in self.table_a_data])};
-            const daysData = {json.dumps([item["days"] for item in self.table_a_data])};
-            const receivableData = {json.dumps([item["receivable"] for item in self.table_a_data])};
-            const netAmountData = {json.dumps([item["netAmount"] for item in self.table_a_data])};
+            const labels = TABLE_A_SCENARIO_PLACEHOLDER;
+            const daysData = TABLE_A_DAYS_PLACEHOLDER;
+            const receivableData = TABLE_A_RECEIVABLE_PLACEHOLDER;
+            const netAmountData = TABLE_A_NET_AMOUNT_PLACEHOLDER;
             
             // 차트 생성
-            new Chart(scenarioCtx, {{
+            new Chart(scenarioCtx, {
                 type: 'bar',
-                data: {{
+                data: {
                     labels: labels,
                     datasets: [
-                        {{
+                        {
                             label: 'P&G 지불기한',
                             backgroundColor: 'rgba(33, 150, 243, 0.7)',
                             data: daysData,
                             yAxisID: 'y-left',
-                        }},
-                        {{
+                        },
+                        {
                             label: '공급업체 수금기한',
                             backgroundColor: 'rgba(76, 175, 80, 0.7)',
                             data: receivableData,
                             yAxisID: 'y-left',
-                        }},
-                        {{
+                        },
+                        {
                             type: 'line',
                             label: '공급업체 수령액',
-                            borderColor: '{self.colors["red"]}',
+                            borderColor: 'COLOR_RED_PLACEHOLDER',
                             backgroundColor: 'transparent',
                             data: netAmountData,
                             yAxisID: 'y-right',
                             tension: 0.1,
                             borderWidth: 3,
                             pointRadius: 5
-                        }}
+                        }
                     ]
-                }},
-                options: {{
+                },
+                options: {
                     responsive: true,
                     maintainAspectRatio: false,
-                    scales: {{
-                        y: {{
+                    scales: {
+                        y: {
                             type: 'linear',
                             display: true,
                             position: 'left',
                             id: 'y-left',
-                            title: {{
+                            title: {
                                 display: true,
                                 text: '일수'
-                            }}
-                        }},
-                        'y-right': {{
+                            }
+                        },
+                        'y-right': {
                             type: 'linear',
                             display: true,
                             position: 'right',
                             min: 992,
                             max: 1000,
-                            grid: {{
+                            grid: {
                                 drawOnChartArea: false
-                            }},
-                            title: {{
+                            },
+                            title: {
                                 display: true,
                                 text: '금액($)'
-                            }}
-                        }}
-                    }},
-                    plugins: {{
-                        tooltip: {{
-                            callbacks: {{
-                                label: function(context) {{
+                            }
+                        }
+                    },
+                    plugins: {
+                        tooltip: {
+                            callbacks: {
+                                label: function(context) {
                                     let label = context.dataset.label || '';
-                                    if (label) {{
+                                    if (label) {
                                         label += ': ';
-                                    }}
-                                    if (context.dataset.label === '공급업체 수령액') {{
+                                    }
+                                    if (context.dataset.label === '공급업체 수령액') {
                                         return label + '$' + context.parsed.y.toFixed(2);
-                                    }} else {{
+                                    } else {
                                         return label + context.parsed.y + '일';
-                                    }}
-                                }}
-                            }}
-                        }}
-                    }},
-                    interaction: {{
+                                    }
+                                }
+                            }
+                        }
+                    },
+                    interaction: {
                         intersect: false,
                         mode: 'index'
-                    }}
-                }}
-            }});
+                    }
+                }
+            });
             
             // 타임라인 차트
             const timelineCtx = document.getElementById('timelineChart').getContext('2d');
             
             // 타임라인 데이터 준비
-            const timeLabels = {json.dumps([item["name"] for item in self.payment_timeline_data])};
-            const scfData = {json.dumps([item["scf"] for item in self.payment_timeline_data])};
-            const traditionalData = {json.dumps([item["traditional"] for item in self.payment_timeline_data])};
+            const timeLabels = TIMELINE_NAME_PLACEHOLDER;
+            const scfData = TIMELINE_SCF_PLACEHOLDER;
+            const traditionalData = TIMELINE_TRADITIONAL_PLACEHOLDER;
             
             // 타임라인 차트 생성
-            new Chart(timelineCtx, {{
+            new Chart(timelineCtx, {
                 type: 'line',
-                data: {{
+                data: {
                     labels: timeLabels,
                     datasets: [
-                        {{
+                        {
                             label: 'SCF 프로그램',
-                            borderColor: '{self.colors["green"]}',
+                            borderColor: 'COLOR_GREEN_PLACEHOLDER',
                             backgroundColor: 'rgba(76, 175, 80, 0.1)',
                             data: scfData,
                             borderWidth: 3,
                             pointRadius: 6,
-                            pointBackgroundColor: '{self.colors["green"]}',
+                            pointBackgroundColor: 'COLOR_GREEN_PLACEHOLDER',
                             stepped: 'before'
-                        }},
-                        {{
+                        },
+                        {
                             label: '기존 지불조건',
-                            borderColor: '{self.colors["blue"]}',
+                            borderColor: 'COLOR_BLUE_PLACEHOLDER',
                             backgroundColor: 'rgba(33, 150, 243, 0.1)',
                             data: traditionalData,
                             borderWidth: 3,
                             pointRadius: 6,
-                            pointBackgroundColor: '{self.colors["blue"]}',
+                            pointBackgroundColor: 'COLOR_BLUE_PLACEHOLDER',
                             stepped: 'before'
-                        }}
+                        }
                     ]
-                }},
-                options: {{
+                },
+                options: {
                     responsive: true,
                     maintainAspectRatio: false,
-                    scales: {{
-                        y: {{
+                    scales: {
+                        y: {
                             beginAtZero: true,
                             max: 1100,
-                            title: {{
+                            title: {
                                 display: true,
                                 text: '금액($)'
-                            }}
-                        }}
-                    }},
-                    plugins: {{
-                        tooltip: {{
-                            callbacks: {{
-                                label: function(context) {{
+                            }
+                        }
+                    },
+                    plugins: {
+                        tooltip: {
+                            callbacks: {
+                                label: function(context) {
                                     let label = context.dataset.label || '';
-                                    if (label) {{
+                                    if (label) {
                                         label += ': ';
-                                    }}
+                                    }
                                     const value = context.parsed.y;
                                     return label + (value > 0 ? '$' + value.toFixed(2) : '$0');
-                                }}
-                            }}
-                        }}
-                    }},
-                    interaction: {{
+                                }
+                            }
+                        }
+                    },
+                    interaction: {
                         intersect: false,
                         mode: 'index'
-                    }}
-                }}
-            }});
+                    }
+                }
+            });
             
             // 할인율 차트 생성
             const discountRateCtx = document.getElementById('discountRateChart').getContext('2d');
             
             // 할인율 데이터
-            const discountRateLabels = {json.dumps([item["name"] for item in self.discount_rate_data])};
-            const discountRateValues = {json.dumps([item["value"] for item in self.discount_rate_data])};
-            const discountRateColors = {json.dumps(self.pie_colors)};
+            const discountRateLabels = DISCOUNT_RATE_NAME_PLACEHOLDER;
+            const discountRateValues = DISCOUNT_RATE_VALUE_PLACEHOLDER;
+            const discountRateColors = PIE_COLORS_PLACEHOLDER;
             
             // 할인율 차트 생성
-            new Chart(discountRateCtx, {{
+            new Chart(discountRateCtx, {
                 type: 'pie',
-                data: {{
+                data: {
                     labels: discountRateLabels,
-                    datasets: [{{
+                    datasets: [{
                         data: discountRateValues,
                         backgroundColor: discountRateColors,
                         borderWidth: 1
-                    }}]
-                }},
-                options: {{
+                    }]
+                },
+                options: {
                     responsive: true,
                     maintainAspectRatio: false,
-                    plugins: {{
-                        legend: {{
+                    plugins: {
+                        legend: {
                             position: 'right',
-                            labels: {{
-                                font: {{
+                            labels: {
+                                font: {
                                     size: 14
-                                }},
-                                generateLabels: function(chart) {{
+                                },
+                                generateLabels: function(chart) {
                                     const data = chart.data;
-                                    if (data.labels.length && data.datasets.length) {{
+                                    if (data.labels.length && data.datasets.length) {
                                         const dataset = data.datasets[0];
                                         const total = dataset.data.reduce((a, b) => a + b, 0);
-                                        return data.labels.map((label, i) => {{
+                                        return data.labels.map((label, i) => {
                                             const value = dataset.data[i];
                                             const percentage = Math.round((value / total) * 100);
-                                            return {{
+                                            return {
                                                 text: label + ': ' + percentage + '%',
                                                 fillStyle: dataset.backgroundColor[i],
                                                 hidden: false,
                                                 index: i
-                                            }};
-                                        }});
-                                    }}
+                                            };
+                                        });
+                                    }
                                     return [];
-                                }}
-                            }}
-                        }},
-                        tooltip: {{
-                            callbacks: {{
-                                label: function(context) {{
+                                }
+                            }
+                        },
+                        tooltip: {
+                            callbacks: {
+                                label: function(context) {
                                     const label = context.label || '';
                                     const value = context.raw;
                                     const total = context.dataset.data.reduce((a, b) => a + b, 0);
                                     const percentage = Math.round((value / total) * 100);
                                     return label + ': ' + value + '% (' + percentage + '% 비중)';
-                                }}
-                            }}
-                        }}
-                    }}
-                }}
-            }});
+                                }
+                            }
+                        }
+                    }
+                }
+            });
             
             // 공급업체 관점 차트 1 - 대기 일수 및 연이율
             const supplierDaysCtx = document.getElementById('supplierDaysChart').getContext('2d');
             
             // 공급업체 데이터
-            const supplierLabels = {json.dumps([item["name"] for item in self.supplier_perspective_data])};
-            const supplierDaysData = {json.dumps([item["daysToReceive"] for item in self.supplier_perspective_data])};
-            const supplierRateData = {json.dumps([item["annualRate"] for item in self.supplier_perspective_data])};
+            const supplierLabels = SUPPLIER_NAME_PLACEHOLDER;
+            const supplierDaysData = SUPPLIER_DAYS_TO_RECEIVE_PLACEHOLDER;
+            const supplierRateData = SUPPLIER_ANNUAL_RATE_PLACEHOLDER;
             
             // 공급업체 대기 일수 및 연이율 차트
-            new Chart(supplierDaysCtx, {{
+            new Chart(supplierDaysCtx, {
                 type: 'bar',
-                data: {{
+                data: {
                     labels: supplierLabels,
                     datasets: [
-                        {{
+                        {
                             label: '대기 일수',
                             backgroundColor: 'rgba(33, 150, 243, 0.7)',
                             data: supplierDaysData,
                             yAxisID: 'y-days',
-                        }},
-                        {{
+                        },
+                        {
                             type: 'line',
                             label: '연이율(%)',
-                            borderColor: '{self.colors["purple"]}',
+                            borderColor: 'COLOR_PURPLE_PLACEHOLDER',
                             backgroundColor: 'transparent',
                             data: supplierRateData,
                             yAxisID: 'y-rate',
                             borderWidth: 3,
                             pointRadius: 5
-                        }}
+                        }
                     ]
-                }},
-                options: {{
+                },
+                options: {
                     responsive: true,
                     maintainAspectRatio: false,
-                    scales: {{
-                        'y-days': {{
+                    scales: {
+                        'y-days': {
                             type: 'linear',
                             display: true,
                             position: 'left',
                             beginAtZero: true,
                             max: 80,
-                            title: {{
+                            title: {
                                 display: true,
                                 text: '대기 일수'
-                            }}
-                        }},
-                        'y-rate': {{
+                            }
+                        },
+                        'y-rate': {
                             type: 'linear',
                             display: true,
                             position: 'right',
                             beginAtZero: true,
                             max: 5,
-                            grid: {{
+                            grid: {
                                 drawOnChartArea: false
-                            }},
-                            title: {{
+                            },
+                            title: {
                                 display: true,
                                 text: '연이율(%)'
-                            }}
-                        }}
-                    }},
-                    plugins: {{
-                        title: {{
+                            }
+                        }
+                    },
+                    plugins: {
+                        title: {
                             display: true,
                             text: '대기 일수 및 연이율'
-                        }},
-                        tooltip: {{
-                            callbacks: {{
-                                label: function(context) {{
+                        },
+                        tooltip: {
+                            callbacks: {
+                                label: function(context) {
                                     let label = context.dataset.label || '';
-                                    if (label) {{
+                                    if (label) {
                                         label += ': ';
-                                    }}
-                                    if (context.dataset.label === '대기 일수') {{
+                                    }
+                                    if (context.dataset.label === '대기 일수') {
                                         return label + context.parsed.y + '일';
-                                    }} else {{
+                                    } else {
                                         return label + context.parsed.y + '%';
-                                    }}
-                                }}
-                            }}
-                        }}
-                    }}
-                }}
-            }});
+                                    }
+                                }
+                            }
+                        }
+                    }
+                }
+            });
             
             // 공급업체 관점 차트 2 - 금융 비용 및 수령액
             const supplierFinanceCtx = document.getElementById('supplierFinanceChart').getContext('2d');
             
             // 공급업체 금융 데이터
-            const supplierCostData = {json.dumps([item["financingCost"] for item in self.supplier_perspective_data])};
-            const supplierNetData = {json.dumps([item["netAmount"] for item in self.supplier_perspective_data])};
+            const supplierCostData = SUPPLIER_FINANCING_COST_PLACEHOLDER;
+            const supplierNetData = SUPPLIER_NET_AMOUNT_PLACEHOLDER;
             
             // 공급업체 금융 비용 및 수령액 차트
-            new Chart(supplierFinanceCtx, {{
+            new Chart(supplierFinanceCtx, {
                 type: 'bar',
-                data: {{
+                data: {
                     labels: supplierLabels,
                     datasets: [
-                        {{
+                        {
                             label: '금융 비용',
                             backgroundColor: 'rgba(244, 67, 54, 0.7)',
                             data: supplierCostData,
                             yAxisID: 'y-cost',
-                        }},
-                        {{
+                        },
+                        {
                             type: 'line',
                             label: '수령액',
-                            borderColor: '{self.colors["green"]}',
+                            borderColor: 'COLOR_GREEN_PLACEHOLDER',
                             backgroundColor: 'transparent',
                             data: supplierNetData,
                             yAxisID: 'y-net',
                             borderWidth: 3,
                             pointRadius: 5
-                        }}
+                        }
                     ]
-                }},
-                options: {{
+                },
+                options: {
                     responsive: true,
                     maintainAspectRatio: false,
-                    scales: {{
-                        'y-cost': {{
+                    scales: {
+                        'y-cost': {
                             type: 'linear',
                             display: true,
                             position: 'left',
                             beginAtZero: true,
-                            title: {{
+                            title: {
                                 display: true,
                                 text: '금융 비용($)'
-                            }}
-                        }},
-                        'y-net': {{
+                            }
+                        },
+                        'y-net': {
                             type: 'linear',
                             display: true,
                             position: 'right',
                             min: 992,
                             max: 1000,
-                            grid: {{
+                            grid: {
                                 drawOnChartArea: false
-                            }},
-                            title: {{
+                            },
+                            title: {
                                 display: true,
                                 text: '수령액($)'
-                            }}
-                        }}
-                    }},
-                    plugins: {{
-                        title: {{
+                            }
+                        }
+                    },
+                    plugins: {
+                        title: {
                             display: true,
                             text: '금융 비용 및 수령액'
-                        }},
-                        tooltip: {{
-                            callbacks: {{
-                                label: function(context) {{
+                        },
+                        tooltip: {
+                            callbacks: {
+                                label: function(context) {
                                     let label = context.dataset.label || '';
-                                    if (label) {{
+                                    if (label) {
                                         label += ': ';
-                                    }}
+                                    }
                                     return label + '$' + context.parsed.y.toFixed(2);
-                                }}
-                            }}
-                        }}
-                    }}
-                }}
-            }});
+                                }
+                            }
+                        }
+                    }
+                }
+            });
             
             // P&G 관점 차트
             const pgPerspectiveCtx = document.getElementById('pgPerspectiveChart').getContext('2d');
             
             // P&G 데이터
-            const pgLabels = {json.dumps([item["name"] for item in self.pg_perspective_data])};
-            const pgDPOData = {json.dumps([item["DPO"] for item in self.pg_perspective_data])};
-            const pgWorkingCapitalData = {json.dumps([item["workingCapitalImpact"] for item in self.pg_perspective_data])};
+            const pgLabels = PG_NAME_PLACEHOLDER;
+            const pgDPOData = PG_DPO_PLACEHOLDER;
+            const pgWorkingCapitalData = PG_WORKING_CAPITAL_IMPACT_PLACEHOLDER;
             
             // P&G 차트 생성
-            new Chart(pgPerspectiveCtx, {{
+            new Chart(pgPerspectiveCtx, {
                 type: 'bar',
-                data: {{
+                data: {
                     labels: pgLabels,
                     datasets: [
-                        {{
+                        {
                             label: 'DPO',
                             backgroundColor: 'rgba(156, 39, 176, 0.7)',
                             data: pgDPOData,
                             yAxisID: 'y-dpo',
-                        }},
-                        {{
+                        },
+                        {
                             label: '운전자본 개선',
                             backgroundColor: 'rgba(76, 175, 80, 0.7)',
                             data: pgWorkingCapitalData,
                             yAxisID: 'y-workingCapital',
-                        }}
+                        }
                     ]
-                }},
-                options: {{
+                },
+                options: {
                     responsive: true,
                     maintainAspectRatio: false,
-                    scales: {{
-                        'y-dpo': {{
+                    scales: {
+                        'y-dpo': {
                             type: 'linear',
                             display: true,
                             position: 'left',
                             beginAtZero: true,
                             max: 80,
-                            title: {{
+                            title: {
                                 display: true,
                                 text: 'DPO'
-                            }}
-                        }},
-                        'y-workingCapital': {{
+                            }
+                        },
+                        'y-workingCapital': {
                             type: 'linear',
                             display: true,
                             position: 'right',
                             beginAtZero: true,
                             max: 50,
-                            grid: {{
+                            grid: {
                                 drawOnChartArea: false
-                            }},
-                            title: {{
+                            },
+                            title: {
                                 display: true,
                                 text: '운전자본 개선'
-                            }}
-                        }}
-                    }},
-                    plugins: {{
-                        title: {{
+                            }
+                        }
+                    },
+                    plugins: {
+                        title: {
                             display: true,
                             text: 'P&G 관점에서의 효과'
-                        }},
-                        tooltip: {{
-                            callbacks: {{
-                                label: function(context) {{
+                        },
+                        tooltip: {
+                            callbacks: {
+                                label: function(context) {
                                     let label = context.dataset.label || '';
-                                    if (label) {{
+                                    if (label) {
                                         label += ': ';
-                                    }}
-                                    if (context.dataset.label === 'DPO') {{
+                                    }
+                                    if (context.dataset.label === 'DPO') {
                                         return label + context.parsed.y + '일';
-                                    }} else {{
+                                    } else {
                                         return label + context.parsed.y + '%';
-                                    }}
-                                }}
-                            }}
-                        }}
-                    }}
-                }}
-            }});
-        }});
+                                    }
+                                }
+                            }
+                        }
+                    }
+                }
+            });
+        });
         </script>
-        """
         
-        # 닫는 태그 추가
-        html_code += """
         </body>
         </html>
         """
-        
-        return html_code
-    
-def pg_scf_economics_viz():
+
+
+# 템플릿은 모듈 임포트 시점에 한 번만 토큰화
+_COMPILED_TEMPLATE = CompiledTemplate(PGSCFEconomicsGenerator._get_html_template())
+
+
+def pg_scf_economics_viz(title: str = "P&G SCF 프로그램의 경제적 효과 분석"):
     """Streamlit 앱에서 호출할 P&G SCF 경제적 효과 시각화 함수"""
-    st.title("P&G SCF 프로그램의 경제적 효과 분석")
+    import streamlit as st
+
+    st.title(title)
     
     # 컴포넌트 생성기 초기화
     generator = PGSCFEconomicsGenerator()
@@ -943,4 +900,4 @@ def pg_scf_economics_viz():
     st.components.v1.html(html_code, height=2500, scrolling=True)
 
 if __name__ == "__main__":
-    pg_scf_economics_viz() 
\ No newline at end of file
+    pg_scf_economics_viz() 
@@ -1,5 +1,7 @@
 import json
 from typing import Dict, Any
+from html_cache import memoize_html
+from instrumentation import instrument_render
 
 class PGSCFEconomicsQ2Generator:
     """Q2 시각화를 위한 메시지 카드 컴포넌트 생성기"""
@@ -75,6 +77,12 @@ class PGSCFEconomicsQ2Generator:
             }
         }
     
+    def _cache_inputs(self):
+        """HTML 캐시 키 계산에 사용되는 입력 데이터 반환"""
+        return self.data
+    
+    @instrument_render
+    @memoize_html
     def generate_html(self) -> str:
         """메시지 카드 형식의 HTML 코드 생성"""
         return f"""
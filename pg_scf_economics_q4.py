@@ -1,12 +1,25 @@
 import streamlit as st
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 import json
 import os
+from data_provider import MarketDataProvider
+from html_cache import memoize_html
+from instrumentation import instrument_render
 
 class PGSCFEconomicsQ4Generator:
     """P&G SCF 경제적 효과 시각화를 위한 HTML 생성기 - Q4 버전"""
     
-    def __init__(self):
+    def __init__(self, data_provider: Optional[MarketDataProvider] = None,
+                 portfolio_suppliers: int = 50_000, portfolio_seed: int = 2013):
+        """
+        Args:
+            data_provider: 시장 데이터를 제공하는 객체 (공급업체 포트폴리오의 등급별 조달 금리)
+            portfolio_suppliers: 가상 공급업체 포트폴리오의 공급업체 수
+            portfolio_seed: 포트폴리오 시뮬레이션 난수 시드
+        """
+        self.data_provider = data_provider or MarketDataProvider()
+        self.portfolio_suppliers = portfolio_suppliers
+        self.portfolio_seed = portfolio_seed
         self.template = """
         <!DOCTYPE html>
         <html>
@@ -257,6 +270,8 @@ class PGSCFEconomicsQ4Generator:
                     </div>
                 </div>
 
+                __SUPPLIER_PORTFOLIO_SECTION__
+
                 <!-- Potential Losers -->
                 <div class="bg-white rounded-xl p-6 shadow-md mb-8">
                     <h3 class="text-xl font-bold text-red-800 mb-4">손해를 볼 수 있는 당사자</h3>
@@ -368,9 +383,63 @@ class PGSCFEconomicsQ4Generator:
         </html>
         """
     
+    def _cache_inputs(self):
+        """HTML 캐시 키 계산에 사용되는 입력 데이터 반환"""
+        return [self.template, self.data_provider.corporate_bond_yields_data, self.portfolio_suppliers, self.portfolio_seed]
+    
+    def _portfolio_section(self) -> str:
+        """가상 공급업체 포트폴리오의 등급별 SCF 참여/비용 요약 섹션 HTML (집계 값만 포함)"""
+        result = self.data_provider.simulate_supplier_portfolio(self.portfolio_suppliers, self.portfolio_seed)
+        totals = result["totals"]
+        cards = [
+            ("P&G 외상매입금 증가", totals["payablesIncrease"], "지급 기간 연장으로 늘어난 운전자본"),
+            ("SCF 참여 공급업체 절감액", totals["supplierSavings"], f"참여 {totals['scfSuppliers']:,}개 업체의 연간 조달 비용 감소"),
+            ("은행 스프레드 수익", totals["bankSpreadIncome"], "SCF 할인 채권의 연간 스프레드 수익"),
+        ]
+        card_html = "".join(f"""
+                    <div class="p-3 bg-blue-50 rounded">
+                        <p class="font-semibold text-blue-800 mb-1">{label}</p>
+                        <p class="text-2xl font-bold">${value:,.0f}M</p>
+                        <p class="text-xs text-gray-500 mt-1">{note}</p>
+                    </div>""" for label, value, note in cards)
+        rows = "".join(
+            f'<tr class="border-b"><td class="py-2 px-3 text-left">{row["rating"]}</td>'
+            f'<td class="py-2 px-3 text-right">{row["borrowingRate"]:.2f}%</td>'
+            f'<td class="py-2 px-3 text-right">{row["suppliers"]:,}</td>'
+            f'<td class="py-2 px-3 text-right">{row["scfSuppliers"]:,}</td>'
+            f'<td class="py-2 px-3 text-right">{row["payablesIncrease"]:,.0f}</td>'
+            f'<td class="py-2 px-3 text-right">{row["ownCost"]:,.1f}</td>'
+            f'<td class="py-2 px-3 text-right">{row["supplierSavings"]:,.1f}</td>'
+            f'<td class="py-2 px-3 text-right">{row["bankSpreadIncome"]:,.1f}</td></tr>'
+            for row in result["byRating"]
+        )
+        headers = ("등급", "자체 조달 금리", "공급업체", "SCF 참여", "외상매입금 증가", "SCF 없는 조달 비용", "공급업체 절감액", "은행 수익")
+        header_html = "".join(
+            f'<th class="py-2 px-3 {"text-left" if i == 0 else "text-right"}">{header}</th>' for i, header in enumerate(headers)
+        )
+        return f"""<!-- Supplier Portfolio Simulation -->
+                <div class="bg-white rounded-xl p-6 shadow-md mb-8">
+                    <h3 class="text-xl font-bold text-blue-800 mb-2">가상 공급업체 포트폴리오 ({totals['suppliers']:,}개 업체)</h3>
+                    <p class="text-sm text-gray-600 mb-4">
+                        회사채 등급별 조달 금리로 공급업체를 생성해, SCF 금리(LIBOR + 스프레드)가 자체 조달 금리보다 낮은 업체만
+                        참여한다고 가정한 연간 효과 (백만 달러, 시드 {result['seed']})
+                    </p>
+                    <div class="grid grid-cols-1 md:grid-cols-3 gap-4 mb-4">{card_html}
+                    </div>
+                    <table class="w-full text-sm">
+                        <thead><tr class="border-b">{header_html}</tr></thead>
+                        <tbody>{rows}</tbody>
+                    </table>
+                    <p class="text-xs text-gray-500 mt-2">
+                        SCF에 참여하지 않는 업체는 연장된 지급 기간을 자체 조달로 메워야 하므로 연장의 비용을 그대로 부담합니다.
+                    </p>
+                </div>"""
+    
+    @instrument_render
+    @memoize_html
     def generate_html(self) -> str:
         """HTML 코드를 생성합니다."""
-        return self.template
+        return self.template.replace("__SUPPLIER_PORTFOLIO_SECTION__", self._portfolio_section())
 
 def pg_scf_economics_q4_viz():
     """Streamlit 앱에서 호출할 P&G SCF 경제적 효과 시각화 함수 - Q4 버전"""
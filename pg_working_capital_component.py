@@ -1,6 +1,9 @@
 import json
 from typing import Dict, Any, List
 from data_provider import MarketDataProvider
+from html_cache import memoize_html
+from instrumentation import instrument_render
+from template_engine import to_columnar
 
 class PGWorkingCapitalComponentGenerator:
     """P&G 운전자본 관련 컴포넌트 생성 클래스"""
@@ -16,6 +19,12 @@ class PGWorkingCapitalComponentGenerator:
         self.working_capital_data = data_provider.pg_working_capital_data
         self.extended_working_capital_data = data_provider.pg_extended_working_capital_data
     
+    def _cache_inputs(self):
+        """HTML 캐시 키 계산에 사용되는 입력 데이터 반환"""
+        return self.extended_working_capital_data
+    
+    @instrument_render
+    @memoize_html
     def generate_html(self) -> str:
         """
         P&G 운전자본 시각화를 위한 HTML 생성
@@ -23,8 +32,8 @@ class PGWorkingCapitalComponentGenerator:
         Returns:
             str: HTML 코드
         """
-        # 데이터 준비
-        extended_working_capital_json = json.dumps(self.extended_working_capital_data)
+        # 데이터 준비 - 열 형식({필드: [값...]})으로 삽입해 차트가 배열을 바로 사용
+        extended_working_capital_json = json.dumps(to_columnar(self.extended_working_capital_data))
         
         # Timeline 데이터
         timeline_data = [
@@ -264,7 +273,7 @@ class PGWorkingCapitalComponentGenerator:
         차트 스크립트 생성
         
         Args:
-            extended_working_capital_json: 확장된 운전자본 데이터 JSON 문자열
+            extended_working_capital_json: 확장된 운전자본 데이터 열 형식 JSON 문자열
             
         Returns:
             str: 차트 스크립트
@@ -287,11 +296,11 @@ class PGWorkingCapitalComponentGenerator:
             new Chart(wcMetricsCtx, {{
                 type: 'line',
                 data: {{
-                    labels: data.map(d => d.year),
+                    labels: data.year,
                     datasets: [
                         {{
                             label: '매출채권회수기간(DSO)',
-                            data: data.map(d => d.dso),
+                            data: data.dso,
                             borderColor: colors.dso,
                             backgroundColor: colors.dso,
                             fill: false,
@@ -299,7 +308,7 @@ class PGWorkingCapitalComponentGenerator:
                         }},
                         {{
                             label: '재고자산회전기간(DIO)',
-                            data: data.map(d => d.dio),
+                            data: data.dio,
                             borderColor: colors.dio,
                             backgroundColor: colors.dio,
                             fill: false,
@@ -307,7 +316,7 @@ class PGWorkingCapitalComponentGenerator:
                         }},
                         {{
                             label: '매입채무지급기간(DPO)',
-                            data: data.map(d => d.dpo),
+                            data: data.dpo,
                             borderColor: colors.dpo,
                             backgroundColor: colors.dpo,
                             fill: false,
@@ -315,7 +324,7 @@ class PGWorkingCapitalComponentGenerator:
                         }},
                         {{
                             label: '현금전환주기(CCC)',
-                            data: data.map(d => d.ccc),
+                            data: data.ccc,
                             borderColor: colors.ccc,
                             backgroundColor: colors.ccc,
                             fill: false,
@@ -361,11 +370,11 @@ class PGWorkingCapitalComponentGenerator:
             new Chart(cccCtx, {{
                 type: 'bar',
                 data: {{
-                    labels: data.map(d => d.year),
+                    labels: data.year,
                     datasets: [
                         {{
                             label: '현금전환주기(CCC)',
-                            data: data.map(d => d.ccc),
+                            data: data.ccc,
                             backgroundColor: colors.ccc,
                             borderColor: colors.ccc,
                             borderWidth: 1
@@ -406,11 +415,11 @@ class PGWorkingCapitalComponentGenerator:
             new Chart(dpoCtx, {{
                 type: 'line',
                 data: {{
-                    labels: data.map(d => d.year),
+                    labels: data.year,
                     datasets: [
                         {{
                             label: '매입채무지급기간(DPO)',
-                            data: data.map(d => d.dpo),
+                            data: data.dpo,
                             borderColor: colors.dpo,
                             backgroundColor: colors.dpo,
                             fill: false,
@@ -418,7 +427,7 @@ class PGWorkingCapitalComponentGenerator:
                         }},
                         {{
                             label: '조정된 DPO',
-                            data: data.map(d => d.adjustedDpo),
+                            data: data.adjustedDpo,
                             borderColor: colors.adjustedDpo,
                             backgroundColor: colors.adjustedDpo,
                             fill: false,
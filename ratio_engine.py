@@ -0,0 +1,145 @@
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Mapping, Optional, Sequence, Tuple
+
+import numpy as np
+
+from html_cache import stable_hash
+
+DAYS_PER_YEAR = 365
+
+
+def _pct(numerator: str, denominator: str) -> Tuple[Tuple[str, ...], Callable[..., np.ndarray]]:
+    return (numerator, denominator), lambda num, den: num / den * 100
+
+
+# 비율 이름 -> (필요한 원본 열, 계산 함수) - 모든 계산은 배열 단위(회사 x 기간 등 임의의 모양)
+RATIO_DEFINITIONS: "OrderedDict[str, Tuple[Tuple[str, ...], Callable[..., np.ndarray]]]" = OrderedDict([
+    # 손익 마진 (매출 대비 %)
+    ("cogsRatio", _pct("cogs", "revenue")),
+    ("sgaRatio", _pct("sga", "revenue")),
+    ("grossMargin", _pct("grossProfit", "revenue")),
+    ("operatingMargin", _pct("operatingIncome", "revenue")),
+    ("netMargin", _pct("netIncome", "revenue")),
+    # 운전자본 회전일수
+    ("daysReceivables", (("accountsReceivable", "revenue"), lambda ar, revenue: ar / revenue * DAYS_PER_YEAR)),
+    ("daysInventory", (("inventory", "cogs"), lambda inventory, cogs: inventory / cogs * DAYS_PER_YEAR)),
+    ("daysPayables", (("accountsPayable", "cogs"), lambda ap, cogs: ap / cogs * DAYS_PER_YEAR)),
+    # 유동성/레버리지
+    ("currentRatio", (("currentAssets", "currentLiabilities"), lambda assets, liabilities: assets / liabilities)),
+    ("financialLeverage", (("totalAssets", "totalEquity"), lambda assets, equity: assets / equity)),
+    ("debtToTotalCapital", (("totalDebt", "totalEquity"), lambda debt, equity: debt / (debt + equity) * 100)),
+])
+
+# 다른 비율에서 파생되는 비율 (DSO + DIO - DPO)
+_CCC_INPUTS = ("daysReceivables", "daysInventory", "daysPayables")
+
+
+def compute_ratios(
+    columns: Mapping[str, Any],
+    ratios: Optional[Sequence[str]] = None,
+    decimals: Optional[int] = 1,
+) -> Dict[str, np.ndarray]:
+    """
+    원본 재무제표 열에서 비율을 한 번에 계산
+
+    Args:
+        columns: 열 이름 -> 값 배열 (모양이 같거나 브로드캐스트 가능해야 함, 예: 회사 x 기간)
+                 필요한 열만 float64로 변환하므로 라벨 같은 다른 열이 섞여 있어도 됨
+        ratios: 계산할 비율 이름 (None이면 입력 열로 계산 가능한 모든 비율)
+        decimals: 반올림 자릿수 (None이면 반올림하지 않음)
+
+    Returns:
+        Dict[str, np.ndarray]: 비율 이름 -> float64 배열 (0으로 나누면 inf/NaN)
+
+    Raises:
+        KeyError: 요청한 비율에 필요한 열이 없을 때
+    """
+    if ratios is None:
+        ratios = [name for name, (inputs, _) in RATIO_DEFINITIONS.items() if all(column in columns for column in inputs)]
+        if all(name in ratios for name in _CCC_INPUTS):
+            ratios.append("cashConversionCycle")
+
+    raw: Dict[str, np.ndarray] = {}
+
+    def ratio(name: str) -> np.ndarray:
+        if name not in raw:
+            if name == "cashConversionCycle":
+                # 반올림 전 회전일수로 계산
+                dso, dio, dpo = (ratio(days) for days in _CCC_INPUTS)
+                raw[name] = dso + dio - dpo
+            elif name in RATIO_DEFINITIONS:
+                inputs, formula = RATIO_DEFINITIONS[name]
+                missing = [column for column in inputs if column not in columns]
+                if missing:
+                    raise KeyError(f"{name} 계산에 필요한 열이 없습니다: {', '.join(missing)}")
+                raw[name] = formula(*(np.asarray(columns[column], dtype=np.float64) for column in inputs))
+            else:
+                raise KeyError(f"알 수 없는 비율: {name}")
+        return raw[name]
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        results = {name: ratio(name) for name in ratios}
+    if decimals is not None:
+        results = {name: np.round(values, decimals) for name, values in results.items()}
+    return results
+
+
+def records_to_columns(records: Sequence[Mapping[str, Any]], fields: Optional[Sequence[str]] = None) -> Dict[str, np.ndarray]:
+    """행(dict) 목록을 열 배열로 변환 (fields가 None이면 첫 행의 숫자 필드 전체)"""
+    if fields is None:
+        fields = [name for name, value in records[0].items() if isinstance(value, (int, float)) and not isinstance(value, bool)]
+    return {name: np.array([record[name] for record in records], dtype=np.float64) for name in fields}
+
+
+class RatioCache:
+    """데이터셋 버전(내용 해시)별 비율 계산 결과 캐시 (스레드 안전)"""
+
+    def __init__(self, max_entries: int = 64):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Tuple[str, Optional[Tuple[str, ...]], Optional[int]], Dict[str, np.ndarray]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(
+        self,
+        columns: Mapping[str, Any],
+        ratios: Optional[Sequence[str]] = None,
+        decimals: Optional[int] = 1,
+        version: Optional[str] = None,
+    ) -> Dict[str, np.ndarray]:
+        """
+        compute_ratios의 캐시된 버전
+
+        Args:
+            columns: 원본 열
+            ratios: 계산할 비율 이름
+            decimals: 반올림 자릿수
+            version: columns 내용을 식별하는 버전 (예: DatasetStore.version + 데이터셋 이름)
+                     None이면 열 내용으로 해시 계산
+
+        Returns:
+            Dict[str, np.ndarray]: 읽기 전용 비율 배열 (캐시가 공유하므로 수정 금지)
+        """
+        key = (version or stable_hash({name: np.asarray(value).tolist() for name, value in columns.items()}),
+               tuple(ratios) if ratios is not None else None, decimals)
+        with self._lock:
+            result = self._entries.get(key)
+            if result is not None:
+                self.hits += 1
+                self._entries.move_to_end(key)
+                return result
+            self.misses += 1
+        result = compute_ratios(columns, ratios, decimals)
+        for values in result.values():
+            values.flags.writeable = False
+        with self._lock:
+            self._entries[key] = result
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return result
+
+
+# 프로세스 단위 비율 캐시
+ratio_cache = RatioCache()
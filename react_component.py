@@ -1,9 +1,14 @@
-import json
 from data_provider import MarketDataProvider
+from html_cache import memoize_html
+from instrumentation import instrument_render
+from lazy_charts import with_lazy_charts
+from template_engine import CompiledTemplate, placeholder_values
 
 class ReactComponentGenerator:
     """React 컴포넌트 HTML 코드를 생성하는 클래스"""
     
+    lazy_charts = True  # 금리 차트 7개
+    
     def __init__(self, data_provider: MarketDataProvider):
         """
         Args:
@@ -11,40 +16,22 @@ class ReactComponentGenerator:
         """
         self.data_provider = data_provider
     
+    def _cache_inputs(self):
+        """HTML 캐시 키 계산에 사용되는 입력 데이터 반환"""
+        return self.data_provider.get_all_data()
+    
+    @instrument_render
+    @with_lazy_charts
+    @memoize_html
     def generate_html(self) -> str:
         """React 컴포넌트를 포함한 HTML 코드를 생성하여 반환"""
-        html_template = self._get_html_template()
-        data_dict = self.data_provider.get_all_data()
-        
-        # 데이터 디버깅 (로그에 데이터 출력)
-        for key, value in data_dict.items():
-            print(f"데이터 키: {key}, 타입: {type(value)}, 길이: {len(value) if hasattr(value, '__len__') else 'N/A'}")
-            print(f"데이터 샘플: {str(value)[:100]}...")
-        
-        # 데이터를 HTML에 삽입 - JSON 문자열로 변환하여 삽입
-        for key, value in data_dict.items():
-            placeholder = f"{key.upper()}_PLACEHOLDER"
-            
-            # JSON 직렬화 시 오류 방지를 위한 안전한 변환
-            try:
-                json_data = json.dumps(value, ensure_ascii=False)
-                # JSON 문자열에서 따옴표를 HTML 엔티티로 변환하여 충돌 방지
-                # json_data = json_data.replace('"', '&quot;')
-            except Exception as e:
-                print(f"JSON 직렬화 오류 ({key}): {e}")
-                # 오류 발생 시 빈 배열로 대체
-                json_data = "[]"
-            
-            # 플레이스홀더 치환
-            if placeholder in html_template:
-                html_template = html_template.replace(placeholder, json_data)
-                print(f"플레이스홀더 {placeholder} 치환 완료")
-            else:
-                print(f"경고: 플레이스홀더 {placeholder}를 찾을 수 없음")
-        
-        return html_template
+        # 데이터를 HTML에 삽입 - 전체 데이터 중 템플릿에 있는 플레이스홀더만 열 형식 JSON으로 변환
+        return _COMPILED_TEMPLATE.render_json(
+            placeholder_values(self.data_provider.get_all_data()), allow_unknown=True, columnar=True, ensure_ascii=False
+        )
     
-    def _get_html_template(self) -> str:
+    @staticmethod
+    def _get_html_template() -> str:
         """HTML 템플릿 반환 - 수정된 버전"""
         return """
         <!DOCTYPE html>
@@ -368,6 +355,24 @@ class ReactComponentGenerator:
                     ]
                 };
                 
+                // 행 배열(샘플 데이터)과 열 형식({필드: [값...]}) 데이터를 모두 열 형식으로 맞춤
+                function toColumns(data) {
+                    if (Array.isArray(data)) {
+                        const columns = {};
+                        data.forEach((row, index) => Object.keys(row).forEach(key => {
+                            (columns[key] = columns[key] || Array.from({ length: data.length }))[index] = row[key];
+                        }));
+                        return columns;
+                    }
+                    return data && typeof data === 'object' ? data : {};
+                }
+                
+                // 열 하나를 차트 배열로 반환 - 값이 없으면 기본값 (item.field || 기본값과 같음)
+                function column(columns, field, fallback) {
+                    const length = (Object.values(columns)[0] || []).length;
+                    return (columns[field] || Array.from({ length })).map(value => value || fallback);
+                }
+                
                 // 데이터 로드 및 파싱 함수
                 function getDataFromJson() {
                     debugLog('데이터 파싱 시작');
@@ -434,16 +439,16 @@ class ReactComponentGenerator:
                     console.log('Treasury data:', data);
                     
                     // 데이터가 배열인지 확인하고 아니면 빈 배열로 기본값 설정
-                    const chartData = Array.isArray(data) ? data : [];
+                    const chartData = toColumns(data);
                     const ctx = document.getElementById('treasuryYieldsChart').getContext('2d');
                     
                     return new Chart(ctx, {
                         type: 'line',
                         data: {
-                            labels: chartData.map(item => item.maturity || ''),
+                            labels: column(chartData, 'maturity', ''),
                             datasets: [{
                                 label: '수익률',
-                                data: chartData.map(item => item.yield || 0),
+                                data: column(chartData, 'yield', 0),
                                 backgroundColor: 'rgba(136, 132, 216, 0.2)',
                                 borderColor: '#8884d8',
                                 borderWidth: 2,
@@ -486,16 +491,16 @@ class ReactComponentGenerator:
                     console.log('Corporate bond data:', data);
                     
                     // 데이터가 배열인지 확인하고 아니면 빈 배열로 기본값 설정
-                    const chartData = Array.isArray(data) ? data : [];
+                    const chartData = toColumns(data);
                     const ctx = document.getElementById('corporateBondYieldsChart').getContext('2d');
                     
                     return new Chart(ctx, {
                         type: 'bar',
                         data: {
-                            labels: chartData.map(item => item.rating || ''),
+                            labels: column(chartData, 'rating', ''),
                             datasets: [{
                                 label: '수익률',
-                                data: chartData.map(item => item.yield || 0),
+                                data: column(chartData, 'yield', 0),
                                 backgroundColor: '#82ca9d',
                                 borderColor: '#82ca9d',
                                 borderWidth: 1
@@ -537,16 +542,16 @@ class ReactComponentGenerator:
                     console.log('Short term rates data:', data);
                     
                     // 데이터가 배열인지 확인하고 아니면 빈 배열로 기본값 설정
-                    const chartData = Array.isArray(data) ? data : [];
+                    const chartData = toColumns(data);
                     const ctx = document.getElementById('shortTermRatesChart').getContext('2d');
                     
                     return new Chart(ctx, {
                         type: 'bar',
                         data: {
-                            labels: chartData.map(item => item.type || ''),
+                            labels: column(chartData, 'type', ''),
                             datasets: [{
                                 label: '금리',
-                                data: chartData.map(item => item.rate || 0),
+                                data: column(chartData, 'rate', 0),
                                 backgroundColor: '#8884d8',
                                 borderColor: '#8884d8',
                                 borderWidth: 1
@@ -588,18 +593,18 @@ class ReactComponentGenerator:
                     console.log('SCF rate simulation data:', data);
                     
                     // 데이터가 배열인지 확인하고 아니면 빈 배열로 기본값 설정
-                    const chartData = Array.isArray(data) ? data : [];
+                    const chartData = toColumns(data);
                     
                     // 첫 번째 차트: SCF 할인율 구성 요소
                     const ctx1 = document.getElementById('scfRateSimulationChart1').getContext('2d');
                     const chart1 = new Chart(ctx1, {
                         type: 'bar',
                         data: {
-                            labels: chartData.map(item => item.scenario || ''),
+                            labels: column(chartData, 'scenario', ''),
                             datasets: [
                                 {
                                     label: 'LIBOR',
-                                    data: chartData.map(item => item.libor || 0),
+                                    data: column(chartData, 'libor', 0),
                                     backgroundColor: '#8884d8',
                                     borderColor: '#8884d8',
                                     borderWidth: 1,
@@ -607,7 +612,7 @@ class ReactComponentGenerator:
                                 },
                                 {
                                     label: '스프레드',
-                                    data: chartData.map(item => item.spread || 0),
+                                    data: column(chartData, 'spread', 0),
                                     backgroundColor: '#82ca9d',
                                     borderColor: '#82ca9d',
                                     borderWidth: 1,
@@ -653,10 +658,10 @@ class ReactComponentGenerator:
                     const chart2 = new Chart(ctx2, {
                         type: 'bar',
                         data: {
-                            labels: chartData.map(item => item.scenario || ''),
+                            labels: column(chartData, 'scenario', ''),
                             datasets: [{
                                 label: '연간 비용 (% of 거래액)',
-                                data: chartData.map(item => item.costYear || 0),
+                                data: column(chartData, 'costYear', 0),
                                 backgroundColor: '#ff8042',
                                 borderColor: '#ff8042',
                                 borderWidth: 1
@@ -700,31 +705,31 @@ class ReactComponentGenerator:
                     console.log('Ratings comparison data:', data);
                     
                     // 데이터가 배열인지 확인하고 아니면 빈 배열로 기본값 설정
-                    const chartData = Array.isArray(data) ? data : [];
+                    const chartData = toColumns(data);
                     const ctx = document.getElementById('ratingsComparisonChart').getContext('2d');
                     
                     return new Chart(ctx, {
                         type: 'bar',
                         data: {
-                            labels: chartData.map(item => item.rating || ''),
+                            labels: column(chartData, 'rating', ''),
                             datasets: [
                                 {
                                     label: '일반 자금조달 비용',
-                                    data: chartData.map(item => item.borrowingCost || 0),
+                                    data: column(chartData, 'borrowingCost', 0),
                                     backgroundColor: '#ff8042',
                                     borderColor: '#ff8042',
                                     borderWidth: 1
                                 },
                                 {
                                     label: 'SCF 할인율',
-                                    data: chartData.map(item => item.scfDiscount || 0),
+                                    data: column(chartData, 'scfDiscount', 0),
                                     backgroundColor: '#82ca9d',
                                     borderColor: '#82ca9d',
                                     borderWidth: 1
                                 },
                                 {
                                     label: '비용 차이',
-                                    data: chartData.map(item => item.costDifference || 0),
+                                    data: column(chartData, 'costDifference', 0),
                                     backgroundColor: '#8884d8',
                                     borderColor: '#8884d8',
                                     borderWidth: 1
@@ -767,16 +772,16 @@ class ReactComponentGenerator:
                     console.log('Historical LIBOR data:', data);
                     
                     // 데이터가 배열인지 확인하고 아니면 빈 배열로 기본값 설정
-                    const chartData = Array.isArray(data) ? data : [];
+                    const chartData = toColumns(data);
                     const ctx = document.getElementById('historicalLiborChart').getContext('2d');
                     
                     return new Chart(ctx, {
                         type: 'line',
                         data: {
-                            labels: chartData.map(item => item.date || ''),
+                            labels: column(chartData, 'date', ''),
                             datasets: [{
                                 label: '3개월 LIBOR',
-                                data: chartData.map(item => item.libor3m || 0),
+                                data: column(chartData, 'libor3m', 0),
                                 backgroundColor: 'rgba(136, 132, 216, 0.2)',
                                 borderColor: '#8884d8',
                                 borderWidth: 2,
@@ -951,4 +956,8 @@ class ReactComponentGenerator:
             </script>
         </body>
         </html>
-        """
\ No newline at end of file
+        """
+
+
+# 템플릿은 모듈 임포트 시점에 한 번만 토큰화
+_COMPILED_TEMPLATE = CompiledTemplate(ReactComponentGenerator._get_html_template())
@@ -0,0 +1,288 @@
+import functools
+from dataclasses import dataclass
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+# 단기 금리(LIBOR) 일수 계산 관례: 실제 일수 / 360
+DAY_COUNT = 360
+# 인보이스 승인 후 SCF 은행이 조기지급하는 날 - 모든 시나리오의 자금 조달 기간 기준점
+EARLY_PAYMENT_DAY = 15
+# 2013년 이전 P&G 표준 지불조건 (일)
+STANDARD_TERMS_DAYS = 45
+
+
+@dataclass(frozen=True)
+class InvoiceEconomics:
+    """인보이스 배열의 SCF 경제성 계산 결과 (모든 필드는 입력을 브로드캐스트한 모양의 배열)"""
+    uses_scf: np.ndarray            # 은행 조기지급 여부 (days_to_receive < payment_days)
+    annual_rate: np.ndarray         # 적용 연이율 (%) - SCF면 LIBOR + 스프레드, 아니면 공급업체 조달 금리
+    financed_days: np.ndarray       # 자금 조달 기간 (조기지급일 ~ P&G 지급일)
+    discount_pct: np.ndarray        # 인보이스 금액 대비 할인율/조달 비용 (%)
+    financing_cost: np.ndarray      # 조달 비용 (금액)
+    net_proceeds: np.ndarray        # 공급업체 순수령액
+    pg_days_gained: np.ndarray      # P&G 운전자본 개선 일수 (표준 지불조건 대비 DPO 증가)
+
+    def summary(self, amount: Any) -> Dict[str, float]:
+        """인보이스 묶음 합계 (금액 가중 평균 할인율 포함)"""
+        amount = np.broadcast_to(np.asarray(amount, dtype=np.float64), self.financing_cost.shape)
+        return _summarize(amount, self)
+
+
+def price_invoices(
+    amount: Any,
+    payment_days: Any,
+    days_to_receive: Any,
+    supplier_rate: Any,
+    libor: Any,
+    spread: Any,
+    early_payment_day: Any = EARLY_PAYMENT_DAY,
+    standard_terms_days: Any = STANDARD_TERMS_DAYS,
+    day_count: int = DAY_COUNT,
+) -> InvoiceEconomics:
+    """
+    인보이스별 SCF 경제성을 배열 단위로 계산
+
+    공급업체는 조기지급일(early_payment_day)부터 현금을 받는 날까지의 기간을 자체 금리로
+    조달한다고 보고, SCF를 이용하면(days_to_receive < payment_days) 같은 기간을
+    은행이 LIBOR + 스프레드로 할인합니다. 금리 인자는 모두 연 % 단위입니다.
+
+    Args:
+        amount: 인보이스 금액
+        payment_days: P&G 지급일 (지불조건, 일)
+        days_to_receive: 공급업체가 현금을 받는 날 (SCF 이용 시 조기지급일)
+        supplier_rate: 공급업체 자체 조달 금리 (%)
+        libor: LIBOR (%)
+        spread: 은행 스프레드 (%)
+        early_payment_day: 조달 기간 기준일
+        standard_terms_days: P&G 운전자본 개선 일수 계산 기준 지불조건
+        day_count: 연 환산 일수
+
+    Returns:
+        InvoiceEconomics: 입력을 브로드캐스트한 모양의 결과 배열 (수백만 행도 한 번의 연산으로 처리)
+    """
+    amount = np.asarray(amount, dtype=np.float64)
+    payment_days = np.asarray(payment_days)
+    days_to_receive = np.asarray(days_to_receive)
+
+    uses_scf = days_to_receive < payment_days
+    annual_rate = np.where(uses_scf, np.add(libor, spread), np.asarray(supplier_rate, dtype=np.float64))
+    financed_days = np.maximum(payment_days - np.asarray(early_payment_day), 0)
+    discount_pct = annual_rate * financed_days / day_count
+    financing_cost = amount * discount_pct / 100
+    return InvoiceEconomics(
+        uses_scf=uses_scf,
+        annual_rate=annual_rate,
+        financed_days=financed_days,
+        discount_pct=discount_pct,
+        financing_cost=financing_cost,
+        net_proceeds=amount - financing_cost,
+        pg_days_gained=payment_days - np.asarray(standard_terms_days),
+    )
+
+
+def _summarize(amount: np.ndarray, result: InvoiceEconomics) -> Dict[str, float]:
+    total_amount = float(amount.sum())
+    total_cost = float(result.financing_cost.sum())
+    return {
+        "invoices": int(amount.size),
+        "scfInvoices": int(np.count_nonzero(result.uses_scf)),
+        "totalAmount": total_amount,
+        "totalFinancingCost": total_cost,
+        "totalNetProceeds": float(result.net_proceeds.sum()),
+        "weightedDiscountPct": total_cost / total_amount * 100 if total_amount else 0.0,
+        "pgDayWeightedAmount": float((amount * result.pg_days_gained).sum()),
+    }
+
+
+def _chunks(length: int, chunk_size: int) -> Iterator[slice]:
+    for start in range(0, length, chunk_size):
+        yield slice(start, min(start + chunk_size, length))
+
+
+def price_invoice_book(
+    amount: np.ndarray,
+    payment_days: np.ndarray,
+    days_to_receive: np.ndarray,
+    supplier_rate: Any,
+    libor: Any,
+    spread: Any,
+    chunk_size: int = 1_000_000,
+    **kwargs,
+) -> Dict[str, float]:
+    """
+    인보이스 장부 전체의 합계를 청크 단위로 계산 (결과 배열 전체를 메모리에 두지 않음)
+
+    Args:
+        amount, payment_days, days_to_receive: 길이가 같은 1차원 배열
+        supplier_rate, libor, spread: 스칼라 또는 같은 길이의 배열 (%)
+        chunk_size: 한 번에 계산할 행 수
+        **kwargs: price_invoices의 나머지 인자
+
+    Returns:
+        Dict[str, float]: 인보이스 수, SCF 이용 건수, 총액, 총 조달 비용, 총 순수령액,
+            금액 가중 평균 할인율(%), P&G DPO 증가 일수 x 금액 합계
+            (pgDayWeightedAmount / 365 = 연간 운전자본 개선 효과)
+    """
+    length = len(amount)
+    pick = lambda value, part: value[part] if np.ndim(value) else value
+    totals = {"invoices": 0, "scfInvoices": 0, "totalAmount": 0.0, "totalFinancingCost": 0.0,
+              "totalNetProceeds": 0.0, "pgDayWeightedAmount": 0.0}
+    for part in _chunks(length, chunk_size):
+        chunk_amount = np.asarray(amount[part], dtype=np.float64)
+        result = price_invoices(
+            chunk_amount, payment_days[part], days_to_receive[part],
+            pick(supplier_rate, part), pick(libor, part), pick(spread, part), **kwargs,
+        )
+        for key, value in _summarize(chunk_amount, result).items():
+            if key in totals:
+                totals[key] += value
+    totals["weightedDiscountPct"] = (
+        totals["totalFinancingCost"] / totals["totalAmount"] * 100 if totals["totalAmount"] else 0.0
+    )
+    return totals
+
+
+@dataclass(frozen=True)
+class SensitivityGrid:
+    """민감도 격자 축 정의 - 각 축은 (시작, 끝, 점 개수)"""
+    libor: Tuple[float, float, int] = (0.0, 2.0, 200)     # LIBOR (%)
+    spread: Tuple[float, float, int] = (0.25, 3.0, 200)   # 은행 스프레드 (%)
+    tenor: Tuple[float, float, int] = (1, 180, 180)       # 할인 기간 (일)
+
+    def axes(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """(LIBOR, 스프레드, 기간) 축 배열"""
+        return tuple(np.linspace(start, stop, num) for start, stop, num in (self.libor, self.spread, self.tenor))
+
+
+@dataclass(frozen=True)
+class SensitivityCube:
+    """LIBOR x 스프레드 x 기간 격자의 할인율과 연환산 비용 (읽기 전용 float32 배열)"""
+    grid: SensitivityGrid
+    libor: np.ndarray
+    spread: np.ndarray
+    tenor: np.ndarray
+    discount_pct: np.ndarray            # 모양 (LIBOR, 스프레드, 기간) - 인보이스 대비 할인율 (%)
+    annualized_cost_pct: np.ndarray     # 같은 모양 - 할인을 받는 공급업체의 연환산 실효 비용 (%)
+
+    def tenor_index(self, tenor_days: float) -> int:
+        """가장 가까운 기간 축 인덱스"""
+        return int(np.abs(self.tenor - tenor_days).argmin())
+
+    def slice_tenor(self, tenor_days: float) -> Tuple[np.ndarray, np.ndarray]:
+        """기간 하나의 (할인율, 연환산 비용) 2차원 단면 - 복사 없는 뷰"""
+        k = self.tenor_index(tenor_days)
+        return self.discount_pct[:, :, k], self.annualized_cost_pct[:, :, k]
+
+
+@functools.lru_cache(maxsize=4)
+def sensitivity_cube(grid: SensitivityGrid = SensitivityGrid(), day_count: int = DAY_COUNT) -> SensitivityCube:
+    """
+    SCF 할인율 민감도 큐브를 브로드캐스팅 한 번으로 계산 (격자별로 프로세스 안에서 캐시)
+
+    할인율 = (LIBOR + 스프레드) x 기간 / day_count,
+    연환산 비용 = d / (1 - d) x 365 / 기간 (d는 소수 할인율)
+
+    Args:
+        grid: 격자 축 정의 (기본 200 x 200 x 180 = 720만 점, 배열당 약 29MB)
+        day_count: 연 환산 일수
+
+    Returns:
+        SensitivityCube: 읽기 전용 결과 - 화면은 이 큐브를 잘라서만 사용하고 다시 계산하지 않음
+    """
+    libor, spread, tenor = (axis.astype(np.float32) for axis in grid.axes())
+    rate = libor[:, None, None] + spread[None, :, None]
+    discount_pct = rate * (tenor / np.float32(day_count))[None, None, :]
+    discount = discount_pct / np.float32(100)
+    annualized_cost_pct = discount / (1 - discount) * (np.float32(365 * 100) / tenor)[None, None, :]
+    for array in (libor, spread, tenor, discount_pct, annualized_cost_pct):
+        array.flags.writeable = False
+    return SensitivityCube(grid, libor, spread, tenor, discount_pct, annualized_cost_pct)
+
+
+# 케이스 Table A/B의 $1,000 인보이스 예시: (Table A 시나리오, 공급업체 관점 이름, P&G 관점 이름, 지급일, 수령일, 설명)
+CASE_INVOICE_AMOUNT = 1000
+CASE_SUPPLIER_RATE = 3.50
+CASE_LIBOR_60DAY = 0.30
+CASE_BANK_SPREAD = 1.00
+CASE_SCENARIOS: Tuple[Tuple[str, str, Optional[str], int, int, str], ...] = (
+    ("기존 상태", "기존 지불조건", "기존 지불조건", 45, 45, "SCF 도입 전 기본 결제 조건"),
+    ("지불조건 연장(SCF 없음)", "SCF 없는 지불연장", None, 75, 75, "SCF 없이 지불 기간만 연장 (공급업체 부담 증가)"),
+    ("SCF 프로그램 적용", "SCF 프로그램", "SCF 프로그램", 75, 15, "SCF 적용 시 (P&G는 75일 후 지불, 공급업체는 15일 후 은행에서 수령)"),
+)
+
+
+def case_tables() -> Dict[str, Any]:
+    """
+    케이스 예시($1,000 인보이스)의 Table A/B와 관점별 표를 엔진으로 계산
+
+    Returns:
+        Dict[str, Any]: table_a, payment_timeline, table_b, supplier_perspective, pg_perspective
+            (표시 값은 소수 둘째 자리로 반올림)
+    """
+    payment_days = np.array([scenario[3] for scenario in CASE_SCENARIOS])
+    days_to_receive = np.array([scenario[4] for scenario in CASE_SCENARIOS])
+    result = price_invoices(
+        CASE_INVOICE_AMOUNT, payment_days, days_to_receive,
+        CASE_SUPPLIER_RATE, CASE_LIBOR_60DAY, CASE_BANK_SPREAD,
+    )
+    cost = np.round(result.financing_cost, 2).tolist()
+    net = np.round(result.net_proceeds, 2).tolist()
+    rate = np.round(result.annual_rate, 2).tolist()
+    days_gained = result.pg_days_gained.tolist()
+    base, extended, scf = range(3)
+
+    table_a: List[Dict[str, Any]] = [
+        {
+            "scenario": scenario,
+            "days": int(payment_days[i]),
+            "receivable": int(days_to_receive[i]),
+            "payable": STANDARD_TERMS_DAYS,
+            "financingCost": cost[i],
+            "netAmount": net[i],
+            "description": description,
+        }
+        for i, (scenario, _, _, _, _, description) in enumerate(CASE_SCENARIOS)
+    ]
+    payment_timeline = [
+        {"name": "D+0", "scf": 0, "traditional": 0, "label": "인보이스 발행"},
+        {"name": f"D+{EARLY_PAYMENT_DAY}", "scf": net[scf], "traditional": 0, "label": "SCF 조기지불"},
+        {"name": f"D+{STANDARD_TERMS_DAYS}", "scf": net[scf], "traditional": net[base], "label": "기존 지불기한"},
+        {"name": f"D+{int(payment_days[extended])}", "scf": net[scf], "traditional": net[extended], "label": "연장된 지불기한"},
+    ]
+    table_b = {
+        "daysFinanced": int(result.financed_days[scf]),
+        "libor60Day": CASE_LIBOR_60DAY,
+        "bankSpread": CASE_BANK_SPREAD,
+        "financingRate": rate[scf],
+        "discountPercentage": round(float(result.discount_pct[scf]), 2),
+    }
+    supplier_perspective = [
+        {
+            "name": name,
+            "invoiceAmount": CASE_INVOICE_AMOUNT,
+            "daysToReceive": int(days_to_receive[i]),
+            "financingCost": cost[i],
+            "netAmount": net[i],
+            "annualRate": rate[i],
+        }
+        for i, (_, name, _, _, _, _) in enumerate(CASE_SCENARIOS)
+    ]
+    pg_perspective = [
+        {
+            "name": pg_name,
+            "DPO": int(payment_days[i]),
+            "workingCapitalImpact": int(days_gained[i]),
+            "cashOutflow": CASE_INVOICE_AMOUNT,
+            "cashOutflowDay": int(payment_days[i]),
+        }
+        for i, (_, _, pg_name, _, _, _) in enumerate(CASE_SCENARIOS)
+        if pg_name is not None
+    ]
+    return {
+        "table_a": table_a,
+        "payment_timeline": payment_timeline,
+        "table_b": table_b,
+        "supplier_perspective": supplier_perspective,
+        "pg_perspective": pg_perspective,
+    }
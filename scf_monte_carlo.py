@@ -0,0 +1,142 @@
+import os
+import functools
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, asdict
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+# 요약에 포함하는 백분위수
+PERCENTILES = (5, 25, 50, 75, 95)
+DEFAULT_PATHS = 100_000
+DEFAULT_CHUNK_SIZE = 25_000
+# 이보다 적은 경로는 프로세스 생성 비용(spawn, 약 1초)이 계산 시간보다 커서 현재 프로세스에서 계산
+PARALLEL_MIN_PATHS = 1_000_000
+
+
+@dataclass(frozen=True)
+class FibriaSimulationParams:
+    """Fibria 공급업체 금융 비용 몬테카를로 가정 (금리는 연 %, 금액은 백만 달러)"""
+    annual_sales_usd: float = 3099.0    # P&G 대상 연간 매출 (운전자본 필요량 데이터의 2015년 기준)
+    libor: float = 0.27                 # 현재 3개월 LIBOR
+    libor_vol: float = 0.30             # LIBOR 1년 변동성 (%p, 정규 분포, 0에서 하한)
+    own_spread: float = 2.23            # Fibria(BBB-) 자체 조달 스프레드 - LIBOR와 합쳐 약 2.5%
+    scf_spread: float = 1.00            # SCF 은행 스프레드
+    brl_usd: float = 2.5989             # 헤알/달러 환율 (2015년 평균)
+    brl_vol: float = 0.18               # 헤알/달러 연 변동성 (로그정규)
+    libor_brl_corr: float = 0.3         # LIBOR 충격과 헤알 약세의 상관계수
+    terms_days: int = 105               # P&G 지불조건
+    early_payment_day: int = 5          # SCF 은행 조기지급일 (승인 후)
+    delay_mean_days: float = 6.0        # P&G 실제 지급 지연 평균 (감마 분포)
+    delay_shape: float = 2.0            # 지급 지연 감마 분포 형상 모수
+    day_count: int = 360                # 이자 계산 연 일수
+
+
+def _simulate_chunk(params: FibriaSimulationParams, seed: np.random.SeedSequence, n_paths: int) -> np.ndarray:
+    """
+    경로 n_paths개의 금융 비용 시뮬레이션 (프로세스 풀 작업 단위)
+
+    Returns:
+        np.ndarray: 모양 (4, n_paths) - SCF 미사용/사용 비용(백만 달러), 같은 비용의 헤알 환산(백만 헤알)
+    """
+    rng = np.random.default_rng(seed)
+    z_libor = rng.standard_normal(n_paths)
+    z_fx = params.libor_brl_corr * z_libor + np.sqrt(1 - params.libor_brl_corr ** 2) * rng.standard_normal(n_paths)
+    libor = np.maximum(params.libor + params.libor_vol * z_libor, 0.0)
+    delay = rng.gamma(params.delay_shape, params.delay_mean_days / params.delay_shape, n_paths)
+    payment_day = params.terms_days + delay
+
+    own_rate = (libor + params.own_spread) / 100
+    scf_rate = (libor + params.scf_spread) / 100
+    sales = params.annual_sales_usd
+    # SCF 미사용: 실제 지급일까지 자체 조달
+    cost_without = sales * own_rate * payment_day / params.day_count
+    # SCF 사용: 조기지급일까지 자체 조달 + 만기까지 은행 할인 (지급 지연 위험은 은행 부담)
+    cost_with = sales * (
+        own_rate * params.early_payment_day + scf_rate * (params.terms_days - params.early_payment_day)
+    ) / params.day_count
+
+    # 비용을 현금 수령일 환율로 헤알 환산 (무추세 로그정규)
+    def brl_at(days: Any) -> np.ndarray:
+        t = np.asarray(days) / 365
+        return params.brl_usd * np.exp(-0.5 * params.brl_vol ** 2 * t + params.brl_vol * np.sqrt(t) * z_fx)
+
+    return np.stack([
+        cost_without,
+        cost_with,
+        cost_without * brl_at(payment_day),
+        cost_with * brl_at(params.early_payment_day),
+    ])
+
+
+def _describe(values: np.ndarray) -> Dict[str, float]:
+    percentiles = np.percentile(values, PERCENTILES)
+    summary = {"mean": float(values.mean()), "std": float(values.std())}
+    summary.update({f"p{p}": float(v) for p, v in zip(PERCENTILES, percentiles)})
+    return summary
+
+
+def _chunk_sizes(n_paths: int, chunk_size: int) -> List[int]:
+    return [min(chunk_size, n_paths - start) for start in range(0, n_paths, chunk_size)]
+
+
+@functools.lru_cache(maxsize=16)
+def simulate_financing_cost(
+    params: FibriaSimulationParams = FibriaSimulationParams(),
+    n_paths: int = DEFAULT_PATHS,
+    seed: int = 2015,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    max_workers: Optional[int] = None,
+) -> Dict[str, Any]:
+    """
+    SCF 사용/미사용 시 공급업체 금융 비용 분포를 몬테카를로로 추정
+
+    경로를 chunk_size 단위로 나누어 ProcessPoolExecutor에서 계산합니다. 청크마다
+    SeedSequence(seed).spawn()으로 독립 난수열을 쓰므로 작업자 수와 관계없이 같은 seed는
+    항상 같은 결과를 냅니다. 같은 인자의 결과는 프로세스 안에서 캐시됩니다(수정 금지).
+
+    Args:
+        params: 시뮬레이션 가정
+        n_paths: 경로 수
+        seed: 난수 시드
+        chunk_size: 작업 하나가 계산하는 경로 수
+        max_workers: 프로세스 수 (None이면 경로가 PARALLEL_MIN_PATHS 이상일 때 CPU 수와 청크 수 중
+                     작은 값, 그보다 적으면 1) - 1이면 현재 프로세스에서 계산
+
+    Returns:
+        Dict[str, Any]: 경로 수/시드/가정과 withoutSCF, withSCF, savings (백만 달러) 및
+            withoutSCFBRL, withSCFBRL (백만 헤알)의 평균/표준편차/백분위수, SCF가 더 싼 경로 비율
+    """
+    sizes = _chunk_sizes(n_paths, chunk_size)
+    seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+    if max_workers is None:
+        max_workers = min(len(sizes), os.cpu_count() or 1) if n_paths >= PARALLEL_MIN_PATHS else 1
+    if max_workers <= 1 or len(sizes) == 1:
+        chunks = [_simulate_chunk(params, chunk_seed, size) for chunk_seed, size in zip(seeds, sizes)]
+    else:
+        # 스레드가 있는 Streamlit 프로세스에서 fork하지 않도록 spawn 사용
+        context = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(max_workers=max_workers, mp_context=context) as executor:
+            chunks = list(executor.map(_simulate_chunk, [params] * len(sizes), seeds, sizes))
+    without_usd, with_usd, without_brl, with_brl = np.concatenate(chunks, axis=1)
+    savings = without_usd - with_usd
+    return {
+        "paths": n_paths,
+        "seed": seed,
+        "params": asdict(params),
+        "withoutSCF": _describe(without_usd),
+        "withSCF": _describe(with_usd),
+        "savings": _describe(savings),
+        "withoutSCFBRL": _describe(without_brl),
+        "withSCFBRL": _describe(with_brl),
+        "probSCFCheaper": float((savings > 0).mean()),
+    }
+
+
+def percentile_rows(summary: Dict[str, Any], keys: Tuple[str, ...] = ("withoutSCF", "withSCF", "savings")) -> List[Dict[str, Any]]:
+    """요약을 차트/표용 행 목록으로 변환 (소수 둘째 자리 반올림)"""
+    return [
+        {"series": key, **{name: round(value, 2) for name, value in summary[key].items()}}
+        for key in keys
+    ]
@@ -0,0 +1,114 @@
+from dataclasses import dataclass
+from typing import Any, Dict, List, Mapping, Sequence, Tuple
+
+import numpy as np
+
+from scf_economics import (
+    CASE_BANK_SPREAD, CASE_LIBOR_60DAY, DAY_COUNT, EARLY_PAYMENT_DAY, STANDARD_TERMS_DAYS, price_invoices,
+)
+
+# 기본 등급 구성 비율 (등급 -> 공급업체 비중)
+DEFAULT_RATING_SHARES = (("AAA", 0.02), ("AA", 0.08), ("A", 0.25), ("BBB", 0.40), ("BB", 0.25))
+
+
+def rating_ladder(yields: Sequence[Mapping[str, Any]], shares: Sequence[Tuple[str, float]] = DEFAULT_RATING_SHARES) -> Tuple[Tuple[str, float, float], ...]:
+    """
+    회사채 수익률 데이터와 등급 비중으로 등급 사다리 구성
+
+    Args:
+        yields: {"rating", "yield"} 행 목록 (예: corporate_bond_yields_data, 연 %)
+        shares: (등급, 비중) 목록 - 합이 1이 아니어도 정규화됨
+
+    Returns:
+        Tuple[Tuple[str, float, float], ...]: (등급, 비중, 자체 조달 금리 %) 목록
+
+    Raises:
+        KeyError: 수익률 데이터에 없는 등급이 있을 때
+    """
+    rates = {row["rating"]: row["yield"] for row in yields}
+    missing = [rating for rating, _ in shares if rating not in rates]
+    if missing:
+        raise KeyError(f"수익률 데이터에 없는 등급: {', '.join(missing)}")
+    return tuple((rating, share, rates[rating]) for rating, share in shares)
+
+
+@dataclass(frozen=True)
+class SupplierPortfolioParams:
+    """가상 공급업체 포트폴리오 가정 (금액은 백만 달러, 금리는 연 %)"""
+    ladder: Tuple[Tuple[str, float, float], ...]    # (등급, 비중, 자체 조달 금리)
+    n_suppliers: int = 50_000
+    sales_median: float = 20.0          # P&G 대상 연 매출 중앙값 (로그정규)
+    sales_sigma: float = 1.2            # 연 매출 로그 표준편차
+    terms_mean_days: float = 75.0       # 연장 후 P&G 지급일 평균 (정규, 표준 지불조건 이상으로 절단)
+    terms_sd_days: float = 10.0         # 지급일 표준편차
+    libor: float = CASE_LIBOR_60DAY
+    spread: float = CASE_BANK_SPREAD
+
+
+_TOTAL_FIELDS = ("suppliers", "scfSuppliers", "sales", "payablesIncrease", "ownCost", "scfCost", "supplierSavings", "bankSpreadIncome")
+
+
+def _chunk_totals(params: SupplierPortfolioParams, seed: np.random.SeedSequence, size: int) -> np.ndarray:
+    """공급업체 size개를 생성해 등급별 합계 반환 - 모양 (len(_TOTAL_FIELDS), 등급 수)"""
+    rng = np.random.default_rng(seed)
+    shares = np.array([share for _, share, _ in params.ladder], dtype=np.float64)
+    own_rates = np.array([rate for _, _, rate in params.ladder], dtype=np.float64)
+    rating = rng.choice(len(shares), size=size, p=shares / shares.sum())
+    sales = rng.lognormal(np.log(params.sales_median), params.sales_sigma, size)
+    terms = np.maximum(np.rint(rng.normal(params.terms_mean_days, params.terms_sd_days, size)), STANDARD_TERMS_DAYS)
+    supplier_rate = own_rates[rating]
+
+    # 자체 조달로 지급일까지 버티는 경우와 SCF로 조기지급을 받는 경우 - SCF가 더 싼 공급업체만 참여
+    own = price_invoices(sales, terms, terms, supplier_rate, params.libor, params.spread)
+    joins = supplier_rate > params.libor + params.spread
+    scf = price_invoices(sales, terms, np.where(joins, EARLY_PAYMENT_DAY, terms), supplier_rate, params.libor, params.spread)
+    # 연간 매출이므로 P&G 외상매입금 증가 = 매출 x 연장 일수 / 365
+    payables_increase = sales * own.pg_days_gained / 365
+    spread_income = np.where(scf.uses_scf, sales * params.spread * scf.financed_days / DAY_COUNT / 100, 0.0)
+
+    weights = (
+        np.ones(size), scf.uses_scf, sales, payables_increase, own.financing_cost, scf.financing_cost,
+        own.financing_cost - scf.financing_cost, spread_income,
+    )
+    return np.stack([np.bincount(rating, weights=np.asarray(w, dtype=np.float64), minlength=len(shares)) for w in weights])
+
+
+def simulate_supplier_portfolio(
+    params: SupplierPortfolioParams,
+    seed: int = 2013,
+    chunk_size: int = 100_000,
+) -> Dict[str, Any]:
+    """
+    가상 공급업체 포트폴리오의 SCF 효과를 청크 단위로 집계
+
+    공급업체를 chunk_size개씩 생성해 등급별 합계만 누적하므로 공급업체 수가 늘어도
+    메모리 사용량은 청크 크기에 비례해 일정합니다. 청크마다 SeedSequence(seed).spawn()
+    난수열을 쓰므로 같은 seed와 chunk_size는 항상 같은 결과를 냅니다.
+
+    Args:
+        params: 포트폴리오 가정
+        seed: 난수 시드
+        chunk_size: 한 번에 생성하는 공급업체 수
+
+    Returns:
+        Dict[str, Any]: totals (전체 합계)와 byRating (등급별 합계 행 목록)
+            - payablesIncrease: P&G 외상매입금 증가 (운전자본 개선)
+            - ownCost / scfCost: SCF 없이 자체 조달할 때 / SCF 참여 후 공급업체 조달 비용
+            - supplierSavings: 공급업체 절감액, bankSpreadIncome: 은행 스프레드 수익
+    """
+    sizes = [min(chunk_size, params.n_suppliers - start) for start in range(0, params.n_suppliers, chunk_size)]
+    totals = np.zeros((len(_TOTAL_FIELDS), len(params.ladder)))
+    for chunk_seed, size in zip(np.random.SeedSequence(seed).spawn(len(sizes)), sizes):
+        totals += _chunk_totals(params, chunk_seed, size)
+
+    def row(values: np.ndarray) -> Dict[str, float]:
+        result = {field: float(value) for field, value in zip(_TOTAL_FIELDS, values)}
+        result["suppliers"] = int(result["suppliers"])
+        result["scfSuppliers"] = int(result["scfSuppliers"])
+        return result
+
+    by_rating: List[Dict[str, Any]] = [
+        {"rating": rating, "borrowingRate": rate, **row(totals[:, i])}
+        for i, (rating, _, rate) in enumerate(params.ladder)
+    ]
+    return {"seed": seed, "totals": row(totals.sum(axis=1)), "byRating": by_rating}
@@ -0,0 +1,294 @@
+import math
+from typing import Any, Dict
+
+import numpy as np
+
+from data_provider import MarketDataProvider
+from html_cache import memoize_html
+from instrumentation import instrument_render
+from scf_economics import DAY_COUNT, SensitivityGrid, sensitivity_cube
+from template_engine import CompiledTemplate
+
+# 화면에 보내는 격자 크기 상한 - 큐브(200 x 200 x 180)를 간격을 두고 잘라서 HTML 크기를 제한
+MAX_RATE_POINTS = 40
+MAX_TENOR_POINTS = 18
+# HTML에 넣는 할인율 단면의 기간 (일) - 슬라이더 기본값과 같음
+BASE_TENOR_DAYS = 100
+
+
+class SCFSensitivityComponentGenerator:
+    """LIBOR x 스프레드 x 기간 SCF 할인율 민감도 히트맵 생성 클래스"""
+
+    def __init__(self, data_provider: MarketDataProvider, grid: SensitivityGrid = SensitivityGrid()):
+        """
+        Args:
+            data_provider: 시장 데이터를 제공하는 객체 (갱신 시나리오 표시용)
+            grid: 민감도 격자 정의
+        """
+        self.data_provider = data_provider
+        self.grid = grid
+
+    def _cache_inputs(self):
+        """HTML 캐시 키 계산에 사용되는 입력 데이터 반환"""
+        return [self.grid, self.data_provider.scf_rate_simulation_data]
+
+    def _sensitivity_data(self) -> Dict[str, Any]:
+        """
+        캐시된 큐브에서 기준 기간 단면 하나만 잘라 차트용 데이터 생성 (다시 계산하지 않음)
+
+        할인율은 기간에 비례하고 연환산 비용은 할인율과 기간으로 정해지므로, 나머지 기간 단면과
+        연환산 비용은 브라우저에서 선택할 때 이 단면으로부터 계산한다.
+        """
+        cube = sensitivity_cube(self.grid)
+        rate_step = max(1, math.ceil(max(len(cube.libor), len(cube.spread)) / MAX_RATE_POINTS))
+        tenor_step = max(1, math.ceil(len(cube.tenor) / MAX_TENOR_POINTS))
+        tenor = np.round(cube.tenor[::tenor_step]).astype(int)
+        # 화면 기본값과 같은 기준 기간 (100일 이상인 첫 기간)
+        base_tenor = int(np.argmax(tenor >= BASE_TENOR_DAYS)) if (tenor >= BASE_TENOR_DAYS).any() else 0
+        discount, _ = cube.slice_tenor(float(tenor[base_tenor]))
+        # float32를 그대로 tolist하면 0.36100000143...처럼 길어지므로 float64로 바꾼 뒤 반올림
+        rounded = lambda values, decimals=3: np.round(values.astype(np.float64), decimals).tolist()
+        return {
+            "libor": rounded(cube.libor[::rate_step]),
+            "spread": rounded(cube.spread[::rate_step]),
+            "tenor": tenor.tolist(),
+            "baseTenor": base_tenor,
+            # 기간 비율(최대 약 1.8배)을 곱해도 표시 자릿수(소수 셋째 자리)가 유지되도록 두 자리 더 보냄
+            "discount": rounded(discount[::rate_step, ::rate_step], 5),
+            "dayCount": DAY_COUNT,
+            "scenarios": self.data_provider.scf_rate_simulation_data,
+        }
+
+    @instrument_render
+    @memoize_html
+    def generate_html(self) -> str:
+        """민감도 히트맵 HTML 코드를 생성하여 반환"""
+        return _COMPILED_TEMPLATE.render_json(
+            {"SENSITIVITY_DATA_PLACEHOLDER": self._sensitivity_data()}, ensure_ascii=False, separators=(",", ":")
+        )
+
+    @staticmethod
+    def _get_html_template() -> str:
+        """HTML 템플릿 반환"""
+        return """
+        <!DOCTYPE html>
+        <html>
+        <head>
+            <title>SCF 할인율 민감도 분석</title>
+            <meta charset="UTF-8">
+            <meta name="viewport" content="width=device-width, initial-scale=1.0">
+            <style>
+                body {
+                    font-family: 'Noto Sans KR', Arial, sans-serif;
+                    margin: 0;
+                    padding: 20px;
+                    background-color: #f8f9fa;
+                }
+                .chart-container {
+                    background-color: white;
+                    border-radius: 10px;
+                    box-shadow: 0 4px 6px rgba(0, 0, 0, 0.1);
+                    padding: 20px;
+                    margin-bottom: 30px;
+                }
+                .chart-title {
+                    font-size: 1.8rem;
+                    font-weight: bold;
+                    color: #111827;
+                    margin-bottom: 1rem;
+                }
+                .controls {
+                    display: flex;
+                    gap: 30px;
+                    align-items: center;
+                    flex-wrap: wrap;
+                    margin-bottom: 15px;
+                    font-size: 0.95rem;
+                    color: #374151;
+                }
+                .heatmap-wrapper {
+                    position: relative;
+                    display: inline-block;
+                }
+                #tooltip {
+                    position: absolute;
+                    pointer-events: none;
+                    background: rgba(17, 24, 39, 0.9);
+                    color: white;
+                    padding: 6px 10px;
+                    border-radius: 6px;
+                    font-size: 0.8rem;
+                    white-space: nowrap;
+                    display: none;
+                }
+                .insight-box {
+                    background-color: #f0f4f8;
+                    border-radius: 8px;
+                    border-left: 4px solid #0066cc;
+                    padding: 15px;
+                    margin-top: 20px;
+                    box-shadow: 0 2px 4px rgba(0, 0, 0, 0.05);
+                }
+            </style>
+        </head>
+        <body>
+            <div class="chart-container">
+                <div class="chart-title">SCF 할인율 민감도 (LIBOR × 스프레드 × 기간)</div>
+                <div class="controls">
+                    <label>지표
+                        <select id="metric">
+                            <option value="discount">인보이스 할인율 (%)</option>
+                            <option value="annualized">연환산 비용 (%)</option>
+                        </select>
+                    </label>
+                    <label>할인 기간: <strong id="tenor-label"></strong>일
+                        <input type="range" id="tenor" min="0" step="1">
+                    </label>
+                </div>
+                <div class="heatmap-wrapper">
+                    <canvas id="heatmap" width="760" height="560"></canvas>
+                    <div id="tooltip"></div>
+                </div>
+                <div class="insight-box">
+                    할인율 = (LIBOR + 스프레드) × 기간 / <span id="day-count"></span>,
+                    연환산 비용 = d / (1 - d) × 365 / 기간.
+                    ● 표시는 data_provider의 SCF 금리 시나리오 위치입니다.
+                </div>
+            </div>
+            <script>
+                const data = SENSITIVITY_DATA_PLACEHOLDER;
+                const canvas = document.getElementById('heatmap');
+                const ctx = canvas.getContext('2d');
+                const tooltip = document.getElementById('tooltip');
+                const metricSelect = document.getElementById('metric');
+                const tenorInput = document.getElementById('tenor');
+                const tenorLabel = document.getElementById('tenor-label');
+                document.getElementById('day-count').textContent = data.dayCount;
+
+                const margin = { left: 70, right: 110, top: 20, bottom: 60 };
+                const plotWidth = canvas.width - margin.left - margin.right;
+                const plotHeight = canvas.height - margin.top - margin.bottom;
+                const cellWidth = plotWidth / data.spread.length;
+                const cellHeight = plotHeight / data.libor.length;
+
+                tenorInput.max = data.tenor.length - 1;
+                tenorInput.value = data.baseTenor;
+
+                function color(ratio) {
+                    // 파랑(낮음) -> 노랑 -> 빨강(높음)
+                    const r = Math.round(255 * Math.min(1, ratio * 2));
+                    const g = Math.round(255 * (ratio < 0.5 ? 0.4 + ratio * 1.2 : 1.6 - ratio * 1.6));
+                    const b = Math.round(255 * Math.max(0, 1 - ratio * 2));
+                    return `rgb(${r},${g},${b})`;
+                }
+
+                // 기준 단면에서 기간별 할인율/연환산 비용 단면을 처음 선택할 때 계산하여 보관
+                const slices = { discount: {}, annualized: {} };
+                function sliceAt(metric, k) {
+                    if (!slices[metric][k]) {
+                        const scale = data.tenor[k] / data.tenor[data.baseTenor];
+                        const discount = data.discount.map(row => row.map(v => v * scale));
+                        slices.discount[k] = discount;
+                        slices.annualized[k] = discount.map(row => row.map(v => {
+                            const d = v / 100;
+                            return d / (1 - d) * 36500 / data.tenor[k];
+                        }));
+                    }
+                    return slices[metric][k];
+                }
+
+                function currentSlice() {
+                    return sliceAt(metricSelect.value, tenorInput.value);
+                }
+
+                function draw() {
+                    const slice = currentSlice();
+                    const values = slice.flat();
+                    const min = Math.min(...values);
+                    const max = Math.max(...values);
+                    const span = max - min || 1;
+                    tenorLabel.textContent = data.tenor[tenorInput.value];
+                    ctx.clearRect(0, 0, canvas.width, canvas.height);
+
+                    slice.forEach((row, i) => {
+                        row.forEach((value, j) => {
+                            ctx.fillStyle = color((value - min) / span);
+                            // LIBOR는 아래에서 위로 증가
+                            const y = margin.top + plotHeight - (i + 1) * cellHeight;
+                            ctx.fillRect(margin.left + j * cellWidth, y, Math.ceil(cellWidth), Math.ceil(cellHeight));
+                        });
+                    });
+
+                    // 축 라벨
+                    ctx.fillStyle = '#374151';
+                    ctx.font = '12px Arial';
+                    ctx.textAlign = 'center';
+                    const xTicks = 6, yTicks = 6;
+                    for (let k = 0; k <= xTicks; k++) {
+                        const j = Math.round(k * (data.spread.length - 1) / xTicks);
+                        ctx.fillText(data.spread[j].toFixed(2), margin.left + (j + 0.5) * cellWidth, margin.top + plotHeight + 18);
+                    }
+                    ctx.fillText('은행 스프레드 (%)', margin.left + plotWidth / 2, canvas.height - 15);
+                    ctx.textAlign = 'right';
+                    for (let k = 0; k <= yTicks; k++) {
+                        const i = Math.round(k * (data.libor.length - 1) / yTicks);
+                        ctx.fillText(data.libor[i].toFixed(2), margin.left - 8, margin.top + plotHeight - (i + 0.5) * cellHeight + 4);
+                    }
+                    ctx.save();
+                    ctx.translate(18, margin.top + plotHeight / 2);
+                    ctx.rotate(-Math.PI / 2);
+                    ctx.textAlign = 'center';
+                    ctx.fillText('LIBOR (%)', 0, 0);
+                    ctx.restore();
+
+                    // 색상 범례
+                    const legendX = canvas.width - margin.right + 30;
+                    for (let k = 0; k < plotHeight; k++) {
+                        ctx.fillStyle = color(1 - k / plotHeight);
+                        ctx.fillRect(legendX, margin.top + k, 18, 1);
+                    }
+                    ctx.fillStyle = '#374151';
+                    ctx.textAlign = 'left';
+                    ctx.fillText(max.toFixed(3), legendX + 24, margin.top + 10);
+                    ctx.fillText(min.toFixed(3), legendX + 24, margin.top + plotHeight);
+
+                    // 시나리오 위치 표시
+                    data.scenarios.forEach(s => {
+                        const x = margin.left + (s.spread - data.spread[0]) / (data.spread[data.spread.length - 1] - data.spread[0]) * plotWidth;
+                        const y = margin.top + plotHeight - (s.libor - data.libor[0]) / (data.libor[data.libor.length - 1] - data.libor[0]) * plotHeight;
+                        ctx.beginPath();
+                        ctx.arc(x, y, 5, 0, 2 * Math.PI);
+                        ctx.fillStyle = 'white';
+                        ctx.fill();
+                        ctx.strokeStyle = '#111827';
+                        ctx.stroke();
+                    });
+                }
+
+                canvas.addEventListener('mousemove', event => {
+                    const rect = canvas.getBoundingClientRect();
+                    const j = Math.floor((event.clientX - rect.left - margin.left) / cellWidth);
+                    const i = Math.floor((margin.top + plotHeight - (event.clientY - rect.top)) / cellHeight);
+                    if (i < 0 || j < 0 || i >= data.libor.length || j >= data.spread.length) {
+                        tooltip.style.display = 'none';
+                        return;
+                    }
+                    const tenor = tenorInput.value;
+                    tooltip.innerHTML = `LIBOR ${data.libor[i].toFixed(2)}% · 스프레드 ${data.spread[j].toFixed(2)}%<br>` +
+                        `할인율 ${sliceAt('discount', tenor)[i][j].toFixed(3)}% · 연환산 ${sliceAt('annualized', tenor)[i][j].toFixed(3)}%`;
+                    tooltip.style.left = (event.clientX - rect.left + 12) + 'px';
+                    tooltip.style.top = (event.clientY - rect.top + 12) + 'px';
+                    tooltip.style.display = 'block';
+                });
+                canvas.addEventListener('mouseleave', () => { tooltip.style.display = 'none'; });
+                metricSelect.addEventListener('change', draw);
+                tenorInput.addEventListener('input', draw);
+                draw();
+            </script>
+        </body>
+        </html>
+        """
+
+
+# 템플릿은 모듈 임포트 시점에 한 번만 토큰화
+_COMPILED_TEMPLATE = CompiledTemplate(SCFSensitivityComponentGenerator._get_html_template())
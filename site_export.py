@@ -0,0 +1,448 @@
+import os
+import re
+import ast
+import gzip
+import html
+import json
+import time
+import hashlib
+import logging
+import tempfile
+import dataclasses
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+try:
+    import brotli
+except ImportError:     # requirements.txt에 포함 - 없으면 경고 후 .br 파일 없이 .gz만 생성
+    brotli = None
+
+from assets import asset_for_url, has_tailwind_subset, is_vendored, vendor_path
+from exhibit_registry import EXHIBIT_SPECS, SPECS_BY_KEY
+from html_minify import minify_html, minify_stats
+from tailwind_subset import OUTPUT_PATH as TAILWIND_SUBSET_PATH, TAILWIND_CDN_URL
+
+logger = logging.getLogger("png_scf.export")
+
+# 내보낸 사이트에서 공유 JS/CSS가 저장되는 하위 디렉터리
+ASSET_DIR = "assets"
+# 이보다 작은 파일은 압축해도 이득이 거의 없어 .gz/.br을 만들지 않음 (nginx gzip_min_length와 같은 역할)
+COMPRESS_MIN_BYTES = 256
+COMPRESSED_SUFFIXES = (".gz", ".br")
+
+# 증분 빌드 매니페스트와 변환 전 원본 HTML 보관 디렉터리 (출력 디렉터리 기준)
+MANIFEST_NAME = "build-manifest.json"
+MANIFEST_VERSION = 1
+RAW_DIR = ".build"
+# 템플릿 해시에서 제외하는 모듈 - 이들이 만드는 데이터는 데이터 해시(_cache_inputs)로 추적됨
+DATA_MODULES = frozenset({"data_provider", "dataset_store"})
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+_SCRIPT_SRC = re.compile(r'<script src="(https://[^"]+)"></script>')
+# 속성이 없는 인라인 블록만 추출 대상 (type="application/json" 데이터 블록 등은 그대로 둠)
+_INLINE_BLOCK = re.compile(r"<(style|script)>(.*?)</\1>", re.S)
+
+_worker_create_generator: Optional[Callable[[str], Any]] = None
+
+
+@dataclass
+class ExportReport:
+    """정적 사이트 내보내기 결과"""
+    output_dir: str
+    pages: Dict[str, int] = field(default_factory=dict)      # 페이지 파일 이름 -> 바이트
+    assets: Dict[str, int] = field(default_factory=dict)     # 공유 자산 파일 이름 -> 바이트
+    compressed: Dict[str, int] = field(default_factory=dict) # 압축 파일 이름 -> 바이트
+    removed: List[str] = field(default_factory=list)         # 이전 내보내기에서 남은 자산/페이지 중 삭제한 파일
+    rendered: List[str] = field(default_factory=list)        # 입력이 바뀌어 다시 렌더링한 화면 키
+    skipped: List[str] = field(default_factory=list)         # 매니페스트와 입력이 같아 렌더링을 건너뛴 화면 키
+    written: List[str] = field(default_factory=list)         # 내용이 바뀌어 실제로 쓴 파일 이름
+    minify_saved: Dict[str, int] = field(default_factory=dict)  # 화면 키 -> 최소화로 줄어든 바이트 (minify=True일 때)
+    inputs_ms: float = 0.0      # 입력 해시 계산과 변경 화면 판정 (렌더링 전)
+    render_ms: float = 0.0      # 변경된 화면 렌더링 (건너뛴 화면만 있으면 0)
+    duration_ms: float = 0.0
+
+    def summary(self) -> str:
+        """한 줄 요약"""
+        formats = "gzip, brotli" if brotli is not None else "gzip만 - brotli 미설치로 .br 생략"
+        return (
+            f"{len(self.pages)}개 페이지 (렌더링 {len(self.rendered)}개, 건너뜀 {len(self.skipped)}개, "
+            f"변경 파일 {len(self.written)}개), "
+            + (f"최소화 -{sum(self.minify_saved.values()):,} 바이트, " if self.minify_saved else "")
+            + (f"삭제 파일 {len(self.removed)}개, " if self.removed else "")
+            + f"공유 자산 {len(self.assets)}개, 압축 파일 {len(self.compressed)}개 ({formats}) "
+            f"-> {self.output_dir} (입력 해시 {self.inputs_ms:.0f} ms, 렌더링 {self.render_ms:.0f} ms, 전체 {self.duration_ms:.0f} ms)"
+        )
+
+
+def _init_worker():
+    """작업 프로세스마다 MarketDataProvider와 생성기 팩토리를 한 번만 생성"""
+    global _worker_create_generator
+    from warmup import default_generator_factory
+    _worker_create_generator = default_generator_factory()
+
+
+def _render_page(key: str) -> Tuple[str, str]:
+    """작업 프로세스에서 화면 하나를 렌더링 (자산 경로는 원본 CDN URL 그대로)"""
+    return key, _worker_create_generator(key).generate_html()
+
+
+def _digest(content: bytes) -> str:
+    return hashlib.sha256(content).hexdigest()[:12]
+
+
+def _hashed_name(stem: str, content: bytes, ext: str) -> str:
+    """내용 해시가 들어간 자산 파일 이름 (내용이 바뀌면 이름도 바뀌어 무기한 캐시 가능)"""
+    return f"{ASSET_DIR}/{stem}.{_digest(content)}{ext}"
+
+
+class AssetExtractor:
+    """
+    페이지 HTML에서 공유 JS/CSS를 내용 해시 파일로 분리
+
+    - 벤더링된 CDN 라이브러리와 Tailwind 부분집합 CSS는 항상 assets/로 복사
+    - 인라인 <style>/<script> 블록은 두 페이지 이상에서 똑같이 쓰일 때만 분리
+      (페이지 전용 데이터 스크립트는 별도 요청이 늘기만 하므로 그대로 둠)
+    - 벤더링되지 않은 라이브러리는 CDN URL 유지
+    """
+
+    def __init__(self, pages: Dict[str, str]):
+        """
+        Args:
+            pages: 화면 키 -> 생성기가 만든 원본 HTML
+        """
+        self.pages = pages
+        self.files: Dict[str, bytes] = {}
+        counts = Counter(
+            (match.group(1), match.group(2))
+            for page in pages.values()
+            for match in {m.group(0): m for m in _INLINE_BLOCK.finditer(page)}.values()
+        )
+        self._shared_blocks = {block for block, count in counts.items() if count > 1 and block[1].strip()}
+
+    def _add(self, stem: str, content: bytes, ext: str) -> str:
+        name = _hashed_name(stem, content, ext)
+        self.files[name] = content
+        return name
+
+    def _replace_script(self, match: "re.Match") -> str:
+        url = match.group(1)
+        if url == TAILWIND_CDN_URL and has_tailwind_subset():
+            with open(TAILWIND_SUBSET_PATH, "rb") as f:
+                name = self._add("tailwind-subset", f.read(), ".css")
+            return f'<link rel="stylesheet" href="{name}">'
+        asset = asset_for_url(url)
+        if asset is None or not is_vendored(asset):
+            return match.group(0)
+        with open(vendor_path(asset), "rb") as f:
+            stem, ext = os.path.splitext(asset.filename)
+            name = self._add(stem, f.read(), ext)
+        return f'<script src="{name}"></script>'
+
+    def _replace_block(self, match: "re.Match") -> str:
+        tag, body = match.group(1), match.group(2)
+        if (tag, body) not in self._shared_blocks:
+            return match.group(0)
+        ext = ".css" if tag == "style" else ".js"
+        name = self._add("shared", body.encode("utf-8"), ext)
+        if tag == "style":
+            return f'<link rel="stylesheet" href="{name}">'
+        # 외부 파일 안에서는 HTML 파서가 개입하지 않으므로 이스케이프된 닫는 태그도 그대로 유효
+        return f'<script src="{name}"></script>'
+
+    def extract(self, html_code: str) -> str:
+        """공유 자산 참조를 assets/ 상대 경로로 바꾼 HTML 반환"""
+        html_code = _SCRIPT_SRC.sub(self._replace_script, html_code)
+        return _INLINE_BLOCK.sub(self._replace_block, html_code)
+
+
+def index_page(keys: Iterable[str]) -> str:
+    """내보낸 화면 목록 페이지 HTML (라벨이 여러 개인 화면은 라벨마다 같은 페이지로 연결)"""
+    items = []
+    for key in keys:
+        spec = SPECS_BY_KEY[key]
+        heading = spec.headers[0] if spec.headers else spec.title
+        items.extend(
+            f'<li><a href="{key}.html"><strong>{html.escape(label)}</strong></a> '
+            f"&mdash; {html.escape(heading)}</li>"
+            for label in spec.labels
+        )
+    return (
+        '<!DOCTYPE html>\n<html lang="ko">\n<head>\n<meta charset="UTF-8">\n'
+        '<meta name="viewport" content="width=device-width, initial-scale=1.0">\n'
+        "<title>P&amp;G Case Analysis</title>\n"
+        "<style>body{font-family:'Noto Sans KR',Arial,sans-serif;max-width:960px;margin:2rem auto;"
+        "padding:0 1rem;line-height:1.6}li{margin:.4rem 0}</style>\n</head>\n<body>\n"
+        "<h1>P&amp;G Case Analysis</h1>\n<ul>\n" + "\n".join(items) + "\n</ul>\n</body>\n</html>\n"
+    )
+
+
+def compress_file(path: str) -> List[Tuple[str, int]]:
+    """
+    파일 옆에 미리 압축한 .gz (및 brotli가 있으면 .br) 파일 생성
+
+    gzip 헤더의 수정 시각을 0으로 고정해 같은 내용은 항상 같은 바이트가 되도록 합니다.
+
+    Returns:
+        List[Tuple[str, int]]: (압축 파일 경로, 바이트) 목록 - 작은 파일이거나 압축 이득이 없으면 빈 목록
+    """
+    with open(path, "rb") as f:
+        content = f.read()
+    encoded = {}
+    if len(content) >= COMPRESS_MIN_BYTES:
+        encoded[".gz"] = gzip.compress(content, compresslevel=9, mtime=0)
+        if brotli is not None:
+            encoded[".br"] = brotli.compress(content, quality=11)
+    results = []
+    for suffix in COMPRESSED_SUFFIXES:
+        data = encoded.get(suffix)
+        if data is None or len(data) >= len(content):
+            # 이전 내보내기의 압축본이 남아 있으면 원본과 내용이 달라지므로 삭제
+            if os.path.exists(path + suffix):
+                os.remove(path + suffix)
+            continue
+        with open(path + suffix, "wb") as f:
+            f.write(data)
+        results.append((path + suffix, len(data)))
+    return results
+
+
+def _local_imports(module: str) -> List[str]:
+    """모듈이 (직접 또는 간접으로) 임포트하는 저장소 내 모듈 이름 목록 - 자기 자신 포함, 정렬됨"""
+    seen = set()
+    stack = [module]
+    while stack:
+        name = stack.pop()
+        path = os.path.join(BASE_DIR, f"{name}.py")
+        if name in seen or name in DATA_MODULES or not os.path.isfile(path):
+            continue
+        seen.add(name)
+        with open(path, encoding="utf-8") as f:
+            tree = ast.parse(f.read(), filename=path)
+        for node in ast.walk(tree):
+            if isinstance(node, ast.Import):
+                stack.extend(alias.name.split(".")[0] for alias in node.names)
+            elif isinstance(node, ast.ImportFrom) and node.module and node.level == 0:
+                stack.append(node.module.split(".")[0])
+    return sorted(seen)
+
+
+def template_hash(key: str) -> str:
+    """
+    화면의 템플릿 해시 - 생성기 모듈과 그 모듈이 임포트하는 저장소 모듈 소스의 SHA-256
+
+    data_provider/dataset_store는 제외하므로 데이터 파일만 고친 경우에는 데이터 해시만 바뀝니다.
+    """
+    digest = hashlib.sha256()
+    for name in _local_imports(SPECS_BY_KEY[key].module):
+        digest.update(name.encode("utf-8"))
+        with open(os.path.join(BASE_DIR, f"{name}.py"), "rb") as f:
+            digest.update(f.read())
+    return digest.hexdigest()
+
+
+def _json_default(value: Any) -> Any:
+    if dataclasses.is_dataclass(value):
+        return dataclasses.asdict(value)
+    if hasattr(value, "tolist"):
+        return value.tolist()
+    if isinstance(value, (set, frozenset)):
+        return sorted(value, key=repr)
+    return repr(value)
+
+
+def data_hash(generator: Any) -> str:
+    """
+    생성기가 읽는 데이터(_cache_inputs)의 SHA-256
+
+    html_cache.stable_hash(pickle)는 프로세스 안에서만 안정적이므로, 실행마다 같은 값이
+    나와야 하는 매니페스트에는 키를 정렬한 JSON 직렬화를 사용합니다.
+    """
+    payload = json.dumps(generator._cache_inputs(), sort_keys=True, ensure_ascii=False, default=_json_default)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def page_inputs(keys: Iterable[str], create_generator: Optional[Callable[[str], Any]] = None) -> Dict[str, Dict[str, str]]:
+    """
+    화면별 입력 해시 (렌더링하지 않고 생성기 생성과 _cache_inputs 호출만 수행)
+
+    Returns:
+        Dict[str, Dict[str, str]]: 화면 키 -> {"template": 템플릿 해시, "data": 데이터 해시}
+    """
+    if create_generator is None:
+        from warmup import default_generator_factory
+        create_generator = default_generator_factory()
+    return {key: {"template": template_hash(key), "data": data_hash(create_generator(key))} for key in keys}
+
+
+def load_manifest(output_dir: str) -> Dict[str, Any]:
+    """출력 디렉터리의 매니페스트 (없거나 버전이 다르면 빈 매니페스트)"""
+    try:
+        with open(os.path.join(output_dir, MANIFEST_NAME), encoding="utf-8") as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return {"version": MANIFEST_VERSION, "pages": {}}
+    if manifest.get("version") != MANIFEST_VERSION:
+        return {"version": MANIFEST_VERSION, "pages": {}}
+    return manifest
+
+
+def _save_manifest(output_dir: str, manifest: Dict[str, Any]):
+    # 중간에 중단되어도 매니페스트가 깨지지 않도록 임시 파일에 쓴 뒤 교체
+    fd, tmp_path = tempfile.mkstemp(dir=output_dir, prefix=".manifest-", suffix=".tmp")
+    with os.fdopen(fd, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=2, sort_keys=True)
+    os.replace(tmp_path, os.path.join(output_dir, MANIFEST_NAME))
+
+
+def _write(path: str, content: bytes) -> bool:
+    """내용이 다를 때만 파일을 쓰고 썼는지 여부 반환 (변경되지 않은 파일의 mtime/압축본 유지)"""
+    try:
+        with open(path, "rb") as f:
+            if f.read() == content:
+                return False
+    except OSError:
+        pass
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "wb") as f:
+        f.write(content)
+    return True
+
+
+def _needs_compression(path: str, changed: bool) -> bool:
+    return changed or not os.path.exists(path + ".gz") or (brotli is not None and not os.path.exists(path + ".br"))
+
+
+def _remove_files(output_dir: str, names: Iterable[str], report: ExportReport):
+    """출력 디렉터리 기준 상대 경로 파일들을 (있으면) 삭제하고 report.removed에 기록"""
+    for name in names:
+        path = os.path.join(output_dir, name)
+        if os.path.isfile(path):
+            os.remove(path)
+            report.removed.append(name)
+
+
+def _prune_pages(output_dir: str, keys: List[str], manifest: Dict[str, Any], report: ExportReport):
+    """
+    이번에 내보내지 않는 화면 키의 매니페스트 항목, .build/ 원본 HTML, 페이지(와 압축본) 삭제
+
+    키는 매니페스트와 .build/ 파일 이름에서 모으므로 매니페스트가 없어진 경우에도 남은 파일이 정리됩니다.
+    """
+    raw_dir = os.path.join(output_dir, RAW_DIR)
+    known = set(manifest["pages"])
+    known.update(os.path.splitext(filename)[0] for filename in os.listdir(raw_dir) if filename.endswith(".html"))
+    for key in sorted(known - set(keys)):
+        manifest["pages"].pop(key, None)
+        page = f"{key}.html"
+        _remove_files(output_dir, [f"{RAW_DIR}/{page}", page] + [page + suffix for suffix in COMPRESSED_SUFFIXES], report)
+
+
+def export_site(
+    output_dir: str,
+    keys: Optional[Iterable[str]] = None,
+    max_workers: Optional[int] = None,
+    full: bool = False,
+    minify: bool = False,
+) -> ExportReport:
+    """
+    모든 화면을 Python 없이 서빙할 수 있는 정적 사이트로 내보내기 (증분 빌드)
+
+    화면마다 템플릿 해시와 데이터 해시를 매니페스트(build-manifest.json)에 기록해 두고,
+    다시 내보낼 때는 해시가 바뀐 화면만 ProcessPoolExecutor에서 렌더링합니다(작업 프로세스마다
+    MarketDataProvider를 한 번 생성). 나머지 화면은 .build/에 보관한 원본 HTML을 재사용합니다.
+    공유 JS/CSS 분리는 매번 전체 페이지를 대상으로 수행하되, 내용이 바뀐 파일만 다시 쓰고 압축합니다.
+    결과 디렉터리는 index.html, <화면 키>.html, assets/와 각 파일의 .gz/.br로 구성되며,
+    keys에 없는 화면의 페이지/원본 HTML/매니페스트 항목과 쓰이지 않는 해시 자산은 삭제됩니다.
+
+    Args:
+        output_dir: 출력 디렉터리 (없으면 생성)
+        keys: 내보낼 화면 키 목록 (None이면 EXHIBIT_SPECS 전체)
+        max_workers: 프로세스 수 (None이면 CPU 수)
+        full: True이면 매니페스트를 무시하고 모든 화면을 다시 렌더링
+        minify: True이면 공유 자산 분리 전에 html_minify로 페이지를 최소화 (.build/ 원본은 최소화하지 않음)
+
+    Returns:
+        ExportReport: 렌더링/건너뛴 화면, 생성한 파일과 소요 시간
+    """
+    start = time.perf_counter()
+    if brotli is None:
+        logger.warning("brotli 패키지가 없어 .br 사전 압축 파일을 만들지 않습니다 (pip install -r requirements.txt)")
+    keys = list(keys) if keys is not None else [spec.key for spec in EXHIBIT_SPECS]
+    report = ExportReport(output_dir=output_dir)
+    os.makedirs(os.path.join(output_dir, RAW_DIR), exist_ok=True)
+
+    manifest = load_manifest(output_dir)
+    inputs = page_inputs(keys)
+    raw_path = lambda key: os.path.join(output_dir, RAW_DIR, f"{key}.html")
+    stale = [
+        key for key in keys
+        if full or manifest["pages"].get(key, {}).get("inputs") != inputs[key] or not os.path.isfile(raw_path(key))
+    ]
+    report.rendered = stale
+    report.skipped = [key for key in keys if key not in stale]
+    report.inputs_ms = (time.perf_counter() - start) * 1000
+
+    executor = None
+    try:
+        pages: Dict[str, str] = {}
+        render_start = time.perf_counter()
+        if stale:
+            executor = ProcessPoolExecutor(max_workers=max_workers, initializer=_init_worker)
+            for key, page in executor.map(_render_page, stale):
+                pages[key] = page
+                _write(raw_path(key), page.encode("utf-8"))
+                manifest["pages"][key] = {
+                    "inputs": inputs[key],
+                    "html": hashlib.sha256(page.encode("utf-8")).hexdigest(),
+                }
+        report.render_ms = (time.perf_counter() - render_start) * 1000
+        for key in report.skipped:
+            with open(raw_path(key), encoding="utf-8") as f:
+                pages[key] = f.read()
+        if minify:
+            for key in keys:
+                minified = minify_html(pages[key])
+                report.minify_saved[key] = minify_stats(pages[key], minified).saved_bytes
+                pages[key] = minified
+
+        extractor = AssetExtractor({key: pages[key] for key in keys})
+        outputs = {f"{key}.html": extractor.extract(pages[key]).encode("utf-8") for key in keys}
+        outputs["index.html"] = index_page(keys).encode("utf-8")
+        outputs.update(extractor.files)
+        to_compress = []
+        for name, content in outputs.items():
+            path = os.path.join(output_dir, name)
+            changed = _write(path, content)
+            if changed:
+                report.written.append(name)
+            if _needs_compression(path, changed):
+                to_compress.append(path)
+            if name in extractor.files:
+                report.assets[name] = len(content)
+            else:
+                report.pages[name] = len(content)
+
+        # 이전 내보내기에서 남은 해시 자산(과 압축본), 더 이상 내보내지 않는 화면 정리
+        asset_dir = os.path.join(output_dir, ASSET_DIR)
+        current = {os.path.basename(name) for name in extractor.files}
+        _remove_files(output_dir, [
+            f"{ASSET_DIR}/{filename}"
+            for filename in (sorted(os.listdir(asset_dir)) if os.path.isdir(asset_dir) else [])
+            if (filename[:-3] if filename.endswith(COMPRESSED_SUFFIXES) else filename) not in current
+        ], report)
+        _prune_pages(output_dir, keys, manifest, report)
+
+        if to_compress:
+            executor = executor or ProcessPoolExecutor(max_workers=max_workers)
+            for results in executor.map(compress_file, to_compress):
+                for path, size in results:
+                    report.compressed[os.path.relpath(path, output_dir)] = size
+    finally:
+        if executor is not None:
+            executor.shutdown()
+
+    _save_manifest(output_dir, manifest)
+    report.duration_ms = (time.perf_counter() - start) * 1000
+    logger.info("정적 사이트 내보내기: %s", report.summary())
+    return report
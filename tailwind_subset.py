@@ -0,0 +1,277 @@
+import os
+import re
+import glob
+import argparse
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+OUTPUT_PATH = os.path.join(BASE_DIR, "static", "css", "tailwind-subset.css")
+TAILWIND_CDN_URL = "https://cdn.tailwindcss.com"
+
+# class="..." / className = '...' 속성 값 추출
+_CLASS_ATTR = re.compile(r"""class(?:Name)?\s*=\s*["']([^"']*)["']""")
+
+# Tailwind v3 기본 팔레트 중 템플릿에서 쓰는 색상 계열
+_PALETTE: Dict[str, Tuple[str, ...]] = {
+    #          50         100        200        300        400        500        600        700        800        900
+    "gray":   ("#f9fafb", "#f3f4f6", "#e5e7eb", "#d1d5db", "#9ca3af", "#6b7280", "#4b5563", "#374151", "#1f2937", "#111827"),
+    "red":    ("#fef2f2", "#fee2e2", "#fecaca", "#fca5a5", "#f87171", "#ef4444", "#dc2626", "#b91c1c", "#991b1b", "#7f1d1d"),
+    "orange": ("#fff7ed", "#ffedd5", "#fed7aa", "#fdba74", "#fb923c", "#f97316", "#ea580c", "#c2410c", "#9a3412", "#7c2d12"),
+    "amber":  ("#fffbeb", "#fef3c7", "#fde68a", "#fcd34d", "#fbbf24", "#f59e0b", "#d97706", "#b45309", "#92400e", "#78350f"),
+    "yellow": ("#fefce8", "#fef9c3", "#fef08a", "#fde047", "#facc15", "#eab308", "#ca8a04", "#a16207", "#854d0e", "#713f12"),
+    "green":  ("#f0fdf4", "#dcfce7", "#bbf7d0", "#86efac", "#4ade80", "#22c55e", "#16a34a", "#15803d", "#166534", "#14532d"),
+    "blue":   ("#eff6ff", "#dbeafe", "#bfdbfe", "#93c5fd", "#60a5fa", "#3b82f6", "#2563eb", "#1d4ed8", "#1e40af", "#1e3a8a"),
+    "indigo": ("#eef2ff", "#e0e7ff", "#c7d2fe", "#a5b4fc", "#818cf8", "#6366f1", "#4f46e5", "#4338ca", "#3730a3", "#312e81"),
+    "purple": ("#faf5ff", "#f3e8ff", "#e9d5ff", "#d8b4fe", "#c084fc", "#a855f7", "#9333ea", "#7e22ce", "#6b21a8", "#581c87"),
+}
+_SHADES = ("50", "100", "200", "300", "400", "500", "600", "700", "800", "900")
+
+_FONT_SIZES = {
+    "xs": ("0.75rem", "1rem"), "sm": ("0.875rem", "1.25rem"), "base": ("1rem", "1.5rem"),
+    "lg": ("1.125rem", "1.75rem"), "xl": ("1.25rem", "1.75rem"), "2xl": ("1.5rem", "2rem"),
+    "3xl": ("1.875rem", "2.25rem"), "4xl": ("2.25rem", "2.5rem"),
+}
+_FONT_WEIGHTS = {"normal": "400", "medium": "500", "semibold": "600", "bold": "700"}
+_RADII = {"": "0.25rem", "md": "0.375rem", "lg": "0.5rem", "xl": "0.75rem", "full": "9999px"}
+_SHADOWS = {
+    "": "0 1px 3px 0 rgb(0 0 0 / 0.1), 0 1px 2px -1px rgb(0 0 0 / 0.1)",
+    "md": "0 4px 6px -1px rgb(0 0 0 / 0.1), 0 2px 4px -2px rgb(0 0 0 / 0.1)",
+    "lg": "0 10px 15px -3px rgb(0 0 0 / 0.1), 0 4px 6px -4px rgb(0 0 0 / 0.1)",
+    "xl": "0 20px 25px -5px rgb(0 0 0 / 0.1), 0 8px 10px -6px rgb(0 0 0 / 0.1)",
+}
+_GRADIENT_DIRECTIONS = {"r": "to right", "l": "to left", "b": "to bottom", "t": "to top", "br": "to bottom right", "bl": "to bottom left"}
+_MAX_WIDTHS = {"md": "28rem", "lg": "32rem", "xl": "36rem", "2xl": "42rem", "4xl": "56rem", "6xl": "72rem", "7xl": "80rem"}
+_SPACING_PROPERTIES = {
+    "m": ("margin",), "mt": ("margin-top",), "mb": ("margin-bottom",), "ml": ("margin-left",), "mr": ("margin-right",),
+    "mx": ("margin-left", "margin-right"), "my": ("margin-top", "margin-bottom"),
+    "p": ("padding",), "pt": ("padding-top",), "pb": ("padding-bottom",), "pl": ("padding-left",), "pr": ("padding-right",),
+    "px": ("padding-left", "padding-right"), "py": ("padding-top", "padding-bottom"),
+    "w": ("width",), "h": ("height",), "gap": ("gap",),
+    "top": ("top",), "bottom": ("bottom",), "left": ("left",), "right": ("right",),
+}
+_STATIC_RULES = {
+    "flex": "display: flex", "grid": "display: grid", "block": "display: block", "hidden": "display: none",
+    "inline-block": "display: inline-block", "flex-col": "flex-direction: column", "flex-row": "flex-direction: row",
+    "flex-1": "flex: 1 1 0%", "flex-shrink-0": "flex-shrink: 0", "flex-wrap": "flex-wrap: wrap",
+    "items-center": "align-items: center", "items-start": "align-items: flex-start", "items-end": "align-items: flex-end",
+    "justify-center": "justify-content: center", "justify-between": "justify-content: space-between",
+    "absolute": "position: absolute", "relative": "position: relative",
+    "overflow-hidden": "overflow: hidden", "list-disc": "list-style-type: disc",
+    "text-center": "text-align: center", "text-left": "text-align: left", "text-right": "text-align: right",
+    "text-white": "color: #ffffff", "bg-white": "background-color: rgb(255 255 255 / var(--tw-bg-opacity, 1))",
+    "font-mono": 'font-family: ui-monospace, SFMono-Regular, Menlo, Monaco, Consolas, "Liberation Mono", "Courier New", monospace',
+    "mx-auto": "margin-left: auto; margin-right: auto", "w-full": "width: 100%", "h-full": "height: 100%",
+    "transition-shadow": "transition-property: box-shadow; transition-timing-function: cubic-bezier(0.4, 0, 0.2, 1); transition-duration: 150ms",
+    "border": "border-width: 1px",
+}
+
+# Tailwind preflight(기본 스타일 초기화) 중 템플릿 레이아웃에 영향을 주는 부분
+PREFLIGHT = """*,::before,::after{box-sizing:border-box;border-width:0;border-style:solid;border-color:#e5e7eb}
+html{line-height:1.5;-webkit-text-size-adjust:100%;tab-size:4;font-family:ui-sans-serif,system-ui,sans-serif,"Apple Color Emoji","Segoe UI Emoji","Segoe UI Symbol","Noto Color Emoji"}
+body{margin:0;line-height:inherit}
+h1,h2,h3,h4,h5,h6{font-size:inherit;font-weight:inherit}
+a{color:inherit;text-decoration:inherit}
+b,strong{font-weight:bolder}
+table{text-indent:0;border-color:inherit;border-collapse:collapse}
+button,input,select,textarea{font-family:inherit;font-size:100%;font-weight:inherit;line-height:inherit;color:inherit;margin:0;padding:0}
+blockquote,dl,dd,h1,h2,h3,h4,h5,h6,hr,figure,p,pre{margin:0}
+ol,ul,menu{list-style:none;margin:0;padding:0}
+img,svg,video,canvas,audio,iframe,embed,object{display:block;vertical-align:middle}
+img,video{max-width:100%;height:auto}
+[hidden]{display:none}"""
+
+_VARIANTS = {"md": "@media (min-width: 768px)", "lg": "@media (min-width: 1024px)", "sm": "@media (min-width: 640px)"}
+
+
+def _spacing(value: str) -> Optional[str]:
+    """Tailwind 간격 스케일 값(예: '4', '0.5')을 rem으로 변환"""
+    if value == "0":
+        return "0px"
+    if value == "px":
+        return "1px"
+    try:
+        number = float(value)
+    except ValueError:
+        return None
+    return f"{number * 0.25:g}rem"
+
+
+def _hex_to_rgb(color: str) -> str:
+    return " ".join(str(int(color[i:i + 2], 16)) for i in (1, 3, 5))
+
+
+def _color(name: str) -> Optional[str]:
+    """'blue-500' 형태의 색상 이름을 hex 값으로 변환"""
+    hue, _, shade = name.rpartition("-")
+    if hue in _PALETTE and shade in _SHADES:
+        return _PALETTE[hue][_SHADES.index(shade)]
+    return None
+
+
+def utility_declarations(name: str) -> Optional[Tuple[str, str]]:
+    """
+    유틸리티 클래스 하나를 (선택자 접미사, CSS 선언) 으로 변환
+
+    Returns:
+        Optional[Tuple[str, str]]: 지원하지 않는 클래스면 None
+            선택자 접미사는 space-x/y 처럼 자식 선택자가 필요한 경우에만 사용됨
+    """
+    if name in _STATIC_RULES:
+        return "", _STATIC_RULES[name]
+
+    negative = name.startswith("-")
+    base = name[1:] if negative else name
+    prefix, _, value = base.partition("-")
+
+    # 간격/크기/위치 (m, p, w, h, gap, top, left ...)
+    if prefix in _SPACING_PROPERTIES and value:
+        size = _spacing(value)
+        if size is not None:
+            if negative:
+                size = "0px" if size == "0px" else f"-{size}"
+            return "", "; ".join(f"{prop}: {size}" for prop in _SPACING_PROPERTIES[prefix])
+    if negative:
+        return None
+
+    if prefix == "space" and value[:2] in ("x-", "y-"):
+        size = _spacing(value[2:])
+        if size is not None:
+            prop = "margin-left" if value[0] == "x" else "margin-top"
+            return " > :not([hidden]) ~ :not([hidden])", f"{prop}: {size}"
+    if prefix == "grid" and value.startswith("cols-"):
+        return "", f"grid-template-columns: repeat({value[5:]}, minmax(0, 1fr))"
+    if prefix == "max" and value.startswith("w-") and value[2:] in _MAX_WIDTHS:
+        return "", f"max-width: {_MAX_WIDTHS[value[2:]]}"
+    if prefix == "text":
+        if value in _FONT_SIZES:
+            size, line_height = _FONT_SIZES[value]
+            return "", f"font-size: {size}; line-height: {line_height}"
+        color = _color(value)
+        if color:
+            return "", f"color: {color}"
+    if prefix == "font" and value in _FONT_WEIGHTS:
+        return "", f"font-weight: {_FONT_WEIGHTS[value]}"
+    if prefix == "bg":
+        color = _color(value)
+        if color:
+            return "", f"background-color: rgb({_hex_to_rgb(color)} / var(--tw-bg-opacity, 1))"
+        if value.startswith("opacity-"):
+            return "", f"--tw-bg-opacity: {int(value[8:]) / 100:g}"
+        if value.startswith("gradient-to-") and value[12:] in _GRADIENT_DIRECTIONS:
+            return "", f"background-image: linear-gradient({_GRADIENT_DIRECTIONS[value[12:]]}, var(--tw-gradient-stops))"
+    if prefix == "from":
+        color = _color(value)
+        if color:
+            return "", (f"--tw-gradient-from: {color}; --tw-gradient-to: rgb({_hex_to_rgb(color)} / 0); "
+                        "--tw-gradient-stops: var(--tw-gradient-from), var(--tw-gradient-to)")
+    if prefix == "to":
+        color = _color(value)
+        if color:
+            return "", f"--tw-gradient-to: {color}"
+    if prefix == "rounded" or base == "rounded":
+        if value in _RADII:
+            return "", f"border-radius: {_RADII[value]}"
+    if prefix == "shadow" or base == "shadow":
+        if value in _SHADOWS:
+            return "", f"box-shadow: {_SHADOWS[value]}"
+    if prefix == "border":
+        side, _, width = value.partition("-")
+        sides = {"l": "left", "r": "right", "t": "top", "b": "bottom"}
+        if side in sides and (width.isdigit() or not width):
+            return "", f"border-{sides[side]}-width: {width or 1}px"
+        if value.isdigit():
+            return "", f"border-width: {value}px"
+        color = _color(value)
+        if color:
+            return "", f"border-color: {color}"
+    return None
+
+
+def _escape(name: str) -> str:
+    """CSS 선택자용 클래스 이름 이스케이프 (md:flex-row, mt-0.5 등)"""
+    return re.sub(r"([:.\/])", r"\\\1", name)
+
+
+def collect_classes(paths: Iterable[str]) -> Set[str]:
+    """소스 파일의 class/className 속성에서 클래스 이름 수집"""
+    classes: Set[str] = set()
+    for path in paths:
+        with open(path, encoding="utf-8") as f:
+            source = f.read()
+        for match in _CLASS_ATTR.finditer(source):
+            classes.update(token for token in match.group(1).split() if "{" not in token and "}" not in token)
+    return classes
+
+
+def tailwind_sources() -> List[str]:
+    """Tailwind CDN을 사용하는 생성기 모듈 목록"""
+    paths = []
+    for path in sorted(glob.glob(os.path.join(BASE_DIR, "*.py"))):
+        if os.path.abspath(path) == os.path.abspath(__file__):
+            continue
+        with open(path, encoding="utf-8") as f:
+            if TAILWIND_CDN_URL in f.read():
+                paths.append(path)
+    return paths
+
+
+def build_css(classes: Iterable[str]) -> Tuple[str, List[str]]:
+    """
+    사용된 클래스에 해당하는 CSS 생성
+
+    Returns:
+        Tuple[str, List[str]]: (CSS 문자열, Tailwind 유틸리티가 아닌 클래스 목록)
+    """
+    base_rules: List[str] = []
+    variant_rules: Dict[str, List[str]] = {}
+    unknown: List[str] = []
+    for name in sorted(classes):
+        variant, _, utility = name.rpartition(":")
+        result = utility_declarations(utility)
+        if result is None or (variant and variant not in _VARIANTS and variant != "hover"):
+            unknown.append(name)
+            continue
+        suffix, declarations = result
+        selector = "." + _escape(name)
+        if variant == "hover":
+            selector += ":hover"
+        rule = f"{selector}{suffix}{{{declarations}}}"
+        if variant in _VARIANTS:
+            variant_rules.setdefault(variant, []).append(rule)
+        else:
+            base_rules.append(rule)
+
+    parts = [PREFLIGHT] + base_rules
+    for variant in ("sm", "md", "lg"):
+        if variant in variant_rules:
+            parts.append(f"{_VARIANTS[variant]}{{" + "".join(variant_rules[variant]) + "}")
+    return "\n".join(parts) + "\n", unknown
+
+
+def build(output_path: str = OUTPUT_PATH) -> List[str]:
+    """
+    템플릿을 스캔하여 Tailwind 부분집합 스타일시트를 생성
+
+    Returns:
+        List[str]: Tailwind 유틸리티로 해석되지 않은 클래스 (템플릿 자체 CSS 클래스 등)
+    """
+    css, unknown = build_css(collect_classes(tailwind_sources()))
+    os.makedirs(os.path.dirname(output_path), exist_ok=True)
+    with open(output_path, "w", encoding="utf-8") as f:
+        f.write("/* tailwind_subset.py 로 생성된 파일 - 직접 수정하지 마세요 */\n" + css)
+    return unknown
+
+
+def main():
+    parser = argparse.ArgumentParser(description="생성기 템플릿에서 사용하는 Tailwind 클래스만 담은 CSS 생성")
+    parser.add_argument("--output", default=OUTPUT_PATH, help="생성할 CSS 파일 경로")
+    args = parser.parse_args()
+
+    unknown = build(args.output)
+    print(f"생성 완료: {args.output} ({os.path.getsize(args.output)} 바이트)")
+    if unknown:
+        print("Tailwind 유틸리티가 아닌 클래스 (템플릿 자체 CSS로 처리):", ", ".join(unknown))
+
+
+if __name__ == "__main__":
+    main()
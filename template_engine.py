@@ -0,0 +1,137 @@
+import re
+import json
+from dataclasses import dataclass
+from typing import Any, Dict, FrozenSet, Iterable, List, Mapping, Optional, Sequence
+
+import instrumentation
+
+# 기본 플레이스홀더 형식: TREASURYYIELDSDATA_PLACEHOLDER
+DEFAULT_PLACEHOLDER_PATTERN = r"\b[A-Z][A-Z0-9_]*_PLACEHOLDER\b"
+
+
+@dataclass(frozen=True)
+class PlaceholderIssue:
+    """플레이스홀더 관련 문제 한 건"""
+    kind: str          # "missing" (값이 없음), "unknown" (템플릿에 없는 값), "serialization" (JSON 변환 실패)
+    placeholder: str
+    detail: str = ""
+
+
+class TemplateRenderError(ValueError):
+    """템플릿 렌더링 실패 - 문제 목록을 issues 속성으로 제공"""
+
+    def __init__(self, issues: List[PlaceholderIssue]):
+        self.issues = list(issues)
+        summary = ", ".join(f"{issue.kind}:{issue.placeholder}" for issue in self.issues)
+        super().__init__(f"템플릿 렌더링 오류 ({summary})")
+
+
+class CompiledTemplate:
+    """
+    플레이스홀더 위치를 한 번만 토큰화해 두고 단일 join으로 렌더링하는 템플릿
+
+    str.replace를 키마다 반복하면 템플릿 전체를 키 개수만큼 다시 검색/복사하지만,
+    이 클래스는 생성 시점(모듈 임포트 시점)에 리터럴 조각과 플레이스홀더를
+    분리해 두므로 렌더링 비용이 출력 크기에 비례합니다.
+    """
+
+    def __init__(self, source: str, pattern: str = DEFAULT_PLACEHOLDER_PATTERN):
+        """
+        Args:
+            source: 원본 HTML 템플릿
+            pattern: 플레이스홀더를 찾는 정규식
+        """
+        self.source = source
+        self._literals: List[str] = []
+        self._tokens: List[str] = []
+        position = 0
+        for match in re.finditer(pattern, source):
+            self._literals.append(source[position:match.start()])
+            self._tokens.append(match.group(0))
+            position = match.end()
+        self._literals.append(source[position:])
+        self.placeholders: FrozenSet[str] = frozenset(self._tokens)
+
+    def check(self, provided: Iterable[str]) -> List[PlaceholderIssue]:
+        """제공될 플레이스홀더 이름과 템플릿을 비교하여 누락/미사용 항목 반환"""
+        provided = set(provided)
+        issues = [PlaceholderIssue("missing", name) for name in sorted(self.placeholders - provided)]
+        issues += [PlaceholderIssue("unknown", name) for name in sorted(provided - self.placeholders)]
+        return issues
+
+    def render(self, values: Mapping[str, str]) -> str:
+        """
+        플레이스홀더를 값으로 치환한 HTML 반환
+
+        Args:
+            values: 플레이스홀더 -> 삽입할 문자열 (템플릿에 없는 키는 무시)
+
+        Raises:
+            TemplateRenderError: 템플릿의 플레이스홀더에 대응하는 값이 없을 때
+        """
+        missing = self.placeholders.difference(values)
+        if missing:
+            raise TemplateRenderError([PlaceholderIssue("missing", name) for name in sorted(missing)])
+        parts = [self._literals[0]]
+        for token, literal in zip(self._tokens, self._literals[1:]):
+            parts.append(values[token])
+            parts.append(literal)
+        return "".join(parts)
+
+    def render_json(self, data: Mapping[str, Any], allow_unknown: bool = False, columnar: bool = False, **dumps_kwargs) -> str:
+        """
+        데이터를 JSON으로 직렬화하여 렌더링 - 템플릿에 있는 플레이스홀더만 직렬화
+
+        Args:
+            data: 플레이스홀더 -> JSON으로 변환할 값
+            allow_unknown: True이면 템플릿에 없는 키를 오류 없이 건너뜀
+            columnar: True이면 행(dict) 목록 값을 열 형식({필드: [값...]})으로 변환
+                      (템플릿 JS가 data.year, data.dso처럼 배열을 바로 사용해야 함)
+            **dumps_kwargs: json.dumps에 전달할 옵션 (예: ensure_ascii=False)
+
+        Raises:
+            TemplateRenderError: 누락/미사용 플레이스홀더 또는 직렬화 실패가 있을 때
+        """
+        all_issues = self.check(data)
+        issues = [issue for issue in all_issues if issue.kind == "missing" or not allow_unknown]
+        values: Dict[str, str] = {}
+        for name in self.placeholders.intersection(data):
+            try:
+                value = to_columnar(data[name]) if columnar and is_records(data[name]) else data[name]
+                values[name] = json.dumps(value, **dumps_kwargs)
+            except (TypeError, ValueError) as e:
+                issues.append(PlaceholderIssue("serialization", name, str(e)))
+        instrumentation.record(placeholder_hits=len(values), placeholder_misses=len(all_issues))
+        if issues:
+            raise TemplateRenderError(issues)
+        return self.render(values)
+
+
+def is_records(value: Any) -> bool:
+    """값이 비어 있지 않은 행(dict) 목록인지 여부"""
+    return isinstance(value, (list, tuple)) and bool(value) and all(isinstance(row, Mapping) for row in value)
+
+
+def to_columnar(records: Sequence[Mapping[str, Any]], fields: Optional[Sequence[str]] = None) -> Dict[str, List[Any]]:
+    """
+    행(dict) 목록을 열 형식 페이로드로 변환
+
+    [{"year": "2012", "dso": 58}, ...] -> {"year": ["2012", ...], "dso": [58, ...]}
+    키 문자열이 행마다 반복되지 않아 HTML이 작아지고, 차트는 data.map(d => d.dso) 대신
+    data.dso 배열을 바로 사용합니다. 첫 필드(보통 연도/시나리오)가 모든 계열이 공유하는 라벨 배열입니다.
+
+    Args:
+        records: 행 목록
+        fields: 포함할 필드 (None이면 모든 행의 필드를 처음 나온 순서대로, 없는 칸은 null)
+
+    Returns:
+        Dict[str, List[Any]]: 필드 -> 값 배열
+    """
+    if fields is None:
+        fields = list(dict.fromkeys(field for row in records for field in row))
+    return {field: [row.get(field) for row in records] for field in fields}
+
+
+def placeholder_values(data: Mapping[str, Any]) -> Dict[str, Any]:
+    """데이터 키를 기본 플레이스홀더 이름(KEY_PLACEHOLDER)으로 매핑한 딕셔너리 반환"""
+    return {f"{key.upper()}_PLACEHOLDER": value for key, value in data.items()}
@@ -0,0 +1,113 @@
+import time
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from assets import localize_html
+from html_minify import minify_html
+from exhibit_registry import EXHIBIT_SPECS, SPECS_BY_KEY, import_module, load_generator_class
+
+logger = logging.getLogger("png_scf.startup")
+
+# 생성기 대부분은 JSON 직렬화/문자열 조합이라 GIL 때문에 스레드를 많이 늘려도 이득이 작음
+DEFAULT_MAX_WORKERS = 4
+
+
+@dataclass
+class WarmupReport:
+    """서버 시작 시 사전 렌더링 결과 (백그라운드 스레드가 채우는 동안에도 읽을 수 있음)"""
+    started_at: float = field(default_factory=time.time)
+    duration_ms: Optional[float] = None                       # 전체 워밍업 소요 시간 (끝나기 전에는 None)
+    render_ms: Dict[str, float] = field(default_factory=dict) # 화면 키 -> 렌더링 시간 (임포트 포함)
+    errors: Dict[str, str] = field(default_factory=dict)      # 화면 키 -> 오류 메시지
+    done: threading.Event = field(default_factory=threading.Event)
+
+    def rows(self) -> List[Tuple[str, float]]:
+        """(화면 라벨, 밀리초) 목록 - 오래 걸린 순서"""
+        items = [(SPECS_BY_KEY[key].label, ms) for key, ms in list(self.render_ms.items())]
+        return sorted(items, key=lambda item: item[1], reverse=True)
+
+
+def default_generator_factory() -> Callable[[str], Any]:
+    """
+    Streamlit 런타임 없이 생성기를 만드는 팩토리 반환
+
+    생성된 HTML은 html_cache(프로세스 전역)에 생성기 클래스와 입력 데이터 해시를 키로
+    저장되므로, 여기서 만든 생성기 인스턴스로 렌더링해도 앱의 생성기가 그대로 캐시를 적중합니다.
+    """
+    data_provider = import_module("data_provider").MarketDataProvider()
+
+    def create(key: str) -> Any:
+        generator_class = load_generator_class(key)
+        if SPECS_BY_KEY[key].uses_data_provider:
+            return generator_class(data_provider)
+        return generator_class()
+    return create
+
+
+def _render_one(key: str, create_generator: Callable[[str], Any], minify: bool = False) -> float:
+    start = time.perf_counter()
+    html = create_generator(key).generate_html()
+    # iframe에 넣기 전 최소화/자산 경로 변환 결과도 함께 캐시해 둠
+    localize_html(minify_html(html) if minify else html)
+    return (time.perf_counter() - start) * 1000
+
+
+def prerender_exhibits(
+    keys: Optional[Iterable[str]] = None,
+    create_generator: Optional[Callable[[str], Any]] = None,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    report: Optional[WarmupReport] = None,
+    minify: bool = False,
+) -> WarmupReport:
+    """
+    모든 화면의 HTML을 스레드 풀에서 미리 렌더링하여 프로세스 전역 캐시를 채움
+
+    Args:
+        keys: 렌더링할 화면 키 목록 (None이면 EXHIBIT_SPECS 전체)
+        create_generator: 화면 키 -> 생성기 인스턴스 (None이면 default_generator_factory())
+        max_workers: 스레드 풀 크기
+        report: 결과를 기록할 보고서 (None이면 새로 생성)
+        minify: True이면 html_minify 결과도 캐시 (앱의 MINIFY_HTML과 맞춤)
+
+    Returns:
+        WarmupReport: 전체/화면별 소요 시간과 오류 - 개별 화면 실패는 다른 화면에 영향을 주지 않음
+    """
+    report = report or WarmupReport()
+    keys = list(keys) if keys is not None else [spec.key for spec in EXHIBIT_SPECS]
+    start = time.perf_counter()
+    try:
+        create_generator = create_generator or default_generator_factory()
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="warmup") as executor:
+            futures = {key: executor.submit(_render_one, key, create_generator, minify) for key in keys}
+            for key, future in futures.items():
+                try:
+                    report.render_ms[key] = future.result()
+                except Exception as e:
+                    report.errors[key] = str(e)
+                    logger.warning("%s 사전 렌더링 실패: %s", key, e)
+    except Exception as e:
+        report.errors["*"] = str(e)
+        logger.warning("사전 렌더링 실패: %s", e)
+    finally:
+        report.duration_ms = (time.perf_counter() - start) * 1000
+        report.done.set()
+    logger.info("사전 렌더링 완료: %d개 화면, %.1f ms", len(report.render_ms), report.duration_ms)
+    return report
+
+
+def start_background_warmup(**kwargs) -> WarmupReport:
+    """
+    사전 렌더링을 데몬 스레드에서 시작하고 즉시 보고서 반환 (페이지 로딩을 막지 않음)
+
+    Args:
+        **kwargs: prerender_exhibits에 전달할 인자
+    """
+    report = WarmupReport()
+    thread = threading.Thread(
+        target=prerender_exhibits, kwargs=dict(kwargs, report=report), name="exhibit-warmup", daemon=True
+    )
+    thread.start()
+    return report